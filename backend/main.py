@@ -1,10 +1,11 @@
-﻿from fastapi import FastAPI, Request
+﻿from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 import uuid
 from src.configs.config import load_settings
 from src.container import Container
-from src.presentation.api.routes import client_routes, chat_routes, message_routes, widget_routes, auth_routes
+from src.presentation.api.routes import client_routes, chat_routes, message_routes, widget_routes, auth_routes, snapshot_routes
 from src.infrastructure.database.config import session_id_var, SessionLocal
+from src.presentation.api.dependencies import get_current_user
 
 app = FastAPI(
     title="Web Scraper Chat Agent", 
@@ -44,6 +45,7 @@ app.include_router(client_routes.router)
 app.include_router(chat_routes.router)
 app.include_router(message_routes.router)
 app.include_router(widget_routes.router)
+app.include_router(snapshot_routes.router)
 
 
 @app.get("/")
@@ -51,6 +53,52 @@ async def root():
 	return {"message": "Chat Agent System Ready"}
 
 
+# Metrics are keyed by tenant (company name), so they are for signed-in users only
+@app.get("/metrics/retrieval-cache")
+async def retrieval_cache_metrics(current_user: dict = Depends(get_current_user)):
+	return container.retrieval_cache().stats()
+
+
+@app.get("/metrics/reranker")
+async def reranker_metrics(current_user: dict = Depends(get_current_user)):
+	return container.reranker().stats()
+
+
+@app.get("/metrics/answer-cache")
+async def answer_cache_metrics(current_user: dict = Depends(get_current_user)):
+	return container.answer_cache().stats()
+
+
+@app.get("/metrics/prompt-cache")
+async def prompt_cache_metrics(current_user: dict = Depends(get_current_user)):
+	return container.prompt_builder().stats()
+
+
+@app.get("/metrics/prompt-budget")
+async def prompt_budget_metrics(current_user: dict = Depends(get_current_user)):
+	return container.token_budget().stats()
+
+
+@app.get("/metrics/llm-client")
+async def llm_client_metrics(current_user: dict = Depends(get_current_user)):
+	return container.llm_client().stats()
+
+
+@app.get("/metrics/model-routing")
+async def model_routing_metrics(current_user: dict = Depends(get_current_user)):
+	return container.model_router().stats()
+
+
+@app.get("/metrics/coalescing")
+async def coalescing_metrics(current_user: dict = Depends(get_current_user)):
+	return container.stream_coalescer().stats()
+
+
+@app.on_event("shutdown")
+async def close_llm_client():
+	await container.llm_client().aclose()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
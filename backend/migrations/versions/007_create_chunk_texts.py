@@ -0,0 +1,33 @@
+"""create chunk_texts table
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Content-addressed chunk texts for Qdrant payloads that omit the text
+    op.create_table(
+        'chunk_texts',
+        sa.Column('text_hash', sa.String(64), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.PrimaryKeyConstraint('text_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('chunk_texts')
@@ -0,0 +1,28 @@
+"""add_summary_to_chats
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chats', sa.Column('summary', sa.Text(), nullable=True))
+    op.add_column('chats', sa.Column('summarized_messages', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    op.drop_column('chats', 'summarized_messages')
+    op.drop_column('chats', 'summary')
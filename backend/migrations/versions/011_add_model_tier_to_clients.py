@@ -0,0 +1,26 @@
+"""add_model_tier_to_clients
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('clients', sa.Column('model_tier', sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('clients', 'model_tier')
@@ -0,0 +1,7 @@
+"""Request DTO for importing a tenant snapshot"""
+from pydantic import BaseModel
+
+
+class ImportSnapshotRequest(BaseModel):
+    """Request model for restoring a client's index from a snapshot file"""
+    filename: str
@@ -1,7 +1,33 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Dict, Literal
+
+# Smallest per-tenant prompt budget: the system prefix plus a few hundred
+# tokens of context and history. Below it every prompt would be trimmed bare.
+MIN_PROMPT_TOKEN_BUDGET = 1000
+# Room left for context, history and the question beyond the system prompt
+MIN_PROMPT_TOKEN_HEADROOM = 500
 
 
 class UpdateClientRequest(BaseModel):
     tools: Optional[List[Dict]] = None
     system_prompt: Optional[str] = None
+    rerank_enabled: Optional[bool] = None
+    # 0 clears the override and falls back to the default budget
+    prompt_token_budget: Optional[int] = Field(None, ge=0)
+    model_tier: Optional[Literal["auto", "fast", "standard", "heavy"]] = None
+
+    @field_validator("prompt_token_budget")
+    @classmethod
+    def _budget_minimum(cls, value: Optional[int]) -> Optional[int]:
+        if value and value < MIN_PROMPT_TOKEN_BUDGET:
+            raise ValueError(f"prompt_token_budget must be 0 or at least {MIN_PROMPT_TOKEN_BUDGET}")
+        return value
+
+    @model_validator(mode="after")
+    def _budget_fits_system_prompt(self) -> "UpdateClientRequest":
+        if self.prompt_token_budget and self.system_prompt:
+            # Four characters per token, the same estimate the budget manager falls back to
+            needed = (len(self.system_prompt) + 3) // 4 + MIN_PROMPT_TOKEN_HEADROOM
+            if self.prompt_token_budget < needed:
+                raise ValueError(f"prompt_token_budget must be at least {needed} for this system prompt")
+        return self
@@ -11,4 +11,7 @@ class ClientResponse(BaseModel):
     api_key: Optional[str] = None
     tools: Optional[List[dict]] = None
     system_prompt: Optional[str] = None
+    rerank_enabled: bool = False
+    prompt_token_budget: Optional[int] = None
+    model_tier: Optional[str] = None
     created_at: Optional[datetime] = None
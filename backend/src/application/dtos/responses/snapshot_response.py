@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class SnapshotResponse(BaseModel):
+    filename: str
+    tenant: str
+    count: int
+    vector_size: int
+    distance: str
+    sparse: bool
+    created_at: Optional[str] = None
@@ -0,0 +1,78 @@
+import asyncio
+import json
+from typing import Optional
+from src.domain.entities.chat import Chat
+from src.domain.abstractions.repositories.chat_repository import IChatRepository
+from src.domain.abstractions.services.chat_title_service import IChatTitleService
+from src.domain.abstractions.services.background_task_runner import IBackgroundTaskRunner
+
+
+class ChatTitleTask:
+    """
+    Generates a new chat's title alongside the answer instead of after it.
+
+    The LLM title is requested as soon as the first message arrives. If it
+    is ready while the answer streams, `poll` stores it and returns the
+    `title_updated` event. If the answer finishes first, `finish` stores a
+    heuristic title right away and a background task replaces it with the
+    LLM title once that arrives.
+    """
+    
+    def __init__(
+        self,
+        chat: Chat,
+        first_message: str,
+        chat_repository: IChatRepository,
+        chat_title_service: IChatTitleService,
+        background_tasks: Optional[IBackgroundTaskRunner] = None
+    ):
+        self.chat = chat
+        self.first_message = first_message
+        self.chat_repository = chat_repository
+        self.chat_title_service = chat_title_service
+        self.background_tasks = background_tasks
+        self.sent = False
+        self.task = asyncio.create_task(chat_title_service.generate_title(first_message))
+
+    def _result(self) -> Optional[str]:
+        if self.task.cancelled() or self.task.exception() is not None:
+            return None
+        return self.task.result() or None
+
+    def _store(self, title: str) -> str:
+        self.chat.title = title
+        self.chat_repository.update(self.chat)
+        self.sent = True
+        return json.dumps({"type": "title_updated", "title": title})
+
+    def poll(self) -> Optional[str]:
+        """The title_updated event if the LLM title arrived since the last poll"""
+        if self.sent or not self.task.done():
+            return None
+        return self._store(self._result() or self.chat_title_service.fallback_title(self.first_message))
+
+    def finish(self) -> Optional[str]:
+        """Settle the title without waiting on the LLM; returns the event to send, if any"""
+        if self.sent:
+            return None
+        if self.task.done():
+            return self.poll()
+        
+        event = self._store(self.chat_title_service.fallback_title(self.first_message))
+        if self.background_tasks:
+            chat_id = self.chat.chat_id
+            self.background_tasks.spawn(lambda: self._store_later(chat_id), key=f"chat-title:{chat_id}")
+        else:
+            self.task.cancel()
+        return event
+
+    async def _store_later(self, chat_id: str) -> None:
+        try:
+            title = await self.task
+        except Exception as e:
+            print(f"Warning: chat title generation failed for {chat_id}: {str(e)}")
+            return
+        chat = self.chat_repository.get_by_id(chat_id)
+        if title and chat is not None:
+            chat.title = title
+            self.chat_repository.update(chat)
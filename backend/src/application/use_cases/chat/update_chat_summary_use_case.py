@@ -0,0 +1,55 @@
+from src.domain.abstractions.repositories.chat_repository import IChatRepository
+from src.domain.abstractions.repositories.message_repository import IMessageRepository
+from src.domain.abstractions.services.conversation_summary_service import IConversationSummaryService
+
+
+class UpdateChatSummaryUseCase:
+    """
+    Folds a chat's older messages into its rolling summary.
+
+    The newest `keep_messages` messages stay verbatim for the prompt; once at
+    least `batch_messages` more have accumulated ahead of them, those are
+    summarized in one call, so the summary is rewritten every few turns
+    rather than on every reply.
+    """
+    
+    def __init__(
+        self,
+        chat_repository: IChatRepository,
+        message_repository: IMessageRepository,
+        summary_service: IConversationSummaryService,
+        keep_messages: int = 6,
+        batch_messages: int = 6
+    ):
+        self.chat_repository = chat_repository
+        self.message_repository = message_repository
+        self.summary_service = summary_service
+        self.keep_messages = keep_messages
+        self.batch_messages = batch_messages
+
+    async def execute(self, chat_id: str) -> bool:
+        """Update the summary if enough messages are pending; return whether it changed"""
+        chat = self.chat_repository.get_by_id(chat_id)
+        if chat is None:
+            return False
+        
+        messages = self.message_repository.get_by_chat_id(chat_id, offset=chat.summarized_messages)
+        fold = len(messages) - self.keep_messages
+        # End the folded span on an assistant reply so no turn is split
+        while fold > 0 and not messages[fold - 1].ai_generated:
+            fold -= 1
+        if fold < self.batch_messages:
+            return False
+        
+        turns = []
+        for message in messages[:fold]:
+            if message.ai_generated and turns and "assistant" not in turns[-1]:
+                turns[-1]["assistant"] = message.content
+            elif message.ai_generated:
+                turns.append({"assistant": message.content})
+            else:
+                turns.append({"user": message.content})
+        
+        summary = await self.summary_service.summarize(chat.summary, turns)
+        self.chat_repository.update_summary(chat_id, summary, chat.summarized_messages + fold)
+        return True
@@ -20,6 +20,14 @@ class UpdateClientUseCase:
             update_data["tools"] = request.tools
         if request.system_prompt is not None:
             update_data["system_prompt"] = request.system_prompt
+        if request.rerank_enabled is not None:
+            update_data["rerank_enabled"] = request.rerank_enabled
+        if request.prompt_token_budget is not None:
+            # 0 clears the override and falls back to the default budget
+            update_data["prompt_token_budget"] = request.prompt_token_budget or None
+        if request.model_tier is not None:
+            # "auto" clears the pin and lets the router decide per turn
+            update_data["model_tier"] = None if request.model_tier == "auto" else request.model_tier
             
         if not update_data:
             return ClientResponse(
@@ -30,6 +38,9 @@ class UpdateClientUseCase:
                 api_key=None,
                 tools=client.tools,
                 system_prompt=client.system_prompt,
+                rerank_enabled=client.rerank_enabled,
+                prompt_token_budget=client.prompt_token_budget,
+                model_tier=client.model_tier,
                 created_at=client.created_at
             )
 
@@ -44,5 +55,8 @@ class UpdateClientUseCase:
             api_key=None,
             tools=saved_client.tools,
             system_prompt=saved_client.system_prompt,
+            rerank_enabled=saved_client.rerank_enabled,
+            prompt_token_budget=saved_client.prompt_token_budget,
+            model_tier=saved_client.model_tier,
             created_at=saved_client.created_at
         )
@@ -3,10 +3,13 @@ from src.domain.abstractions.repositories.chat_repository import IChatRepository
 from src.domain.abstractions.repositories.client_repository import IClientRepository
 from src.domain.abstractions.services.rag_service import IRAGService
 from src.domain.abstractions.services.chat_title_service import IChatTitleService
+from src.domain.abstractions.services.background_task_runner import IBackgroundTaskRunner
+from src.application.use_cases.chat.update_chat_summary_use_case import UpdateChatSummaryUseCase
+from src.application.use_cases.chat.chat_title_task import ChatTitleTask
 from src.application.dtos.requests.send_message_request import SendMessageRequest
 from src.domain.entities.message import Message
 from src.domain.entities.chat import Chat
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 import uuid
 import json
@@ -24,13 +27,17 @@ class SendMessageUseCase:
         chat_repository: IChatRepository,
         client_repository: IClientRepository,
         rag_service: IRAGService,
-        chat_title_service: IChatTitleService
+        chat_title_service: IChatTitleService,
+        update_chat_summary_use_case: Optional[UpdateChatSummaryUseCase] = None,
+        background_tasks: Optional[IBackgroundTaskRunner] = None
     ):
         self.message_repository = message_repository
         self.chat_repository = chat_repository
         self.client_repository = client_repository
         self.rag_service = rag_service
         self.chat_title_service = chat_title_service
+        self.update_chat_summary_use_case = update_chat_summary_use_case
+        self.background_tasks = background_tasks
 
     async def execute_stream(self, request: SendMessageRequest, ip_address: str, is_follow_up: bool = False):
         """
@@ -62,9 +69,11 @@ class SendMessageUseCase:
             # Send chat metadata to frontend
             yield json.dumps({"type": "chat_created", "chat_id": chat.chat_id})
         
-        # Get chat history and create user message
-        chat_history = self.message_repository.get_chat_history(chat.chat_id, limit=20)
-        is_first_message = len(chat_history) == 0
+        # Get the turns not yet folded into the summary and create user message
+        chat_history = self.message_repository.get_chat_history(
+            chat.chat_id, limit=20, offset=chat.summarized_messages
+        )
+        is_first_message = len(chat_history) == 0 and chat.summarized_messages == 0
         
         now = datetime.now(timezone.utc)
         if not is_follow_up:
@@ -78,60 +87,79 @@ class SendMessageUseCase:
             )
             user_message = self.message_repository.create(user_message_entity)
         
-        # Stream the AI response
-        # The RAG service will yield status hints BEFORE operations
-        # Just pass them through to the frontend
-        full_response = ""
-        async for chunk in self.rag_service.query_stream(
-            question=request.message,
-            company_name=client.client_name,
-            chat_history=chat_history,
-            is_follow_up=is_follow_up
-        ):
-            # Parse the chunk to determine its type
-            try:
-                data = json.loads(chunk)
-                chunk_type = data.get("type")
+        # Title the chat concurrently with the answer rather than after it
+        title_task = ChatTitleTask(
+            chat, request.message, self.chat_repository, self.chat_title_service, self.background_tasks
+        ) if is_first_message and not is_follow_up else None
+        
+        try:
+            # Stream the AI response
+            # The RAG service will yield status hints BEFORE operations
+            # Just pass them through to the frontend
+            full_response = ""
+            async for chunk in self.rag_service.query_stream(
+                question=request.message,
+                company_name=client.client_name,
+                chat_history=chat_history,
+                is_follow_up=is_follow_up,
+                rerank=client.rerank_enabled,
+                token_budget=client.prompt_token_budget,
+                model_tier=client.model_tier,
+                conversation_summary=chat.summary
+            ):
+                # Parse the chunk to determine its type
+                try:
+                    data = json.loads(chunk)
+                    chunk_type = data.get("type")
                 
-                if chunk_type == "status_hint":
-                    # Status hint from infrastructure - pass through immediately
-                    yield chunk
+                    if chunk_type == "status_hint":
+                        # Status hint from infrastructure - pass through immediately
+                        yield chunk
                     
-                elif chunk_type == "content":
-                    # Actual content chunk - accumulate and pass through
-                    content_data = data.get("data", "")
-                    full_response += content_data
-                    yield chunk
+                    elif chunk_type == "content":
+                        # Actual content chunk - accumulate and pass through
+                        content_data = data.get("data", "")
+                        full_response += content_data
+                        yield chunk
                     
-                else:
-                    # Unknown type, pass through
-                    yield chunk
+                    else:
+                        # Unknown type, pass through
+                        yield chunk
                     
-            except json.JSONDecodeError:
-                # Not JSON, treat as plain content (backward compatibility)
-                full_response += chunk
-                yield json.dumps({"type": "content", "data": chunk})
+                except json.JSONDecodeError:
+                    # Not JSON, treat as plain content (backward compatibility)
+                    full_response += chunk
+                    yield json.dumps({"type": "content", "data": chunk})
+            
+                title_event = title_task.poll() if title_task else None
+                if title_event:
+                    yield title_event
         
-        # Generate chat title if this is the first message
-        if is_first_message:
-            try:
-                title = await self.chat_title_service.generate_title(request.message)
-                chat.title = title
-                self.chat_repository.update(chat)
-                yield json.dumps({"type": "title_updated", "title": title})
-            except Exception as e:
-                raise e
-        
-        # Save AI message
-        ai_message_entity = Message(
-            message_id=str(uuid.uuid4()),
-            chat_id=chat.chat_id,
-            content=full_response,
-            ai_generated=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        self.message_repository.create(ai_message_entity)
+            # Save AI message
+            ai_message_entity = Message(
+                message_id=str(uuid.uuid4()),
+                chat_id=chat.chat_id,
+                content=full_response,
+                ai_generated=True,
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc)
+            )
+            self.message_repository.create(ai_message_entity)
+
+            # Fold older turns into the chat summary once the reply is stored
+            if self.update_chat_summary_use_case and self.background_tasks:
+                chat_id = chat.chat_id
+                self.background_tasks.spawn(
+                    lambda: self.update_chat_summary_use_case.execute(chat_id),
+                    key=f"chat-summary:{chat_id}"
+                )
+        finally:
+            # Never wait on the title: use the heuristic one if the LLM is still busy.
+            # Settled here so a client disconnect, which closes this stream early,
+            # still stores a title and hands the pending LLM call to the background.
+            title_event = title_task.finish() if title_task else None
+        if title_event:
+            yield title_event
         
         # Send completion signal
         yield json.dumps({"type": "complete"})
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""Export tenant snapshot use case"""
+import os
+
+from src.domain.abstractions.repositories.client_repository import IClientRepository
+from src.domain.abstractions.services.tenant_snapshot_service import ITenantSnapshotService
+from src.application.dtos.responses.snapshot_response import SnapshotResponse
+
+
+class ExportTenantSnapshotUseCase:
+    """Use case for writing a client's vectors and payloads to a snapshot file"""
+
+    def __init__(self, client_repository: IClientRepository, snapshot_service: ITenantSnapshotService):
+        self.client_repository = client_repository
+        self.snapshot_service = snapshot_service
+
+    def execute(self, client_id: str) -> SnapshotResponse:
+        """
+        Export a client's collection into the snapshot directory
+
+        Raises:
+            ValueError: If client not found or has no collection
+        """
+        client = self.client_repository.get_by_id(client_id)
+        if not client:
+            raise ValueError(f"Client with ID {client_id} not found")
+
+        manifest = self.snapshot_service.export_tenant(client.client_name)
+        return SnapshotResponse(
+            filename=os.path.basename(manifest["path"]),
+            tenant=manifest["tenant"],
+            count=manifest["count"],
+            vector_size=manifest["vector_size"],
+            distance=manifest["distance"],
+            sparse=manifest["sparse"],
+            created_at=manifest["created_at"]
+        )
@@ -0,0 +1,41 @@
+"""Import tenant snapshot use case"""
+import os
+
+from src.domain.abstractions.repositories.client_repository import IClientRepository
+from src.domain.abstractions.services.tenant_snapshot_service import ITenantSnapshotService
+from src.application.dtos.requests.import_snapshot_request import ImportSnapshotRequest
+from src.application.dtos.responses.snapshot_response import SnapshotResponse
+
+
+class ImportTenantSnapshotUseCase:
+    """Use case for restoring a client's collection from a snapshot without re-crawling"""
+
+    def __init__(self, client_repository: IClientRepository, snapshot_service: ITenantSnapshotService):
+        self.client_repository = client_repository
+        self.snapshot_service = snapshot_service
+
+    def execute(self, client_id: str, request: ImportSnapshotRequest) -> SnapshotResponse:
+        """
+        Replace a client's collection with a snapshot from the snapshot directory
+
+        Raises:
+            ValueError: If client or snapshot file not found
+        """
+        client = self.client_repository.get_by_id(client_id)
+        if not client:
+            raise ValueError(f"Client with ID {client_id} not found")
+
+        path = self.snapshot_service.snapshot_path(request.filename)
+        if not os.path.exists(path):
+            raise ValueError(f"Snapshot {request.filename} not found")
+
+        manifest = self.snapshot_service.import_tenant(path, collection_name=client.client_name)
+        return SnapshotResponse(
+            filename=request.filename,
+            tenant=manifest["tenant"],
+            count=manifest["count"],
+            vector_size=manifest["vector_size"],
+            distance=manifest["distance"],
+            sparse=manifest["sparse"],
+            created_at=manifest["created_at"]
+        )
@@ -1,7 +1,7 @@
 import uuid
 import json
 from datetime import datetime, timezone
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 from src.domain.entities.message import Message
 from src.domain.abstractions.repositories.message_repository import IMessageRepository
 from src.domain.abstractions.repositories.chat_repository import IChatRepository
@@ -9,6 +9,9 @@ from src.domain.abstractions.repositories.client_repository import IClientReposi
 from src.domain.abstractions.repositories.widget_session_repository import IWidgetSessionRepository
 from src.domain.abstractions.services.rag_service import IRAGService
 from src.domain.abstractions.services.chat_title_service import IChatTitleService
+from src.domain.abstractions.services.background_task_runner import IBackgroundTaskRunner
+from src.application.use_cases.chat.update_chat_summary_use_case import UpdateChatSummaryUseCase
+from src.application.use_cases.chat.chat_title_task import ChatTitleTask
 
 
 class SendWidgetMessageUseCase:
@@ -24,7 +27,9 @@ class SendWidgetMessageUseCase:
         client_repository: IClientRepository,
         widget_session_repository: IWidgetSessionRepository,
         rag_service: IRAGService,
-        chat_title_service: IChatTitleService
+        chat_title_service: IChatTitleService,
+        update_chat_summary_use_case: Optional[UpdateChatSummaryUseCase] = None,
+        background_tasks: Optional[IBackgroundTaskRunner] = None
     ):
         self.message_repository = message_repository
         self.chat_repository = chat_repository
@@ -32,6 +37,8 @@ class SendWidgetMessageUseCase:
         self.widget_session_repository = widget_session_repository
         self.rag_service = rag_service
         self.chat_title_service = chat_title_service
+        self.update_chat_summary_use_case = update_chat_summary_use_case
+        self.background_tasks = background_tasks
 
     async def execute_stream(
         self,
@@ -67,9 +74,11 @@ class SendWidgetMessageUseCase:
         if client is None:
             raise ValueError("Client not found")
         
-        # Get chat history and save user message
-        chat_history = self.message_repository.get_chat_history(chat.chat_id, limit=20)
-        is_first_message = len(chat_history) == 0
+        # Get the turns not yet folded into the summary and save user message
+        chat_history = self.message_repository.get_chat_history(
+            chat.chat_id, limit=20, offset=chat.summarized_messages
+        )
+        is_first_message = len(chat_history) == 0 and chat.summarized_messages == 0
         
         if not is_follow_up:
             now = datetime.now(timezone.utc)
@@ -83,61 +92,80 @@ class SendWidgetMessageUseCase:
             )
             self.message_repository.create(user_message_entity)
         
-        # Stream response - infrastructure will yield status hints
-        full_response = ""
-        async for chunk in self.rag_service.query_stream(
-            question=content,
-            company_name=client.client_name,
-            chat_history=chat_history,
-            tools=client.tools,
-            auth_token=auth_token,
-            system_prompt=client.system_prompt or "",
-            is_follow_up=is_follow_up
-        ):
-            # Parse and pass through all events from infrastructure
-            try:
-                data = json.loads(chunk)
-                chunk_type = data.get("type")
+        # Title the chat concurrently with the answer rather than after it
+        title_task = ChatTitleTask(
+            chat, content, self.chat_repository, self.chat_title_service, self.background_tasks
+        ) if is_first_message and not is_follow_up else None
+        
+        try:
+            # Stream response - infrastructure will yield status hints
+            full_response = ""
+            async for chunk in self.rag_service.query_stream(
+                question=content,
+                company_name=client.client_name,
+                chat_history=chat_history,
+                tools=client.tools,
+                auth_token=auth_token,
+                system_prompt=client.system_prompt or "",
+                is_follow_up=is_follow_up,
+                rerank=client.rerank_enabled,
+                token_budget=client.prompt_token_budget,
+                model_tier=client.model_tier,
+                conversation_summary=chat.summary
+            ):
+                # Parse and pass through all events from infrastructure
+                try:
+                    data = json.loads(chunk)
+                    chunk_type = data.get("type")
                 
-                if chunk_type == "status_hint":
-                    # Status hint from infrastructure - pass through immediately
-                    yield chunk
+                    if chunk_type == "status_hint":
+                        # Status hint from infrastructure - pass through immediately
+                        yield chunk
                     
-                elif chunk_type == "content":
-                    # Actual content - accumulate and pass through
-                    content_data = data.get("data", "")
-                    full_response += content_data
-                    yield chunk
+                    elif chunk_type == "content":
+                        # Actual content - accumulate and pass through
+                        content_data = data.get("data", "")
+                        full_response += content_data
+                        yield chunk
                     
-                else:
-                    # Other events - pass through
-                    yield chunk
+                    else:
+                        # Other events - pass through
+                        yield chunk
                     
-            except json.JSONDecodeError:
-                # Backward compatibility - treat as plain content
-                full_response += chunk
-                yield json.dumps({"type": "content", "data": chunk})
+                except json.JSONDecodeError:
+                    # Backward compatibility - treat as plain content
+                    full_response += chunk
+                    yield json.dumps({"type": "content", "data": chunk})
+            
+                title_event = title_task.poll() if title_task else None
+                if title_event:
+                    yield title_event
         
-        # Generate title if first message
-        if is_first_message:
-            try:
-                title = await self.chat_title_service.generate_title(content)
-                chat.title = title
-                self.chat_repository.update(chat)
-                yield json.dumps({"type": "title_updated", "title": title})
-            except Exception as e:
-                pass
-        
-        # Save AI message
-        ai_message_entity = Message(
-            message_id=str(uuid.uuid4()),
-            chat_id=chat.chat_id,
-            content=full_response,
-            ai_generated=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        self.message_repository.create(ai_message_entity)
+            # Save AI message
+            ai_message_entity = Message(
+                message_id=str(uuid.uuid4()),
+                chat_id=chat.chat_id,
+                content=full_response,
+                ai_generated=True,
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc)
+            )
+            self.message_repository.create(ai_message_entity)
+
+            # Fold older turns into the chat summary once the reply is stored
+            if self.update_chat_summary_use_case and self.background_tasks:
+                chat_id = chat.chat_id
+                self.background_tasks.spawn(
+                    lambda: self.update_chat_summary_use_case.execute(chat_id),
+                    key=f"chat-summary:{chat_id}"
+                )
+        finally:
+            # Never wait on the title: use the heuristic one if the LLM is still busy.
+            # Settled here so a client disconnect, which closes this stream early,
+            # still stores a title and hands the pending LLM call to the background.
+            title_event = title_task.finish() if title_task else None
+        if title_event:
+            yield title_event
         
         # Send completion
         yield json.dumps({"type": "complete"})
\ No newline at end of file
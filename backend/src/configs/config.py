@@ -11,29 +11,203 @@ load_dotenv()
 class Settings:
 	"""Application settings loaded from environment variables."""
 	openai_api_key: str
+	openai_base_url: str
 	database_url: str
 	qdrant_api_key: str
 	qdrant_cluster_endpoint: str
+	qdrant_prefer_grpc: bool
+	qdrant_timeout: float
+	qdrant_upsert_batch_size: int
+	qdrant_upsert_parallelism: int
+	qdrant_upsert_max_retries: int
+	qdrant_fanout_concurrency: int
+	qdrant_fanout_timeout: float
+	qdrant_collection_list_ttl: float
+	qdrant_keep_collection_versions: int
+	qdrant_stale_build_seconds: float
+	vector_store_mode: str
+	shared_collection_name: str
+	hot_tier_max_points: int
+	hot_tier_max_collections: int
+	hot_tier_ttl_seconds: float
+	hot_tier_dtype: str
+	payload_external_text: bool
+	retrieval_cache_size: int
+	retrieval_cache_ttl_seconds: float
+	retrieval_cache_url: str
+	retrieval_candidate_factor: int
+	retrieval_score_floor: float
+	retrieval_score_gap: float
+	retrieval_mmr_lambda: float
+	rerank_model: str
+	rerank_candidates: int
+	rerank_batch_size: int
+	rerank_latency_budget_ms: float
+	llm_max_connections: int
+	llm_max_keepalive_connections: int
+	llm_keepalive_expiry: float
+	llm_http2: bool
+	llm_connect_timeout: float
+	llm_read_timeout: float
+	llm_max_retries: int
+	llm_hedging: bool
+	llm_hedge_percentile: float
+	llm_hedge_min_delay_ms: float
+	llm_hedge_max_rate: float
+	llm_hedge_min_samples: int
+	answer_cache_size: int
+	answer_cache_similarity: float
+	answer_cache_ttl_seconds: float
+	answer_cache_max_tenants: int
+	prompt_token_budget: int
+	prompt_context_share: float
+	tool_result_max_tokens: int
+	chat_summary_keep_messages: int
+	chat_summary_batch_messages: int
+	chat_summary_max_words: int
+	model_routing: bool
+	model_fast: str
+	model_standard: str
+	model_heavy: str
+	request_coalescing: bool
 	admin_username: str
 	admin_password: str
 	jwt_secret_key: str
+	embedding_cache_dir: str
+	snapshot_dir: str
 
 
 def load_settings() -> Settings:
 	"""Load and validate application settings from environment variables."""
 	openai_api_key = os.getenv("OPENAI_API_KEY", "")
+	openai_base_url = os.getenv("OPENAI_BASE_URL", "")
 	database_url = os.getenv("DATABASE_URL", "")
 	qdrant_api_key = os.getenv("QDRANT_API_KEY", "")
 	qdrant_cluster_endpoint = os.getenv("QDRANT_CLUSTER_ENDPOINT", "")
+	qdrant_prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+	qdrant_timeout = float(os.getenv("QDRANT_TIMEOUT", "10"))
+	qdrant_upsert_batch_size = int(os.getenv("QDRANT_UPSERT_BATCH_SIZE", "256"))
+	qdrant_upsert_parallelism = int(os.getenv("QDRANT_UPSERT_PARALLELISM", "4"))
+	qdrant_upsert_max_retries = int(os.getenv("QDRANT_UPSERT_MAX_RETRIES", "3"))
+	qdrant_fanout_concurrency = int(os.getenv("QDRANT_FANOUT_CONCURRENCY", "8"))
+	qdrant_fanout_timeout = float(os.getenv("QDRANT_FANOUT_TIMEOUT", "2"))
+	qdrant_collection_list_ttl = float(os.getenv("QDRANT_COLLECTION_LIST_TTL", "30"))
+	qdrant_keep_collection_versions = int(os.getenv("QDRANT_KEEP_COLLECTION_VERSIONS", "0"))
+	qdrant_stale_build_seconds = float(os.getenv("QDRANT_STALE_BUILD_SECONDS", "86400"))
+	vector_store_mode = os.getenv("VECTOR_STORE_MODE", "per_tenant")
+	shared_collection_name = os.getenv("SHARED_COLLECTION_NAME", "tenants")
+	hot_tier_max_points = int(os.getenv("HOT_TIER_MAX_POINTS", "2000"))
+	hot_tier_max_collections = int(os.getenv("HOT_TIER_MAX_COLLECTIONS", "256"))
+	hot_tier_ttl_seconds = float(os.getenv("HOT_TIER_TTL_SECONDS", "300"))
+	hot_tier_dtype = os.getenv("HOT_TIER_DTYPE", "float32")
+	payload_external_text = os.getenv("PAYLOAD_EXTERNAL_TEXT", "false").lower() == "true"
+	retrieval_cache_size = int(os.getenv("RETRIEVAL_CACHE_SIZE", "2048"))
+	retrieval_cache_ttl_seconds = float(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "600"))
+	retrieval_cache_url = os.getenv("RETRIEVAL_CACHE_URL", "")
+	retrieval_candidate_factor = int(os.getenv("RETRIEVAL_CANDIDATE_FACTOR", "4"))
+	retrieval_score_floor = float(os.getenv("RETRIEVAL_SCORE_FLOOR", "0.25"))
+	retrieval_score_gap = float(os.getenv("RETRIEVAL_SCORE_GAP", "0.1"))
+	retrieval_mmr_lambda = float(os.getenv("RETRIEVAL_MMR_LAMBDA", "0.5"))
+	rerank_model = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+	rerank_candidates = int(os.getenv("RERANK_CANDIDATES", "10"))
+	rerank_batch_size = int(os.getenv("RERANK_BATCH_SIZE", "16"))
+	rerank_latency_budget_ms = float(os.getenv("RERANK_LATENCY_BUDGET_MS", "150"))
+	llm_max_connections = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+	llm_max_keepalive_connections = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+	llm_keepalive_expiry = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+	llm_http2 = os.getenv("LLM_HTTP2", "true").lower() == "true"
+	llm_connect_timeout = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+	llm_read_timeout = float(os.getenv("LLM_READ_TIMEOUT", "60"))
+	llm_max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+	llm_hedging = os.getenv("LLM_HEDGING", "false").lower() == "true"
+	llm_hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+	llm_hedge_min_delay_ms = float(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "750"))
+	llm_hedge_max_rate = float(os.getenv("LLM_HEDGE_MAX_RATE", "0.05"))
+	llm_hedge_min_samples = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+	answer_cache_size = int(os.getenv("ANSWER_CACHE_SIZE", "256"))
+	answer_cache_similarity = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.92"))
+	answer_cache_ttl_seconds = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+	answer_cache_max_tenants = int(os.getenv("ANSWER_CACHE_MAX_TENANTS", "512"))
+	prompt_token_budget = int(os.getenv("PROMPT_TOKEN_BUDGET", "6000"))
+	prompt_context_share = float(os.getenv("PROMPT_CONTEXT_SHARE", "0.6"))
+	tool_result_max_tokens = int(os.getenv("TOOL_RESULT_MAX_TOKENS", "1500"))
+	chat_summary_keep_messages = int(os.getenv("CHAT_SUMMARY_KEEP_MESSAGES", "6"))
+	chat_summary_batch_messages = int(os.getenv("CHAT_SUMMARY_BATCH_MESSAGES", "6"))
+	chat_summary_max_words = int(os.getenv("CHAT_SUMMARY_MAX_WORDS", "200"))
+	model_routing = os.getenv("MODEL_ROUTING", "true").lower() == "true"
+	model_fast = os.getenv("MODEL_FAST", "gpt-5-nano")
+	model_standard = os.getenv("MODEL_STANDARD", "gpt-5-mini")
+	model_heavy = os.getenv("MODEL_HEAVY", "gpt-5")
+	request_coalescing = os.getenv("REQUEST_COALESCING", "true").lower() == "true"
 	admin_username = os.getenv("ADMIN_USERNAME", "admin")
 	admin_password = os.getenv("ADMIN_PASSWORD", "admin123")
 	jwt_secret_key = os.getenv("JWT_SECRET_KEY", "default-secret-key-change-in-production")
+	embedding_cache_dir = os.getenv("EMBEDDING_CACHE_DIR", "data/embedding_cache")
+	snapshot_dir = os.getenv("SNAPSHOT_DIR", "data/snapshots")
 	return Settings(
 		openai_api_key=openai_api_key,
+		openai_base_url=openai_base_url,
 		database_url=database_url,
 		qdrant_api_key=qdrant_api_key,
 		qdrant_cluster_endpoint=qdrant_cluster_endpoint,
+		qdrant_prefer_grpc=qdrant_prefer_grpc,
+		qdrant_timeout=qdrant_timeout,
+		qdrant_upsert_batch_size=qdrant_upsert_batch_size,
+		qdrant_upsert_parallelism=qdrant_upsert_parallelism,
+		qdrant_upsert_max_retries=qdrant_upsert_max_retries,
+		qdrant_fanout_concurrency=qdrant_fanout_concurrency,
+		qdrant_fanout_timeout=qdrant_fanout_timeout,
+		qdrant_collection_list_ttl=qdrant_collection_list_ttl,
+		qdrant_keep_collection_versions=qdrant_keep_collection_versions,
+		qdrant_stale_build_seconds=qdrant_stale_build_seconds,
+		vector_store_mode=vector_store_mode,
+		shared_collection_name=shared_collection_name,
+		hot_tier_max_points=hot_tier_max_points,
+		hot_tier_max_collections=hot_tier_max_collections,
+		hot_tier_ttl_seconds=hot_tier_ttl_seconds,
+		hot_tier_dtype=hot_tier_dtype,
+		payload_external_text=payload_external_text,
+		retrieval_cache_size=retrieval_cache_size,
+		retrieval_cache_ttl_seconds=retrieval_cache_ttl_seconds,
+		retrieval_cache_url=retrieval_cache_url,
+		retrieval_candidate_factor=retrieval_candidate_factor,
+		retrieval_score_floor=retrieval_score_floor,
+		retrieval_score_gap=retrieval_score_gap,
+		retrieval_mmr_lambda=retrieval_mmr_lambda,
+		rerank_model=rerank_model,
+		rerank_candidates=rerank_candidates,
+		rerank_batch_size=rerank_batch_size,
+		rerank_latency_budget_ms=rerank_latency_budget_ms,
+		llm_max_connections=llm_max_connections,
+		llm_max_keepalive_connections=llm_max_keepalive_connections,
+		llm_keepalive_expiry=llm_keepalive_expiry,
+		llm_http2=llm_http2,
+		llm_connect_timeout=llm_connect_timeout,
+		llm_read_timeout=llm_read_timeout,
+		llm_max_retries=llm_max_retries,
+		llm_hedging=llm_hedging,
+		llm_hedge_percentile=llm_hedge_percentile,
+		llm_hedge_min_delay_ms=llm_hedge_min_delay_ms,
+		llm_hedge_max_rate=llm_hedge_max_rate,
+		llm_hedge_min_samples=llm_hedge_min_samples,
+		answer_cache_size=answer_cache_size,
+		answer_cache_similarity=answer_cache_similarity,
+		answer_cache_ttl_seconds=answer_cache_ttl_seconds,
+		answer_cache_max_tenants=answer_cache_max_tenants,
+		prompt_token_budget=prompt_token_budget,
+		prompt_context_share=prompt_context_share,
+		tool_result_max_tokens=tool_result_max_tokens,
+		chat_summary_keep_messages=chat_summary_keep_messages,
+		chat_summary_batch_messages=chat_summary_batch_messages,
+		chat_summary_max_words=chat_summary_max_words,
+		model_routing=model_routing,
+		model_fast=model_fast,
+		model_standard=model_standard,
+		model_heavy=model_heavy,
+		request_coalescing=request_coalescing,
 		admin_username=admin_username,
 		admin_password=admin_password,
 		jwt_secret_key=jwt_secret_key,
+		embedding_cache_dir=embedding_cache_dir,
+		snapshot_dir=snapshot_dir,
 	)
\ No newline at end of file
@@ -2,15 +2,33 @@
 from dependency_injector import containers, providers
 from sqlalchemy.orm import Session
 
+from src.configs.config import load_settings
 from src.infrastructure.database.config import SessionLocal
 from src.infrastructure.database.repositories.client_repository import ClientRepository
 from src.infrastructure.database.repositories.chat_repository import ChatRepository
 from src.infrastructure.database.repositories.message_repository import MessageRepository
 from src.infrastructure.database.repositories.widget_session_repository import WidgetSessionRepository
+from src.infrastructure.database.repositories.chunk_text_repository import ChunkTextRepository
 from src.infrastructure.services.EmbeddingService import EmbeddingService
+from src.infrastructure.services.EmbeddingCache import EmbeddingCacheService
+from src.infrastructure.services.SparseEncoder import BM25SparseEncoder
+from src.infrastructure.services.HotVectorTier import HotVectorTier
+from src.infrastructure.services.RetrievalCache import RetrievalCache
+from src.infrastructure.services.ContextSelector import ContextSelector
+from src.infrastructure.services.Reranker import CrossEncoderReranker
+from src.infrastructure.services.AnswerCache import SemanticAnswerCache
+from src.infrastructure.services.PromptBuilder import PromptBuilder
+from src.infrastructure.services.TokenBudget import TokenBudgetManager
+from src.infrastructure.services.ModelRouter import ModelRouter
+from src.infrastructure.services.RequestCoalescer import StreamCoalescer
+from src.infrastructure.services.TenantSnapshot import TenantSnapshotService
 from src.infrastructure.services.RagService import RAGService
 from src.infrastructure.services.ChatTitleService import ChatTitleService
+from src.infrastructure.services.ConversationSummary import ConversationSummaryService
+from src.infrastructure.services.BackgroundTasks import BackgroundTaskRunner
 from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.clients.async_vector_store_client import AsyncVectorStoreClient
+from src.infrastructure.clients.llm_client import LLMClient
 
 from src.application.use_cases.client.create_client_use_case import CreateClientUseCase
 from src.application.use_cases.client.update_client_use_case import UpdateClientUseCase
@@ -20,6 +38,7 @@ from src.application.use_cases.client.delete_client_use_case import DeleteClient
 from src.application.use_cases.chat.create_chat_use_case import CreateChatUseCase
 from src.application.use_cases.chat.get_client_chats_use_case import GetClientChatsUseCase
 from src.application.use_cases.chat.delete_chat_use_case import DeleteChatUseCase
+from src.application.use_cases.chat.update_chat_summary_use_case import UpdateChatSummaryUseCase
 from src.application.use_cases.message.send_message_use_case import SendMessageUseCase
 from src.application.use_cases.message.get_chat_messages_use_case import GetChatMessagesUseCase
 from src.application.use_cases.widget.generate_widget_url_use_case import GenerateWidgetUrlUseCase
@@ -30,6 +49,67 @@ from src.application.use_cases.widget.create_widget_chat_use_case import CreateW
 from src.application.use_cases.widget.delete_widget_chat_use_case import DeleteWidgetChatUseCase
 from src.application.use_cases.widget.send_widget_message_use_case import SendWidgetMessageUseCase
 from src.application.use_cases.widget.get_widget_messages_use_case import GetWidgetMessagesUseCase
+from src.application.use_cases.snapshot.export_tenant_snapshot_use_case import ExportTenantSnapshotUseCase
+from src.application.use_cases.snapshot.import_tenant_snapshot_use_case import ImportTenantSnapshotUseCase
+
+settings = load_settings()
+
+_embedding_cache = EmbeddingCacheService(cache_dir=settings.embedding_cache_dir)
+_hot_vector_tier = HotVectorTier(
+    max_points=settings.hot_tier_max_points,
+    max_collections=settings.hot_tier_max_collections,
+    ttl_seconds=settings.hot_tier_ttl_seconds,
+    dtype=settings.hot_tier_dtype
+)
+_retrieval_cache = RetrievalCache(
+    max_entries=settings.retrieval_cache_size,
+    ttl_seconds=settings.retrieval_cache_ttl_seconds,
+    backend_url=settings.retrieval_cache_url
+)
+_reranker = CrossEncoderReranker(
+    model_name=settings.rerank_model,
+    candidates=settings.rerank_candidates,
+    batch_size=settings.rerank_batch_size,
+    latency_budget_ms=settings.rerank_latency_budget_ms
+)
+_answer_cache = SemanticAnswerCache(
+    max_entries=settings.answer_cache_size,
+    similarity_threshold=settings.answer_cache_similarity,
+    ttl_seconds=settings.answer_cache_ttl_seconds,
+    max_tenants=settings.answer_cache_max_tenants
+)
+_prompt_builder = PromptBuilder()
+_background_tasks = BackgroundTaskRunner()
+_token_budget = TokenBudgetManager(
+    default_budget=settings.prompt_token_budget,
+    context_share=settings.prompt_context_share,
+    tool_result_tokens=settings.tool_result_max_tokens
+)
+_llm_client = LLMClient(
+    api_key=settings.openai_api_key,
+    max_connections=settings.llm_max_connections,
+    max_keepalive_connections=settings.llm_max_keepalive_connections,
+    keepalive_expiry=settings.llm_keepalive_expiry,
+    http2=settings.llm_http2,
+    connect_timeout=settings.llm_connect_timeout,
+    read_timeout=settings.llm_read_timeout,
+    max_retries=settings.llm_max_retries,
+    base_url=settings.openai_base_url or None,
+    hedge_enabled=settings.llm_hedging,
+    hedge_percentile=settings.llm_hedge_percentile,
+    hedge_min_delay_ms=settings.llm_hedge_min_delay_ms,
+    hedge_max_rate=settings.llm_hedge_max_rate,
+    hedge_min_samples=settings.llm_hedge_min_samples
+)
+_model_router = ModelRouter(
+    models={
+        "fast": settings.model_fast,
+        "standard": settings.model_standard,
+        "heavy": settings.model_heavy,
+    },
+    enabled=settings.model_routing
+)
+_stream_coalescer = StreamCoalescer(enabled=settings.request_coalescing)
 
 
 class Container(containers.DeclarativeContainer):
@@ -61,16 +141,79 @@ class Container(containers.DeclarativeContainer):
         db=db_session
     )
     
+    chunk_text_repository = providers.Factory(
+        ChunkTextRepository,
+        db=db_session
+    )
+    
     # Domain Services
     embedding_service = providers.Singleton(EmbeddingService)
+    # One instance per process: it keeps the in-memory index of files every route appends to
+    embedding_cache = providers.Object(_embedding_cache)
+    sparse_encoder = providers.Singleton(BM25SparseEncoder)
     vector_store_client = providers.Singleton(VectorStoreClient)
+    async_vector_store_client = providers.Singleton(AsyncVectorStoreClient)
+    # Process-wide state: every route module builds its own Container, and
+    # invalidation on rebuild must reach the instances the other routes query
+    # (the re-ranker is shared so the model is loaded and measured once, and
+    # the LLM client so every caller draws from one connection pool)
+    hot_vector_tier = providers.Object(_hot_vector_tier)
+    retrieval_cache = providers.Object(_retrieval_cache)
+    reranker = providers.Object(_reranker)
+    answer_cache = providers.Object(_answer_cache)
+    prompt_builder = providers.Object(_prompt_builder)
+    token_budget = providers.Object(_token_budget)
+    background_tasks = providers.Object(_background_tasks)
+    llm_client = providers.Object(_llm_client)
+    model_router = providers.Object(_model_router)
+    stream_coalescer = providers.Object(_stream_coalescer)
+    context_selector = providers.Singleton(
+        ContextSelector,
+        candidate_factor=settings.retrieval_candidate_factor,
+        score_floor=settings.retrieval_score_floor,
+        score_gap=settings.retrieval_score_gap,
+        mmr_lambda=settings.retrieval_mmr_lambda
+    )
     rag_service = providers.Singleton(
         RAGService,
         embedding_service=embedding_service,
         vector_store_client=vector_store_client,
+        embedding_cache=embedding_cache,
+        sparse_encoder=sparse_encoder,
+        async_vector_store_client=async_vector_store_client,
+        hot_tier=hot_vector_tier,
+        chunk_text_repository=chunk_text_repository if settings.payload_external_text else None,
+        retrieval_cache=retrieval_cache,
+        context_selector=context_selector,
+        reranker=reranker,
+        llm_client=llm_client,
+        answer_cache=answer_cache,
+        prompt_builder=prompt_builder,
+        token_budget=token_budget,
+        model_router=model_router,
+        coalescer=stream_coalescer,
     )
 
-    chat_title_service = providers.Singleton(ChatTitleService)
+    chat_title_service = providers.Singleton(
+        ChatTitleService,
+        llm_client=llm_client
+    )
+    
+    conversation_summary_service = providers.Singleton(
+        ConversationSummaryService,
+        llm_client=llm_client,
+        max_words=settings.chat_summary_max_words
+    )
+    
+    tenant_snapshot_service = providers.Factory(
+        TenantSnapshotService,
+        vector_client=vector_store_client,
+        snapshot_dir=settings.snapshot_dir,
+        chunk_text_repository=chunk_text_repository if settings.payload_external_text else None,
+        hot_tier=hot_vector_tier,
+        retrieval_cache=retrieval_cache,
+        answer_cache=answer_cache
+    )
     
     # Use Cases - factory (create new instance for each use)
     create_client_use_case = providers.Factory(
@@ -107,13 +250,24 @@ class Container(containers.DeclarativeContainer):
         chat_repository=chat_repository
     )
     
+    update_chat_summary_use_case = providers.Factory(
+        UpdateChatSummaryUseCase,
+        chat_repository=chat_repository,
+        message_repository=message_repository,
+        summary_service=conversation_summary_service,
+        keep_messages=settings.chat_summary_keep_messages,
+        batch_messages=settings.chat_summary_batch_messages
+    )
+    
     send_message_use_case = providers.Factory(
         SendMessageUseCase,
         message_repository=message_repository,
         chat_repository=chat_repository,
         client_repository=client_repository,
         rag_service=rag_service,
-        chat_title_service=chat_title_service
+        chat_title_service=chat_title_service,
+        update_chat_summary_use_case=update_chat_summary_use_case,
+        background_tasks=background_tasks
     )
     
     get_chat_messages_use_case = providers.Factory(
@@ -173,7 +327,9 @@ class Container(containers.DeclarativeContainer):
         message_repository=message_repository,
         client_repository=client_repository,
         rag_service=rag_service,
-        chat_title_service=chat_title_service
+        chat_title_service=chat_title_service,
+        update_chat_summary_use_case=update_chat_summary_use_case,
+        background_tasks=background_tasks
     )
     
     get_widget_messages_use_case = providers.Factory(
@@ -182,4 +338,15 @@ class Container(containers.DeclarativeContainer):
         chat_repository=chat_repository,
         message_repository=message_repository
     )
-
+    
+    export_tenant_snapshot_use_case = providers.Factory(
+        ExportTenantSnapshotUseCase,
+        client_repository=client_repository,
+        snapshot_service=tenant_snapshot_service
+    )
+    
+    import_tenant_snapshot_use_case = providers.Factory(
+        ImportTenantSnapshotUseCase,
+        client_repository=client_repository,
+        snapshot_service=tenant_snapshot_service
+    )
\ No newline at end of file
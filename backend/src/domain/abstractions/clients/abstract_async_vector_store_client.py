@@ -0,0 +1,69 @@
+"""Abstract base class for asynchronous vector store clients"""
+from abc import ABC, abstractmethod
+from typing import Callable, List, Dict, Optional
+from src.domain.entities.vector_search_result import VectorSearchResult
+
+
+class AbstractAsyncVectorStoreClient(ABC):
+    """Async counterpart of AbstractVectorStoreClient for use on the event loop"""
+
+    @abstractmethod
+    async def ensure_collection(
+        self,
+        collection_name: str,
+        vector_size: int = 1536,
+        distance: str = "Cosine",
+        sparse: bool = False
+    ) -> None:
+        """Ensure a collection exists, create if it doesn't"""
+        pass
+
+    @abstractmethod
+    async def upload(
+        self,
+        collection_name: str,
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        ids: Optional[List[str]] = None,
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """Upload embeddings with metadata to a collection"""
+        pass
+
+    @abstractmethod
+    async def search_chunks(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        query_sparse: Optional[Dict[int, float]] = None,
+        with_vectors: bool = False
+    ) -> List[VectorSearchResult]:
+        """Search for similar chunks in a collection"""
+        pass
+
+    @abstractmethod
+    async def search_all_collections(
+        self,
+        query_embedding: List[float],
+        limit: int = 5
+    ) -> List[VectorSearchResult]:
+        """Search across all collections"""
+        pass
+
+    @abstractmethod
+    async def delete_collection(self, collection_name: str) -> Dict:
+        """Delete a collection"""
+        pass
+
+    @abstractmethod
+    async def list_collections(self) -> List[str]:
+        """List all available collections"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release pooled connections"""
+        pass
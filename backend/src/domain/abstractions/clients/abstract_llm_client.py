@@ -1,6 +1,6 @@
 """Abstract base class for LLM clients"""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, AsyncIterator, Any
+from typing import List, Dict, Optional, AsyncIterator, Any, Callable
 
 
 class AbstractLLMClient(ABC):
@@ -24,9 +24,10 @@ class AbstractLLMClient(ABC):
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        usage_callback: Optional[Callable[[Any], None]] = None,
         **kwargs
     ) -> AsyncIterator[str]:
-        """Create a streaming chat completion"""
+        """Create a streaming chat completion; usage_callback receives the final token usage"""
         pass
 
     @abstractmethod
@@ -1,6 +1,6 @@
 """Abstract base class for vector store clients"""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set, Union
 from src.domain.entities.vector_search_result import VectorSearchResult
 
 
@@ -12,7 +12,8 @@ class AbstractVectorStoreClient(ABC):
         self, 
         collection_name: str, 
         vector_size: int = 1536, 
-        distance: str = "Cosine"
+        distance: str = "Cosine",
+        sparse: bool = False
     ) -> None:
         """Ensure a collection exists, create if it doesn't"""
         pass
@@ -24,17 +25,54 @@ class AbstractVectorStoreClient(ABC):
         embeddings: List[List[float]],
         metadatas: List[Dict],
         ids: Optional[List[str]] = None,
-        vector_size: Optional[int] = None
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> str:
         """Upload embeddings with metadata to a collection"""
         pass
 
+    @abstractmethod
+    def rebuild_collection(
+        self,
+        collection_name: str,
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        ids: Optional[List[str]] = None,
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """Replace a collection's contents, switching queries over only once complete"""
+        pass
+
+    @abstractmethod
+    def point_ids(self, collection_name: str) -> Set[Union[int, str]]:
+        """IDs of every point currently stored for a collection"""
+        pass
+
+    @abstractmethod
+    def sync_collection(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        stale_ids: List[Union[int, str]],
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """Upsert changed points and delete stale ones in place"""
+        pass
+
     @abstractmethod
     def search_chunks(
         self,
         collection_name: str,
         query_embedding: List[float],
-        limit: int = 5
+        limit: int = 5,
+        query_sparse: Optional[Dict[int, float]] = None,
+        with_vectors: bool = False
     ) -> List[VectorSearchResult]:
         """Search for similar chunks in a collection"""
         pass
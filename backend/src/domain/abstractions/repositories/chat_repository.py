@@ -27,6 +27,11 @@ class IChatRepository(ABC):
         """Update a chat"""
         pass
     
+    @abstractmethod
+    def update_summary(self, chat_id: str, summary: str, summarized_messages: int) -> None:
+        """Store the rolling summary covering the chat's first summarized_messages messages"""
+        pass
+    
     @abstractmethod
     def delete(self, chat_id: str) -> bool:
         """Delete a chat"""
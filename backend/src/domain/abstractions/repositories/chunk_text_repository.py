@@ -0,0 +1,17 @@
+"""Chunk text repository interface - defines the contract"""
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class IChunkTextRepository(ABC):
+    """Repository interface for chunk texts stored outside the vector store"""
+
+    @abstractmethod
+    def save_many(self, texts_by_hash: Dict[str, str]) -> None:
+        """Store texts keyed by hash, skipping hashes that already exist"""
+        pass
+
+    @abstractmethod
+    def get_many(self, text_hashes: List[str]) -> Dict[str, str]:
+        """Get texts for the given hashes; missing hashes are omitted"""
+        pass
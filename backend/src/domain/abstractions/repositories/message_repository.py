@@ -13,11 +13,11 @@ class IMessageRepository(ABC):
         pass
     
     @abstractmethod
-    def get_by_chat_id(self, chat_id: str) -> List[Message]:
+    def get_by_chat_id(self, chat_id: str, offset: int = 0) -> List[Message]:
         pass
     
     @abstractmethod
-    def get_chat_history(self, chat_id: str, limit: int = 20) -> List[Dict[str, str]]:
+    def get_chat_history(self, chat_id: str, limit: int = 20, offset: int = 0) -> List[Dict[str, str]]:
         pass
     
     @abstractmethod
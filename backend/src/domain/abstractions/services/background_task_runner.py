@@ -0,0 +1,12 @@
+"""Background task runner interface - defines the contract for work done after a response"""
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+
+class IBackgroundTaskRunner(ABC):
+    """Runs follow-up work off the request's critical path"""
+    
+    @abstractmethod
+    def spawn(self, work: Callable[[], Awaitable[None]], key: str) -> bool:
+        """Start work unless a task with the same key is still running; return whether it started"""
+        pass
@@ -9,3 +9,8 @@ class IChatTitleService(ABC):
     async def generate_title(self, first_message: str) -> str:
         """Generate a chat title from the first message"""
         pass
+    
+    @abstractmethod
+    def fallback_title(self, first_message: str) -> str:
+        """Cheap local title used until (or instead of) the generated one"""
+        pass
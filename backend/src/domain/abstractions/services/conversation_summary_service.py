@@ -0,0 +1,12 @@
+"""Conversation summary service interface - defines the contract for rolling chat summaries"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+
+class IConversationSummaryService(ABC):
+    """Service interface for folding older chat turns into a summary"""
+    
+    @abstractmethod
+    async def summarize(self, previous_summary: Optional[str], turns: List[Dict[str, str]]) -> str:
+        """Return previous_summary extended with the given {"user", "assistant"} turns"""
+        pass
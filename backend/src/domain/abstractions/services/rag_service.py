@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, AsyncIterator, Optional
+from typing import Callable, List, Dict, AsyncIterator, Optional
 
 
 class IRAGService(ABC):
     @abstractmethod
-    async def build(self, url: str, company_name: str) -> None:
+    async def build(self, url: str, company_name: str, progress_callback: Optional[Callable[[int, int], None]] = None) -> None:
         pass
     
     @abstractmethod
@@ -12,5 +12,5 @@ class IRAGService(ABC):
         pass
     
     @abstractmethod
-    async def query_stream(self, question: str, company_name: str, chat_history: List[Dict[str, str]] = None, tools: Optional[List[Dict]] = None, auth_token: Optional[str] = None, system_prompt: Optional[str] = "") -> AsyncIterator[str]:
+    async def query_stream(self, question: str, company_name: str, chat_history: List[Dict[str, str]] = None, tools: Optional[List[Dict]] = None, auth_token: Optional[str] = None, system_prompt: Optional[str] = "", is_follow_up: bool = False, rerank: bool = False, token_budget: Optional[int] = None, conversation_summary: Optional[str] = None, model_tier: Optional[str] = None) -> AsyncIterator[str]:
         pass
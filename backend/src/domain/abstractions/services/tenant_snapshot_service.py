@@ -0,0 +1,27 @@
+"""Tenant snapshot service interface - export and restore a tenant's vectors"""
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional
+
+
+class ITenantSnapshotService(ABC):
+    """Service interface for moving a tenant's index without re-crawling"""
+
+    @abstractmethod
+    def snapshot_path(self, filename: str) -> str:
+        """Resolve a snapshot file name inside the snapshot directory"""
+        pass
+
+    @abstractmethod
+    def export_tenant(self, collection_name: str, path: Optional[str] = None) -> Dict:
+        """Write a tenant's points to a snapshot file and return its manifest"""
+        pass
+
+    @abstractmethod
+    def import_tenant(
+        self,
+        path: str,
+        collection_name: Optional[str] = None,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Dict:
+        """Replace a tenant's points with the contents of a snapshot file"""
+        pass
@@ -8,5 +8,8 @@ class Chat(BaseModel):
     client_id: str
     ip_address: str
     title: Optional[str]
+    # Rolling summary of the first `summarized_messages` messages
+    summary: Optional[str] = None
+    summarized_messages: int = 0
     created_at: datetime
     updated_at: datetime
@@ -11,5 +11,8 @@ class Client(BaseModel):
     api_key_hash: Optional[str]
     tools: Optional[List[Dict]] = None
     system_prompt: Optional[str] = None
+    rerank_enabled: bool = False
+    prompt_token_budget: Optional[int] = None
+    model_tier: Optional[str] = None
     created_at: datetime
     updated_at: datetime
\ No newline at end of file
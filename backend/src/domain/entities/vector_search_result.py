@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class VectorSearchResult(BaseModel):
@@ -7,3 +7,4 @@ class VectorSearchResult(BaseModel):
     score: float
     chunk_index: Optional[int] = None
     metadata: Optional[Dict[str, Any]] = None
+    vector: Optional[List[float]] = None
@@ -1,9 +1,10 @@
-from typing import Any, Dict, Optional, List, AsyncIterator
+from typing import Any, Callable, Dict, Optional, List, AsyncIterator
 from openai import AsyncOpenAI
 import json
 import asyncio
 
-from src.domain.utils.chat_formatter import format_chat_history
+from src.infrastructure.services.PromptBuilder import PromptBuilder
+from src.infrastructure.services.TokenBudget import TokenBudgetManager
 from src.infrastructure.utils.tools_utils import build_tools_schema, execute_endpoint
 
 
@@ -13,6 +14,10 @@ class AgentRunnable:
     Sends hints BEFORE calling tools, not after.
     """
 
+    # Text a turn may produce before its first tool call and still count as a
+    # preamble ("Let me check that for you."); beyond it the turn is an answer
+    TEXT_TURN_PREFIX_CHARS = 200
+
     def __init__(
         self,
         client: AsyncOpenAI,
@@ -21,7 +26,13 @@ class AgentRunnable:
         chat_history: Optional[List[Dict]] = None,
         company_name: str = "",
         system_prompt: str = "",
-        model: str = "gpt-4o-mini"
+        model: str = "gpt-4o-mini",
+        prompt_builder: Optional[PromptBuilder] = None,
+        instructions: Optional[List[str]] = None,
+        token_budget: Optional[TokenBudgetManager] = None,
+        budget: Optional[int] = None,
+        conversation_summary: Optional[str] = None,
+        usage_callback: Optional[Callable[[Any], None]] = None
     ):
         self.client = client
         self.retriever = retriever
@@ -30,46 +41,62 @@ class AgentRunnable:
         self.company_name = company_name
         self.system_prompt = system_prompt
         self.model = model
+        self.prompt_builder = prompt_builder or PromptBuilder()
+        # Per-request instructions; kept out of the system prompt so its prefix stays cacheable
+        self.instructions = instructions or []
+        self.token_budget = token_budget or TokenBudgetManager()
+        self.budget = budget
+        self.conversation_summary = conversation_summary
+        self.usage_callback = usage_callback
 
         if not isinstance(tools_config, list):
             self.tool_definitions = []
             self.endpoint_map = {}
         else:
-            self.tool_definitions = build_tools_schema(tools_config)
+            self.tool_definitions = PromptBuilder.stable_tools(build_tools_schema(tools_config))
             self.endpoint_map = {}
             for t in tools_config:
                 if isinstance(t, dict) and "name" in t:
                     self.endpoint_map[t["name"]] = t
 
+    def _build_messages(self, question: str, docs: List, auth_token: Optional[str]) -> List[Dict]:
+        fitted = self.token_budget.fit(
+            self.company_name,
+            question,
+            system_prefix=self.prompt_builder.system_prefix(self.company_name, self.system_prompt),
+            documents=[d.page_content for d in docs],
+            chat_history=self.chat_history,
+            volatile=self.prompt_builder.volatile_parts(self.instructions, auth_token),
+            budget=self.budget,
+            summary=self.prompt_builder.summary_text(self.conversation_summary)
+        )
+        return self.prompt_builder.build_messages(
+            question,
+            company_name=self.company_name,
+            system_prompt=self.system_prompt,
+            context="\n\n".join(fitted.context),
+            chat_history=fitted.chat_history,
+            instructions=self.instructions,
+            auth_token=auth_token,
+            conversation_summary=self.conversation_summary
+        )
+
+    def _cache_params(self) -> Dict[str, Any]:
+        """Route a tenant's requests to the same provider cache shard"""
+        return {"prompt_cache_key": self.company_name} if self.company_name else {}
+
+    def _record_usage(self, usage: Any) -> None:
+        self.prompt_builder.record_usage(self.company_name, usage)
+        if self.usage_callback and usage is not None:
+            self.usage_callback(usage)
+
     async def ainvoke(self, input_data: Any, config: Optional[Dict] = None) -> Dict[str, Any]:
         """Non-streaming version (kept for compatibility)"""
         question = input_data if isinstance(input_data, str) else input_data.get("input", "")
         auth_token = (config or {}).get("configurable", {}).get("auth_token")
 
         docs = await self.retriever.ainvoke(question)
-        context = "\\n\\n".join(d.page_content for d in docs)
-
-        history = format_chat_history(self.chat_history)
-        company_context = f"You are a representative of {self.company_name}. " if self.company_name else ""
-
-        prompt_parts = []
-
-        if company_context:
-            prompt_parts.append(company_context)
-
-        if self.system_prompt:
-            prompt_parts.append(self.system_prompt)
-
-        prompt_parts.append(f"API token: {auth_token}")
-        prompt_parts.append(f"Context:\\n{context}")
-        prompt_parts.append(f"Chat History:\\n{history}")
-
-        full_system_prompt = "\\n\\n".join(prompt_parts)
-
-        messages = [
-            {"role": "system", "content": full_system_prompt},
-            {"role": "user", "content": question}
-        ]
+        messages = self._build_messages(question, docs, auth_token)
 
         if not self.tool_definitions:
             return {"result": "I don't have access to the required tools to complete this task."}
@@ -79,8 +106,10 @@ class AgentRunnable:
                 model=self.model,
                 messages=messages,
                 tools=self.tool_definitions,
-                tool_choice="auto"
+                tool_choice="auto",
+                **self._cache_params()
             )
+            self._record_usage(response.usage)
 
             msg = response.choices[0].message
 
@@ -102,7 +131,7 @@ class AgentRunnable:
                 messages.append({
                     "role": "tool",
                     "tool_call_id": call.id,
-                    "content": json.dumps(result)
+                    "content": self.token_budget.cap_tool_result(self.company_name, json.dumps(result))
                 })
 
     async def astream(
@@ -124,29 +153,7 @@ class AgentRunnable:
 
         # NOW do the retrieval
         docs = await self.retriever.ainvoke(question)
-        context = "\\n\\n".join(d.page_content for d in docs)
-
-        history = format_chat_history(self.chat_history)
-        company_context = f"You are a representative of {self.company_name}. " if self.company_name else ""
-
-        prompt_parts = []
-
-        if company_context:
-            prompt_parts.append(company_context)
-
-        if self.system_prompt:
-            prompt_parts.append(self.system_prompt)
-
-        prompt_parts.append(f"API token: {auth_token}")
-        prompt_parts.append(f"Context:\\n{context}")
-        prompt_parts.append(f"Chat History:\\n{history}")
-
-        full_system_prompt = "\\n\\n".join(prompt_parts)
-
-        messages = [
-            {"role": "system", "content": full_system_prompt},
-            {"role": "user", "content": question}
-        ]
+        messages = self._build_messages(question, docs, auth_token)
 
         if not self.tool_definitions:
             yield json.dumps({
@@ -169,45 +176,92 @@ class AgentRunnable:
                     "message": "🤔 Analyzing your request..."
                 })
 
-            # Get model response (may include tool calls) — non-streaming decision turn
-            response = await self.client.chat.completions.create(
+            # One streamed call per turn: tool-call deltas are assembled, and
+            # text is held back until it outgrows a preamble with no tool call
+            # in sight, then forwarded as it arrives
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 tools=self.tool_definitions,
-                tool_choice="auto"
+                tool_choice="auto",
+                stream=True,
+                stream_options={"include_usage": True},
+                **self._cache_params()
             )
-
-            msg = response.choices[0].message
-
-            # If no tool calls, stream the final response with real token streaming
-            if not msg.tool_calls:
-                yield json.dumps({
-                    "type": "status_hint",
-                    "message": "✍️ Writing response..."
-                })
-
-                stream = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    tools=self.tool_definitions,
-                    tool_choice="none",   # decision already made; skip re-routing
-                    stream=True
-                )
-                async for chunk in stream:
-                    delta = chunk.choices[0].delta.content
-                    if delta:
+            content_parts = []
+            buffered_chars = 0
+            sent = 0
+            streaming = False
+            tool_calls: Dict[int, Dict] = {}
+            async for chunk in stream:
+                if chunk.usage is not None:
+                    self._record_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                for call_delta in delta.tool_calls or []:
+                    call = tool_calls.setdefault(call_delta.index, {
+                        "id": "",
+                        "type": "function",
+                        "function": {"name": "", "arguments": ""}
+                    })
+                    if call_delta.id:
+                        call["id"] = call_delta.id
+                    if call_delta.function is not None:
+                        call["function"]["name"] += call_delta.function.name or ""
+                        call["function"]["arguments"] += call_delta.function.arguments or ""
+                if delta.content:
+                    content_parts.append(delta.content)
+                    buffered_chars += len(delta.content)
+                if tool_calls:
+                    continue
+                if not streaming and buffered_chars >= self.TEXT_TURN_PREFIX_CHARS:
+                    streaming = True
+                    yield json.dumps({
+                        "type": "status_hint",
+                        "message": "✍️ Writing response..."
+                    })
+                if streaming:
+                    for part in content_parts[sent:]:
                         yield json.dumps({
                             "type": "content",
-                            "data": delta
+                            "data": part
                         })
+                    sent = len(content_parts)
+
+            # No tool calls: the turn's text is the answer
+            if not tool_calls:
+                if not streaming and content_parts:
+                    yield json.dumps({
+                        "type": "status_hint",
+                        "message": "✍️ Writing response..."
+                    })
+                for part in content_parts[sent:]:
+                    yield json.dumps({
+                        "type": "content",
+                        "data": part
+                    })
                 return
 
+            # A preamble not yet sent is shown as a hint, not as part of the answer
+            preamble = "".join(content_parts[sent:]).strip()
+            if preamble:
+                yield json.dumps({
+                    "type": "status_hint",
+                    "message": preamble
+                })
+
             # Tool calls detected — execute them
-            messages.append(msg)
+            calls = [tool_calls[index] for index in sorted(tool_calls)]
+            messages.append({
+                "role": "assistant",
+                "content": "".join(content_parts) or None,
+                "tool_calls": calls
+            })
 
             async def _run_tool(call) -> tuple:
-                name = call.function.name
-                args = json.loads(call.function.arguments)
+                name = call["function"]["name"]
+                args = json.loads(call["function"]["arguments"] or "{}")
                 endpoint = self.endpoint_map.get(name)
                 result = (
                     await execute_endpoint(endpoint, args, auth_token)
@@ -216,21 +270,21 @@ class AgentRunnable:
                 )
                 return call, name, result
 
-            for call in msg.tool_calls:
-                name = call.function.name
+            for call in calls:
+                name = call["function"]["name"]
                 yield json.dumps({
                     "type": "status_hint",
                     "message": f"🔧 Calling {name}..."
                 })
 
             # Run all tool HTTP requests concurrently
-            tool_results = await asyncio.gather(*[_run_tool(c) for c in msg.tool_calls])
+            tool_results = await asyncio.gather(*[_run_tool(c) for c in calls])
 
             for call, name, result in tool_results:
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": call.id,
-                    "content": json.dumps(result)
+                    "tool_call_id": call["id"],
+                    "content": self.token_budget.cap_tool_result(self.company_name, json.dumps(result))
                 })
                 yield json.dumps({
                     "type": "status_hint",
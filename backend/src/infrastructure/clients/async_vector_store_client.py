@@ -0,0 +1,387 @@
+"""Asynchronous Qdrant vector store client implementation"""
+import asyncio
+import itertools
+import time
+from typing import Callable, List, Dict, Optional, Tuple
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import (
+    PointStruct,
+    VectorParams,
+    Distance,
+    SparseVectorParams,
+    Modifier,
+    Prefetch,
+    FusionQuery,
+    Fusion,
+    Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    DeleteAlias,
+    DeleteAliasOperation,
+)
+from src.configs.config import load_settings
+from src.domain.abstractions.clients.abstract_async_vector_store_client import AbstractAsyncVectorStoreClient
+from src.domain.entities.vector_search_result import VectorSearchResult
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.utils.payload_schema import SEARCH_PAYLOAD_FIELDS
+
+
+class AsyncVectorStoreClient(AbstractAsyncVectorStoreClient):
+    """
+    Qdrant client that runs natively on the event loop.
+
+    One instance holds one pooled connection (gRPC channel when
+    QDRANT_PREFER_GRPC is set, HTTP keep-alive otherwise) and should be
+    shared process-wide. Every call is bounded by a per-call timeout.
+    Collection naming and shared-collection tenancy follow VectorStoreClient.
+    """
+
+    SPARSE_VECTOR_NAME = VectorStoreClient.SPARSE_VECTOR_NAME
+    HYBRID_PREFETCH_FACTOR = VectorStoreClient.HYBRID_PREFETCH_FACTOR
+    TENANT_FIELD = VectorStoreClient.TENANT_FIELD
+
+    def __init__(self):
+        settings = load_settings()
+        self.timeout = settings.qdrant_timeout
+        self.upsert_batch_size = settings.qdrant_upsert_batch_size
+        self.upsert_parallelism = settings.qdrant_upsert_parallelism
+        self.upsert_max_retries = settings.qdrant_upsert_max_retries
+        self.shared_mode = settings.vector_store_mode == VectorStoreClient.SHARED_MODE
+        self.shared_collection_name = settings.shared_collection_name
+        self.fanout_concurrency = settings.qdrant_fanout_concurrency
+        self.fanout_timeout = settings.qdrant_fanout_timeout
+        self.collection_list_ttl = settings.qdrant_collection_list_ttl
+        self._collection_names: Optional[List[str]] = None
+        self._live_collections_map: Optional[Dict[str, str]] = None
+        self._collection_names_at = 0.0
+        self.client = AsyncQdrantClient(
+            url=settings.qdrant_cluster_endpoint,
+            api_key=settings.qdrant_api_key,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            timeout=int(self.timeout)
+        )
+        # physical collection name -> whether it carries the sparse BM25 vector
+        self._sparse_support: Dict[str, bool] = {}
+        self._topology_version = VectorStoreClient.topology_version
+
+    def _sync_topology(self) -> None:
+        """Drop cached names and sparse support after the sync client changed collections or aliases"""
+        if self._topology_version != VectorStoreClient.topology_version:
+            self._topology_version = VectorStoreClient.topology_version
+            self._sparse_support.clear()
+            self._collection_names = None
+            self._live_collections_map = None
+
+    async def _call(self, coro, timeout: Optional[float] = None):
+        """Await a Qdrant call with a client-side deadline"""
+        return await asyncio.wait_for(coro, timeout=timeout or self.timeout)
+
+    def _resolve(self, collection_name: str) -> Tuple[str, Optional[Filter]]:
+        """Map a tenant's logical collection to (physical collection, tenant filter)"""
+        if self.shared_mode:
+            return self.shared_collection_name, VectorStoreClient._tenant_filter(collection_name)
+        return collection_name, None
+
+    async def _refresh_collection_names(self, force: bool = False) -> None:
+        self._sync_topology()
+        now = time.monotonic()
+        if force or self._collection_names is None or now - self._collection_names_at >= self.collection_list_ttl:
+            collections_response, aliases_response = await asyncio.gather(
+                self._call(self.client.get_collections()),
+                self._call(self.client.get_aliases())
+            )
+            names = [col.name for col in collections_response.collections]
+            self._collection_names = names
+            self._live_collections_map = VectorStoreClient._map_live_collections(names, aliases_response.aliases)
+            self._collection_names_at = now
+
+    async def _physical_collection_names(self) -> List[str]:
+        """Physical collection names, cached for QDRANT_COLLECTION_LIST_TTL seconds"""
+        await self._refresh_collection_names()
+        return self._collection_names
+
+    async def _live_collections(self) -> Dict[str, str]:
+        """Tenant name -> serving physical collection (see VectorStoreClient)"""
+        await self._refresh_collection_names()
+        return self._live_collections_map
+
+    async def ensure_collection(
+        self,
+        collection_name: str,
+        vector_size: int = 1536,
+        distance: str = "Cosine",
+        sparse: bool = False
+    ) -> None:
+        """Ensure a collection exists, create if it doesn't"""
+        physical_name, _ = self._resolve(collection_name)
+        try:
+            if await self._call(self.client.collection_exists(collection_name=physical_name)):
+                return
+            distance_metric = Distance.COSINE if distance == "Cosine" else Distance.EUCLID
+            if self.shared_mode:
+                await self._call(self.client.create_collection(
+                    collection_name=physical_name,
+                    vectors_config=VectorParams(size=vector_size, distance=distance_metric),
+                    sparse_vectors_config={self.SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)},
+                    hnsw_config=HnswConfigDiff(payload_m=16, m=0)
+                ))
+                await self._call(self.client.create_payload_index(
+                    collection_name=physical_name,
+                    field_name=self.TENANT_FIELD,
+                    field_schema=KeywordIndexParams(type="keyword", is_tenant=True)
+                ))
+                self._sparse_support[physical_name] = True
+                self._collection_names = None
+                return
+            sparse_config = (
+                {self.SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)}
+                if sparse else None
+            )
+            await self._call(self.client.create_collection(
+                collection_name=physical_name,
+                vectors_config=VectorParams(size=vector_size, distance=distance_metric),
+                sparse_vectors_config=sparse_config
+            ))
+            self._sparse_support[physical_name] = sparse
+            self._collection_names = None
+        except Exception as e:
+            raise Exception(f"Error ensuring collection {collection_name}: {str(e)}")
+
+    async def supports_sparse(self, collection_name: str) -> bool:
+        """
+        Whether a collection carries the sparse BM25 vector. Aliases are
+        resolved first and the answer is cached per physical collection, whose
+        vector config never changes, so a blue/green swap made by any client
+        is followed once the alias map is refreshed.
+        """
+        physical_name = (await self._live_collections()).get(collection_name, collection_name)
+        if physical_name not in self._sparse_support:
+            info = await self._call(self.client.get_collection(collection_name=physical_name))
+            sparse_vectors = info.config.params.sparse_vectors or {}
+            self._sparse_support[physical_name] = self.SPARSE_VECTOR_NAME in sparse_vectors
+        return self._sparse_support[physical_name]
+
+    async def upload(
+        self,
+        collection_name: str,
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        ids: Optional[List[str]] = None,
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """Upload embeddings with metadata in bounded parallel batches (see VectorStoreClient.upload)"""
+        physical_name, _ = self._resolve(collection_name)
+        try:
+            if not await self._call(self.client.collection_exists(collection_name=physical_name)):
+                await self.ensure_collection(
+                    collection_name,
+                    vector_size=vector_size or len(embeddings[0]),
+                    sparse=sparse_vectors is not None
+                )
+
+            if sparse_vectors is not None and not await self.supports_sparse(physical_name):
+                sparse_vectors = None
+
+            total = min(len(embeddings), len(metadatas))
+            starts = list(range(0, total, self.upsert_batch_size))
+            semaphore = asyncio.Semaphore(self.upsert_parallelism)
+            uploaded = 0
+
+            def build_batch(start: int) -> List[PointStruct]:
+                points = []
+                for i in range(start, min(start + self.upsert_batch_size, total)):
+                    point_id = VectorStoreClient._upload_point_id(collection_name, ids, i, self.shared_mode)
+                    payload = metadatas[i]
+                    if self.shared_mode:
+                        payload = {**payload, self.TENANT_FIELD: collection_name}
+                    vector = embeddings[i]
+                    if sparse_vectors is not None:
+                        vector = {
+                            "": vector,
+                            self.SPARSE_VECTOR_NAME: VectorStoreClient._to_sparse_vector(sparse_vectors[i])
+                        }
+                    points.append(PointStruct(id=point_id, vector=vector, payload=payload))
+                return points
+
+            async def send_batch(start: int) -> None:
+                nonlocal uploaded
+                async with semaphore:
+                    points = build_batch(start)
+                    await self._upsert_with_retry(physical_name, points, wait=False)
+                uploaded += len(points)
+                if progress_callback:
+                    progress_callback(uploaded, total)
+
+            await asyncio.gather(*[send_batch(start) for start in starts])
+
+            if starts:
+                await self._upsert_with_retry(physical_name, build_batch(starts[-1]), wait=True)
+            return collection_name
+        except Exception as e:
+            raise Exception(f"Error uploading to collection {collection_name}: {str(e)}")
+
+    async def _upsert_with_retry(self, collection_name: str, points: List[PointStruct], wait: bool) -> None:
+        """Upsert one batch, retrying with exponential backoff"""
+        for attempt in range(self.upsert_max_retries + 1):
+            try:
+                await self._call(self.client.upsert(collection_name=collection_name, points=points, wait=wait))
+                return
+            except Exception:
+                if attempt == self.upsert_max_retries:
+                    raise
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+    async def search_chunks(
+        self,
+        collection_name: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        query_sparse: Optional[Dict[int, float]] = None,
+        with_vectors: bool = False
+    ) -> List[VectorSearchResult]:
+        """Search for similar chunks in a collection, fusing dense and BM25 hits with RRF when possible"""
+        physical_name, tenant_filter = self._resolve(collection_name)
+        try:
+            if query_sparse and await self.supports_sparse(physical_name):
+                prefetch_limit = limit * self.HYBRID_PREFETCH_FACTOR
+                search_results = await self._call(self.client.query_points(
+                    collection_name=physical_name,
+                    prefetch=[
+                        Prefetch(query=query_embedding, filter=tenant_filter, limit=prefetch_limit),
+                        Prefetch(
+                            query=VectorStoreClient._to_sparse_vector(query_sparse),
+                            using=self.SPARSE_VECTOR_NAME,
+                            filter=tenant_filter,
+                            limit=prefetch_limit
+                        ),
+                    ],
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    query_filter=tenant_filter,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    with_vectors=with_vectors,
+                    limit=limit
+                ))
+            else:
+                search_results = await self._call(self.client.query_points(
+                    collection_name=physical_name,
+                    query=query_embedding,
+                    query_filter=tenant_filter,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    with_vectors=with_vectors,
+                    limit=limit
+                ))
+
+            return [VectorStoreClient._to_result(hit) for hit in search_results.points]
+        except Exception as e:
+            raise Exception(f"Error searching chunks in {collection_name}: {str(e)}")
+
+    async def search_all_collections(
+        self,
+        query_embedding: List[float],
+        limit: int = 5
+    ) -> List[VectorSearchResult]:
+        """Search across all collections"""
+        try:
+            if self.shared_mode:
+                search_results = await self._call(self.client.query_points(
+                    collection_name=self.shared_collection_name,
+                    query=query_embedding,
+                    with_payload=SEARCH_PAYLOAD_FIELDS + [self.TENANT_FIELD],
+                    limit=limit
+                ))
+                return [
+                    VectorStoreClient._to_result(hit, hit.payload.get(self.TENANT_FIELD))
+                    for hit in search_results.points
+                ]
+
+            semaphore = asyncio.Semaphore(self.fanout_concurrency)
+
+            async def search_one(collection_name: str, physical_name: str):
+                async with semaphore:
+                    try:
+                        search_results = await self._call(
+                            self.client.query_points(
+                                collection_name=physical_name,
+                                query=query_embedding,
+                                with_payload=SEARCH_PAYLOAD_FIELDS,
+                                limit=limit
+                            ),
+                            timeout=self.fanout_timeout
+                        )
+                        return collection_name, search_results.points
+                    except Exception as e:
+                        print(f"Warning: search in collection {collection_name} failed: {str(e)}")
+                        return collection_name, []
+
+            # Merge into a size-`limit` heap as each collection answers
+            heap: List = []
+            counter = itertools.count()
+            live = await self._live_collections()
+            tasks = [search_one(name, physical_name) for name, physical_name in live.items()]
+            for next_done in asyncio.as_completed(tasks):
+                collection_name, hits = await next_done
+                for hit in hits:
+                    VectorStoreClient._push_top_k(
+                        heap, counter, VectorStoreClient._to_result(hit, collection_name), limit
+                    )
+
+            return VectorStoreClient._drain_top_k(heap)
+        except Exception as e:
+            raise Exception(f"Error searching chunks: {str(e)}")
+
+    async def delete_collection(self, collection_name: str) -> Dict:
+        """Delete a collection (in shared mode, delete the tenant's points)"""
+        try:
+            if self.shared_mode:
+                await self._call(self.client.delete(
+                    collection_name=self.shared_collection_name,
+                    points_selector=FilterSelector(filter=VectorStoreClient._tenant_filter(collection_name))
+                ))
+                return {"success": True, "message": f"Points of tenant {collection_name} deleted."}
+            # Alias, every version and any pre-alias collection (see VectorStoreClient)
+            await self._refresh_collection_names(force=True)
+            live = self._live_collections_map
+            doomed = [
+                name for name in self._collection_names
+                if (VectorStoreClient._parse_version(name) or ("",))[0] == collection_name
+            ]
+            if live.get(collection_name) == collection_name:
+                doomed.append(collection_name)
+            if collection_name not in live and not doomed:
+                raise Exception(f"Collection {collection_name} does not exist.")
+            if live.get(collection_name, collection_name) != collection_name:
+                await self._call(self.client.update_collection_aliases(change_aliases_operations=[
+                    DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection_name))
+                ]))
+            for physical_name in doomed:
+                await self._call(self.client.delete_collection(collection_name=physical_name))
+                self._sparse_support.pop(physical_name, None)
+            self._sparse_support.pop(collection_name, None)
+            self._collection_names = None
+            return {"success": True, "message": f"Collection {collection_name} deleted."}
+        except Exception as e:
+            raise Exception(f"Error deleting collection {collection_name}: {str(e)}")
+
+    async def list_collections(self) -> List[str]:
+        """List all available collections (in shared mode, the tenants of the shared collection)"""
+        try:
+            if self.shared_mode:
+                if not await self._call(self.client.collection_exists(self.shared_collection_name)):
+                    return []
+                facets = await self._call(self.client.facet(
+                    collection_name=self.shared_collection_name,
+                    key=self.TENANT_FIELD,
+                    limit=100000
+                ))
+                return [hit.value for hit in facets.hits]
+            await self._refresh_collection_names(force=True)
+            return sorted(self._live_collections_map)
+        except Exception as e:
+            raise Exception(f"Error listing collections: {str(e)}")
+
+    async def close(self) -> None:
+        """Release pooled connections"""
+        await self.client.close()
@@ -1,4 +1,10 @@
-from typing import List, Dict, Optional, AsyncIterator
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, List, Dict, Optional, AsyncIterator
+import httpx
+import numpy as np
 from openai import AsyncOpenAI
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
@@ -10,18 +16,261 @@ from src.domain.utils.chat_formatter import format_chat_history
 from src.infrastructure.chains import RetrievalChain, AgentRunnable, RouterChain
 
 
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _ConnectionMetrics:
+    """
+    Outbound HTTP counters fed by httpx event hooks and httpcore trace events.
+
+    A request that does not open a TCP connection reused a pooled one, so
+    ``connections_opened / requests`` is the share of calls that paid for a
+    handshake.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.requests = 0
+        self.errors = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.http_versions: Dict[str, int] = {}
+        # Time from sending the request to receiving response headers
+        self.header_latencies_ms = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    async def _trace(self, event_name: str, info: Dict) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections_opened += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    async def on_request(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._trace
+        request.extensions["llm_started"] = time.perf_counter()
+        with self._lock:
+            self.requests += 1
+
+    async def on_response(self, response: httpx.Response) -> None:
+        started = response.request.extensions.get("llm_started")
+        with self._lock:
+            self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+            if response.status_code >= 400:
+                self.errors += 1
+            if started is not None:
+                self.header_latencies_ms.append((time.perf_counter() - started) * 1000.0)
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            latencies = np.asarray(self.header_latencies_ms) if self.header_latencies_ms else np.zeros(1)
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "connections_opened": self.connections_opened,
+                "tls_handshakes": self.tls_handshakes,
+                "connection_reuse_rate": 1 - self.connections_opened / self.requests if self.requests else 0.0,
+                "http_versions": dict(self.http_versions),
+                "header_latency_ms_p50": float(np.percentile(latencies, 50)),
+                "header_latency_ms_p95": float(np.percentile(latencies, 95)),
+            }
+
+
+class _HedgePolicy:
+    """
+    Deadline and rate cap for hedged streaming requests.
+
+    The deadline is the ``percentile`` of recent time-to-first-token samples
+    for the model (never below ``min_delay_ms``); nothing is hedged until
+    ``min_samples`` have been seen. At most ``max_rate`` of the last
+    ``window`` requests may start a hedge, so a provider-wide slowdown does
+    not double the load.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 95.0,
+        min_delay_ms: float = 750.0,
+        max_rate: float = 0.05,
+        min_samples: int = 20,
+        window: int = 512
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay_ms = min_delay_ms
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.window = window
+        self._ttft_ms: Dict[str, deque] = {}
+        self._hedged = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges_started = 0
+        self.hedges_won = 0
+        self.primaries_won = 0
+        self.hedges_suppressed = 0
+
+    def deadline(self, model: str) -> Optional[float]:
+        """Seconds to wait for the first token before hedging, or None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            samples = self._ttft_ms.get(model)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            threshold = float(np.percentile(np.asarray(samples), self.percentile))
+        return max(threshold, self.min_delay_ms) / 1000.0
+
+    def allow(self) -> bool:
+        with self._lock:
+            hedged = sum(self._hedged)
+            if hedged + 1 > self.max_rate * max(len(self._hedged), self.min_samples):
+                self.hedges_suppressed += 1
+                return False
+            self.hedges_started += 1
+            return True
+
+    def record(self, model: str, ttft_ms: float, hedged: bool, hedge_won: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self._hedged.append(int(hedged))
+            self._ttft_ms.setdefault(model, deque(maxlen=self.window)).append(ttft_ms)
+            if hedged:
+                if hedge_won:
+                    self.hedges_won += 1
+                else:
+                    self.primaries_won += 1
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            models = {
+                model: {
+                    "samples": len(samples),
+                    "ttft_ms_p50": float(np.percentile(np.asarray(samples), 50)),
+                    "ttft_ms_p95": float(np.percentile(np.asarray(samples), 95)),
+                }
+                for model, samples in self._ttft_ms.items() if samples
+            }
+            return {
+                "enabled": self.enabled,
+                "percentile": self.percentile,
+                "min_delay_ms": self.min_delay_ms,
+                "max_rate": self.max_rate,
+                "requests": self.requests,
+                "hedges_started": self.hedges_started,
+                "hedge_rate": self.hedges_started / self.requests if self.requests else 0.0,
+                "hedges_won": self.hedges_won,
+                "primaries_won": self.primaries_won,
+                "hedge_win_rate": self.hedges_won / self.hedges_started if self.hedges_started else 0.0,
+                "hedges_suppressed": self.hedges_suppressed,
+                "models": models,
+            }
+
+
 class LLMClient(AbstractLLMClient):
-    def __init__(self):
-        settings = load_settings()
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+    """
+    OpenAI client over one explicitly sized keep-alive connection pool.
+
+    Build one per process and share it: the raw AsyncOpenAI client, the
+    LangChain chat model and the agent all send through the same pool, so
+    TLS handshakes are paid once per connection rather than once per
+    service. Timeouts set here are defaults; pass ``timeout=`` to a single
+    call to override them.
+
+    With hedging on, a streaming completion whose first token is later than
+    the model's usual TTFT gets one duplicate request; whichever stream
+    produces a token first is used and the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        max_retries: int = 2,
+        base_url: Optional[str] = None,
+        hedge_enabled: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay_ms: float = 750.0,
+        hedge_max_rate: float = 0.05,
+        hedge_min_samples: int = 20
+    ):
+        if api_key is None:
+            settings = load_settings()
+            api_key = settings.openai_api_key
+            base_url = base_url or settings.openai_base_url or None
+        self.base_url = base_url
         self.default_model = "gpt-5-mini"
         self.default_embedding_model = "text-embedding-3-small"
+
+        if http2 and not _http2_available():
+            print("Warning: h2 package not installed, LLM client falling back to HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.metrics = _ConnectionMetrics()
+        self.hedging = _HedgePolicy(
+            enabled=hedge_enabled,
+            percentile=hedge_percentile,
+            min_delay_ms=hedge_min_delay_ms,
+            max_rate=hedge_max_rate,
+            min_samples=hedge_min_samples
+        )
+        self.http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=self.limits,
+            timeout=self.timeout,
+            event_hooks={"request": [self.metrics.on_request], "response": [self.metrics.on_response]}
+        )
+
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=self.http_client,
+            timeout=self.timeout,
+            max_retries=max_retries
+        )
         # FIX #8: Build ChatOpenAI once and reuse it — avoids object reconstruction per message
         self._chat_model = ChatOpenAI(
             model=self.default_model,
-            api_key=settings.openai_api_key,
+            api_key=api_key,
+            base_url=base_url,
+            http_async_client=self.http_client,
+            timeout=self.timeout,
+            max_retries=max_retries,
         )
 
+    def stats(self) -> Dict:
+        return {
+            "base_url": self.base_url or "https://api.openai.com/v1",
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "connect_timeout": self.timeout.connect,
+            "read_timeout": self.timeout.read,
+            **self.metrics.to_dict(),
+            "hedging": self.hedging.to_dict(),
+        }
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
     async def create_completion(
         self,
         messages: List[Dict[str, str]],
@@ -47,6 +296,7 @@ class LLMClient(AbstractLLMClient):
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        usage_callback: Optional[Callable[[Any], None]] = None,
         **kwargs
     ) -> AsyncIterator[str]:
         params = {
@@ -58,12 +308,95 @@ class LLMClient(AbstractLLMClient):
         
         if max_tokens is not None:
             params["max_completion_tokens"] = max_tokens
+        if usage_callback is not None:
+            # Usage arrives in a final chunk with no choices
+            params["stream_options"] = {"include_usage": True}
+
+        stream, first_chunks, remaining = await self._open_hedged_stream(params)
+        try:
+            for chunk in first_chunks:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if usage_callback is not None and chunk.usage is not None:
+                    usage_callback(chunk.usage)
+            if remaining is not None:
+                async for chunk in remaining:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if usage_callback is not None and chunk.usage is not None:
+                        usage_callback(chunk.usage)
+        finally:
+            await stream.close()
 
+    async def _first_token(self, params: Dict) -> tuple:
+        """
+        Open a stream and read up to its first content or tool-call chunk.
+        Returns (stream, chunks read so far, iterator or None if it ended, ttft_ms).
+        """
+        started = time.perf_counter()
         stream = await self.client.chat.completions.create(**params)
-        
-        async for chunk in stream:
-            if chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        iterator = stream.__aiter__()
+        chunks = []
+        try:
+            while True:
+                try:
+                    chunk = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return stream, chunks, None, (time.perf_counter() - started) * 1000.0
+                chunks.append(chunk)
+                delta = chunk.choices[0].delta if chunk.choices else None
+                if delta is not None and (delta.content or delta.tool_calls):
+                    return stream, chunks, iterator, (time.perf_counter() - started) * 1000.0
+        except BaseException:
+            # Cancelled as the losing hedge, or failed: release the connection
+            await stream.close()
+            raise
+
+    async def _open_hedged_stream(self, params: Dict) -> tuple:
+        """Start the stream, hedging it once if the first token is late"""
+        model = params["model"]
+        started = time.perf_counter()
+        primary = asyncio.create_task(self._first_token(params))
+        deadline = self.hedging.deadline(model)
+        try:
+            if deadline is not None:
+                await asyncio.wait({primary}, timeout=deadline)
+            if deadline is None or primary.done() or not self.hedging.allow():
+                stream, chunks, remaining, ttft_ms = await primary
+                self.hedging.record(model, ttft_ms, hedged=False, hedge_won=False)
+                return stream, chunks, remaining
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+
+        hedge_delay_ms = (time.perf_counter() - started) * 1000.0
+        hedge = asyncio.create_task(self._first_token(params))
+        pending = {primary, hedge}
+        winner, error = None, None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif winner is None:
+                        winner = task
+                    else:
+                        # Both produced a token in the same tick; keep one
+                        await task.result()[0].close()
+        finally:
+            for task in pending:
+                task.cancel()
+        if winner is None:
+            raise error
+
+        stream, chunks, remaining, ttft_ms = winner.result()
+        if winner is hedge:
+            # The user waited from the primary's start; recording the hedge's own
+            # TTFT would bias the samples low exactly when stalls happen
+            ttft_ms += hedge_delay_ms
+        self.hedging.record(model, ttft_ms, hedged=True, hedge_won=winner is hedge)
+        return stream, chunks, remaining
 
     async def create_embedding(
         self,
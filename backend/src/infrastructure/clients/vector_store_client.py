@@ -1,89 +1,701 @@
 """Qdrant vector store client implementation"""
-from typing import List, Dict, Optional
+import heapq
+import itertools
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
 from qdrant_client import QdrantClient
-from qdrant_client.models import PointStruct, VectorParams, Distance
+from qdrant_client.models import (
+    PointStruct,
+    VectorParams,
+    Distance,
+    SparseVectorParams,
+    SparseVector,
+    Modifier,
+    Prefetch,
+    FusionQuery,
+    Fusion,
+    Filter,
+    FieldCondition,
+    MatchValue,
+    FilterSelector,
+    PointIdsList,
+    HnswConfigDiff,
+    KeywordIndexParams,
+    OverwritePayloadOperation,
+    SetPayload,
+    CreateAlias,
+    CreateAliasOperation,
+    DeleteAlias,
+    DeleteAliasOperation,
+)
 from src.configs.config import load_settings
 from src.domain.abstractions.clients.abstract_vector_store_client import AbstractVectorStoreClient
 from src.domain.entities.vector_search_result import VectorSearchResult
+from src.infrastructure.utils.payload_schema import SEARCH_PAYLOAD_FIELDS, decode_payload, upgrade_payload
 
 
 class VectorStoreClient(AbstractVectorStoreClient):
-    """Qdrant implementation of vector store client"""
-    
+    """
+    Qdrant implementation of vector store client.
+
+    ``collection_name`` arguments are the tenant's logical collection. In the
+    default ``per_tenant`` mode that is the physical Qdrant collection. In
+    ``shared`` mode (VECTOR_STORE_MODE=shared) every tenant lives in one
+    collection, tagged with a ``tenant`` payload field that carries a keyword
+    tenant index, and every operation is filtered on it.
+
+    In per-tenant mode a tenant's name is a Qdrant alias pointing at a
+    versioned collection (``<tenant>__v<unix ms>``). Rebuilds fill a new
+    version and swap the alias, so queries never see a half-written index.
+    Collections from before aliases were introduced are served under their
+    own name until their first rebuild.
+    """
+
+    SPARSE_VECTOR_NAME = "bm25"
+    # Candidates fetched from each retriever before RRF fusion, per result requested
+    HYBRID_PREFETCH_FACTOR = 4
+    TENANT_FIELD = "tenant"
+    SHARED_MODE = "shared"
+    VERSION_SEPARATOR = "__v"
+    BUILD_FIELD = "build"
+    # Bumped whenever this process creates, swaps or deletes a collection or
+    # alias, so other clients in the process can drop what they cached
+    topology_version = 0
+
     def __init__(self):
         settings = load_settings()
         self.client = QdrantClient(
             url=settings.qdrant_cluster_endpoint,
             api_key=settings.qdrant_api_key
         )
+        self.upsert_batch_size = settings.qdrant_upsert_batch_size
+        self.upsert_parallelism = settings.qdrant_upsert_parallelism
+        self.upsert_max_retries = settings.qdrant_upsert_max_retries
+        self.shared_mode = settings.vector_store_mode == self.SHARED_MODE
+        self.shared_collection_name = settings.shared_collection_name
+        self.fanout_concurrency = settings.qdrant_fanout_concurrency
+        self.fanout_timeout = settings.qdrant_fanout_timeout
+        self.collection_list_ttl = settings.qdrant_collection_list_ttl
+        self.keep_collection_versions = settings.qdrant_keep_collection_versions
+        self.stale_build_seconds = settings.qdrant_stale_build_seconds
+        # collection name -> whether it was created with the sparse BM25 vector
+        self._sparse_support: Dict[str, bool] = {}
+        self._collection_names: Optional[List[str]] = None
+        self._live_collections_map: Optional[Dict[str, str]] = None
+        self._collection_names_at = 0.0
+
+    def _resolve(self, collection_name: str) -> Tuple[str, Optional[Filter]]:
+        """Map a tenant's logical collection to (physical collection, tenant filter)"""
+        if self.shared_mode:
+            return self.shared_collection_name, self._tenant_filter(collection_name)
+        return collection_name, None
+
+    @classmethod
+    def _tenant_filter(cls, tenant: str) -> Filter:
+        return Filter(must=[FieldCondition(key=cls.TENANT_FIELD, match=MatchValue(value=tenant))])
+
+    @staticmethod
+    def _shared_point_id(tenant: str, point_id) -> str:
+        """Point ids must be unique across tenants once they share a collection"""
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{tenant}/{point_id}"))
+
+    @classmethod
+    def _upload_point_id(cls, tenant: str, ids: Optional[List], index: int, shared: bool):
+        """
+        Id a point is stored under; the sync and async clients must agree so a
+        tenant written by one can be synced or deleted by the other. Caller
+        ids are content-derived and already tenant-unique, so they are kept
+        verbatim; positional ids are namespaced by tenant in a shared collection.
+        """
+        if ids:
+            return ids[index]
+        return cls._shared_point_id(tenant, index) if shared else index
+
+    @classmethod
+    def _versioned_name(cls, tenant: str, version: int) -> str:
+        return f"{tenant}{cls.VERSION_SEPARATOR}{version}"
+
+    @classmethod
+    def _parse_version(cls, name: str) -> Optional[Tuple[str, int]]:
+        """(tenant, version) for a versioned collection name, None otherwise"""
+        tenant, separator, version = name.rpartition(cls.VERSION_SEPARATOR)
+        if not separator or not tenant or not version.isdigit():
+            return None
+        return tenant, int(version)
+
+    @classmethod
+    def _map_live_collections(cls, collection_names: List[str], aliases) -> Dict[str, str]:
+        """Tenant name -> physical collection serving it (alias target or pre-alias collection)"""
+        live = {alias.alias_name: alias.collection_name for alias in aliases}
+        for name in collection_names:
+            if name not in live and cls._parse_version(name) is None:
+                live[name] = name
+        return live
+
+    def _refresh_collection_names(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if force or self._collection_names is None or now - self._collection_names_at >= self.collection_list_ttl:
+            names = [col.name for col in self.client.get_collections().collections]
+            aliases = self.client.get_aliases().aliases
+            self._collection_names = names
+            self._live_collections_map = self._map_live_collections(names, aliases)
+            self._collection_names_at = now
+
+    def _physical_collection_names(self) -> List[str]:
+        """Physical collection names, cached for QDRANT_COLLECTION_LIST_TTL seconds"""
+        self._refresh_collection_names()
+        return self._collection_names
+
+    def _live_collections(self) -> Dict[str, str]:
+        """Tenant name -> serving physical collection, cached like the collection list"""
+        self._refresh_collection_names()
+        return self._live_collections_map
+
+    def _serving_collection(self, collection_name: str) -> Optional[str]:
+        """Physical collection behind a tenant name, re-reading Qdrant once on a miss"""
+        live = self._live_collections()
+        if collection_name not in live:
+            self._refresh_collection_names(force=True)
+            live = self._live_collections_map
+        return live.get(collection_name)
+
+    def _forget_collection_names(self) -> None:
+        self._collection_names = None
+        self._live_collections_map = None
+        VectorStoreClient.topology_version += 1
+
+    @staticmethod
+    def _push_top_k(heap: List, counter, result: VectorSearchResult, limit: int) -> None:
+        """Keep the best `limit` results in a min-heap keyed by score"""
+        entry = (result.score, next(counter), result)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[0] > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+
+    @staticmethod
+    def _drain_top_k(heap: List) -> List[VectorSearchResult]:
+        return [result for _, _, result in sorted(heap, key=lambda entry: (-entry[0], entry[1]))]
 
     def ensure_collection(
-        self, 
-        collection_name: str, 
-        vector_size: int = 1536, 
-        distance: str = "Cosine"
+        self,
+        collection_name: str,
+        vector_size: int = 1536,
+        distance: str = "Cosine",
+        sparse: bool = False
     ) -> None:
         """Ensure a collection exists, create if it doesn't"""
+        if self.shared_mode:
+            self.ensure_shared_collection(vector_size=vector_size, distance=distance)
+            return
         try:
             if not self.client.collection_exists(collection_name=collection_name):
                 distance_metric = Distance.COSINE if distance == "Cosine" else Distance.EUCLID
+                sparse_config = (
+                    {self.SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)}
+                    if sparse else None
+                )
                 self.client.create_collection(
                     collection_name=collection_name,
-                    vectors_config=VectorParams(size=vector_size, distance=distance_metric)
+                    vectors_config=VectorParams(size=vector_size, distance=distance_metric),
+                    sparse_vectors_config=sparse_config
                 )
+                self._sparse_support[collection_name] = sparse
+                self._forget_collection_names()
         except Exception as e:
             raise Exception(f"Error ensuring collection {collection_name}: {str(e)}")
 
+    def ensure_shared_collection(self, vector_size: int = 1536, distance: str = "Cosine") -> None:
+        """
+        Ensure the shared multi-tenant collection exists.
+
+        HNSW links are built per tenant (payload_m) instead of globally (m=0),
+        and the tenant index co-locates each tenant's points on disk.
+        """
+        name = self.shared_collection_name
+        try:
+            if self.client.collection_exists(collection_name=name):
+                return
+            distance_metric = Distance.COSINE if distance == "Cosine" else Distance.EUCLID
+            self.client.create_collection(
+                collection_name=name,
+                vectors_config=VectorParams(size=vector_size, distance=distance_metric),
+                sparse_vectors_config={self.SPARSE_VECTOR_NAME: SparseVectorParams(modifier=Modifier.IDF)},
+                hnsw_config=HnswConfigDiff(payload_m=16, m=0)
+            )
+            self.client.create_payload_index(
+                collection_name=name,
+                field_name=self.TENANT_FIELD,
+                field_schema=KeywordIndexParams(type="keyword", is_tenant=True)
+            )
+            self._sparse_support[name] = True
+            self._forget_collection_names()
+        except Exception as e:
+            raise Exception(f"Error ensuring shared collection {name}: {str(e)}")
+
+    def supports_sparse(self, collection_name: str) -> bool:
+        """Whether a physical collection carries the sparse BM25 vector (cached per collection)"""
+        if collection_name not in self._sparse_support:
+            info = self.client.get_collection(collection_name=collection_name)
+            sparse_vectors = info.config.params.sparse_vectors or {}
+            self._sparse_support[collection_name] = self.SPARSE_VECTOR_NAME in sparse_vectors
+        return self._sparse_support[collection_name]
+
+    @staticmethod
+    def _to_sparse_vector(weights: Dict[int, float]) -> SparseVector:
+        return SparseVector(indices=list(weights.keys()), values=list(weights.values()))
+
+    @staticmethod
+    def _to_result(hit, collection_name: Optional[str] = None) -> VectorSearchResult:
+        text, chunk_index, metadata = decode_payload(hit.payload or {})
+        if collection_name:
+            metadata["collection"] = collection_name
+        vector = hit.vector
+        if isinstance(vector, dict):
+            # Collections with a sparse vector return {"": dense, "bm25": sparse}
+            vector = vector.get("")
+        return VectorSearchResult(
+            text=text,
+            score=hit.score,
+            chunk_index=chunk_index,
+            metadata=metadata,
+            vector=vector
+        )
+
     def upload(
         self,
         collection_name: str,
         embeddings: List[List[float]],
         metadatas: List[Dict],
         ids: Optional[List[str]] = None,
-        vector_size: Optional[int] = None
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> str:
-        """Upload embeddings with metadata to a collection"""
+        """
+        Upload embeddings with metadata to a collection.
+
+        Points are sent in batches of QDRANT_UPSERT_BATCH_SIZE with at most
+        QDRANT_UPSERT_PARALLELISM batches in flight. Batches are acknowledged
+        without waiting for indexing (wait=False); the last batch is re-sent
+        with wait=True as a consistency barrier, since Qdrant applies updates
+        to a collection in order. progress_callback(uploaded, total) is
+        called after each acknowledged batch.
+
+        Without ids, points are numbered by position. Caller-supplied ids are
+        used verbatim, so in shared mode they must be unique across tenants.
+        """
+        physical_name, _ = self._resolve(collection_name)
         try:
-            if not self.client.collection_exists(collection_name=collection_name):
+            if not self.client.collection_exists(collection_name=physical_name):
                 self.ensure_collection(
-                    collection_name, 
-                    vector_size=vector_size or len(embeddings[0])
+                    collection_name,
+                    vector_size=vector_size or len(embeddings[0]),
+                    sparse=sparse_vectors is not None
                 )
 
-            points = []
-            for i, (vec, meta) in enumerate(zip(embeddings, metadatas)):
-                point_id = ids[i] if ids else i
-                points.append(PointStruct(id=point_id, vector=vec, payload=meta))
+            # Collections created before hybrid search only hold the dense vector
+            if sparse_vectors is not None and not self.supports_sparse(physical_name):
+                sparse_vectors = None
+
+            total = min(len(embeddings), len(metadatas))
+            starts = list(range(0, total, self.upsert_batch_size))
+            uploaded = 0
 
-            self.client.upsert(collection_name=collection_name, points=points)
+            def build_batch(start: int) -> List[PointStruct]:
+                points = []
+                for i in range(start, min(start + self.upsert_batch_size, total)):
+                    point_id = self._upload_point_id(collection_name, ids, i, self.shared_mode)
+                    payload = metadatas[i]
+                    if self.shared_mode:
+                        payload = {**payload, self.TENANT_FIELD: collection_name}
+                    vector = embeddings[i]
+                    if sparse_vectors is not None:
+                        vector = {"": vector, self.SPARSE_VECTOR_NAME: self._to_sparse_vector(sparse_vectors[i])}
+                    points.append(PointStruct(id=point_id, vector=vector, payload=payload))
+                return points
+
+            def send_batch(start: int) -> int:
+                points = build_batch(start)
+                self._upsert_with_retry(physical_name, points, wait=False)
+                return len(points)
+
+            with ThreadPoolExecutor(max_workers=self.upsert_parallelism) as executor:
+                for count in executor.map(send_batch, starts):
+                    uploaded += count
+                    if progress_callback:
+                        progress_callback(uploaded, total)
+
+            if starts:
+                self._upsert_with_retry(physical_name, build_batch(starts[-1]), wait=True)
             return collection_name
         except Exception as e:
             raise Exception(f"Error uploading to collection {collection_name}: {str(e)}")
 
+    def _upsert_with_retry(self, collection_name: str, points: List[PointStruct], wait: bool) -> None:
+        """Upsert one batch, retrying with exponential backoff"""
+        for attempt in range(self.upsert_max_retries + 1):
+            try:
+                self.client.upsert(collection_name=collection_name, points=points, wait=wait)
+                return
+            except Exception:
+                if attempt == self.upsert_max_retries:
+                    raise
+                time.sleep(0.5 * (2 ** attempt))
+
+    def rebuild_collection(
+        self,
+        collection_name: str,
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        ids: Optional[List[str]] = None,
+        vector_size: Optional[int] = None,
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """
+        Replace a tenant's points without exposing a partially written index.
+
+        Per-tenant mode uploads into a fresh versioned collection, atomically
+        points the tenant alias at it, then garbage-collects superseded
+        versions. A failed build is dropped and the live version keeps serving.
+        Returns the physical collection now serving the tenant.
+        """
+        def write(target: str, tag: Callable[[Dict], Dict]) -> None:
+            self.upload(
+                collection_name=target,
+                embeddings=embeddings,
+                metadatas=[tag(metadata) for metadata in metadatas],
+                ids=ids,
+                vector_size=vector_size,
+                sparse_vectors=sparse_vectors,
+                progress_callback=progress_callback
+            )
+
+        return self._replace_tenant(
+            collection_name,
+            vector_size=vector_size or len(embeddings[0]),
+            sparse=sparse_vectors is not None,
+            write=write
+        )
+
+    def restore_collection(
+        self,
+        collection_name: str,
+        batches: Iterable[Tuple[List[str], List[List[float]], List[Dict], Optional[List[Dict[int, float]]]]],
+        vector_size: int,
+        sparse: bool,
+        distance: str = "Cosine",
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> str:
+        """
+        Replace a tenant's points from a stream of (ids, dense, payloads, sparse)
+        batches, e.g. a snapshot, with the same blue/green swap as a rebuild.
+        progress_callback(restored) is called after each batch.
+        """
+        def write(target: str, tag: Callable[[Dict], Dict]) -> None:
+            restored = 0
+            for ids, embeddings, metadatas, sparse_vectors in batches:
+                self.upload(
+                    collection_name=target,
+                    embeddings=embeddings,
+                    metadatas=[tag(metadata) for metadata in metadatas],
+                    ids=ids,
+                    vector_size=vector_size,
+                    sparse_vectors=sparse_vectors if sparse else None
+                )
+                restored += len(ids)
+                if progress_callback:
+                    progress_callback(restored)
+
+        return self._replace_tenant(collection_name, vector_size, sparse, write, distance=distance)
+
+    def _replace_tenant(
+        self,
+        collection_name: str,
+        vector_size: int,
+        sparse: bool,
+        write: Callable[[str, Callable[[Dict], Dict]], None],
+        distance: str = "Cosine"
+    ) -> str:
+        """
+        Run write(target, tag) against a fresh build of a tenant and switch to it.
+
+        Per-tenant mode writes into a new version and swaps the alias. Shared
+        mode has no per-tenant collection to swap: tag() stamps every payload
+        with a build id and the tenant's points from earlier builds are deleted
+        once the new ones are acknowledged.
+        """
+        if self.shared_mode:
+            build_id = uuid.uuid4().hex
+            self.ensure_shared_collection(vector_size=vector_size, distance=distance)
+            write(collection_name, lambda metadata: {**metadata, self.BUILD_FIELD: build_id})
+            stale_filter = Filter(
+                must=self._tenant_filter(collection_name).must,
+                must_not=[FieldCondition(key=self.BUILD_FIELD, match=MatchValue(value=build_id))]
+            )
+            self.client.delete(
+                collection_name=self.shared_collection_name,
+                points_selector=FilterSelector(filter=stale_filter),
+                wait=True
+            )
+            return self.shared_collection_name
+
+        version_name = self._versioned_name(collection_name, int(time.time() * 1000))
+        try:
+            self.ensure_collection(version_name, vector_size=vector_size, distance=distance, sparse=sparse)
+            write(version_name, lambda metadata: metadata)
+            self._swap_alias(collection_name, version_name)
+        except Exception as e:
+            try:
+                self.client.delete_collection(collection_name=version_name)
+                self._sparse_support.pop(version_name, None)
+            except Exception as cleanup_error:
+                print(f"Warning: could not drop failed build {version_name}: {str(cleanup_error)}")
+            raise Exception(f"Error rebuilding collection {collection_name}: {str(e)}")
+
+        try:
+            self.gc_collection_versions(collection_name)
+        except Exception as e:
+            print(f"Warning: garbage collection for {collection_name} failed: {str(e)}")
+        return version_name
+
+    def collection_params(self, collection_name: str) -> Optional[Tuple[int, str, bool]]:
+        """(vector size, distance, has sparse vector) of the collection serving a tenant"""
+        physical_name, _ = self._resolve(collection_name)
+        if not self.shared_mode:
+            physical_name = self._serving_collection(collection_name)
+        if physical_name is None or not self.client.collection_exists(collection_name=physical_name):
+            return None
+        info = self.client.get_collection(collection_name=physical_name)
+        dense_params = info.config.params.vectors
+        distance = "Cosine" if dense_params.distance == Distance.COSINE else "Euclid"
+        return dense_params.size, distance, self.SPARSE_VECTOR_NAME in (info.config.params.sparse_vectors or {})
+
+    def iter_points(
+        self,
+        collection_name: str
+    ) -> Iterator[List[Tuple[Union[int, str], List[float], Optional[Dict[int, float]], Dict]]]:
+        """
+        Stream a tenant's points as batches of (id, dense, sparse, payload).
+        Tenancy and build bookkeeping fields are stripped from payloads.
+        """
+        physical_name, tenant_filter = self._resolve(collection_name)
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=physical_name,
+                scroll_filter=tenant_filter,
+                limit=self.upsert_batch_size,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True
+            )
+            batch = []
+            for record in records:
+                vector = record.vector
+                sparse = None
+                if isinstance(vector, dict):
+                    sparse_vector = vector.get(self.SPARSE_VECTOR_NAME)
+                    if sparse_vector is not None:
+                        sparse = dict(zip(sparse_vector.indices, sparse_vector.values))
+                    vector = vector.get("")
+                payload = {
+                    key: value for key, value in (record.payload or {}).items()
+                    if key not in (self.TENANT_FIELD, self.BUILD_FIELD)
+                }
+                batch.append((record.id, vector, sparse, payload))
+            if batch:
+                yield batch
+            if offset is None:
+                break
+
+    def point_ids(self, collection_name: str) -> Set[Union[int, str]]:
+        """
+        IDs of every point a tenant currently serves (empty if it has none),
+        in Qdrant's own type: collections written before content-derived ids
+        hold integer ids, which must be deleted as integers.
+        """
+        physical_name, tenant_filter = self._resolve(collection_name)
+        try:
+            if self.shared_mode:
+                if not self.client.collection_exists(collection_name=physical_name):
+                    return set()
+            else:
+                physical_name = self._serving_collection(collection_name)
+                if physical_name is None:
+                    return set()
+
+            point_ids: Set[Union[int, str]] = set()
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=physical_name,
+                    scroll_filter=tenant_filter,
+                    limit=self.upsert_batch_size * 4,
+                    offset=offset,
+                    with_payload=False,
+                    with_vectors=False
+                )
+                point_ids.update(record.id for record in records)
+                if offset is None:
+                    break
+            return point_ids
+        except Exception as e:
+            raise Exception(f"Error listing points of {collection_name}: {str(e)}")
+
+    def sync_collection(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: List[List[float]],
+        metadatas: List[Dict],
+        stale_ids: List[Union[int, str]],
+        sparse_vectors: Optional[List[Dict[int, float]]] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """
+        Apply a diff to the collection serving a tenant in place: upsert the
+        given (new or changed) points and delete stale_ids. With content-derived
+        ids, re-running a sync is idempotent.
+        """
+        target = collection_name
+        if not self.shared_mode:
+            target = self._serving_collection(collection_name)
+            if target is None:
+                raise Exception(f"Collection {collection_name} does not exist.")
+        try:
+            if ids:
+                self.upload(
+                    collection_name=target,
+                    embeddings=embeddings,
+                    metadatas=metadatas,
+                    ids=ids,
+                    sparse_vectors=sparse_vectors,
+                    progress_callback=progress_callback
+                )
+            physical_name, _ = self._resolve(target)
+            for start in range(0, len(stale_ids), self.upsert_batch_size):
+                self.client.delete(
+                    collection_name=physical_name,
+                    points_selector=PointIdsList(points=stale_ids[start:start + self.upsert_batch_size]),
+                    wait=True
+                )
+            return target
+        except Exception as e:
+            raise Exception(f"Error syncing collection {collection_name}: {str(e)}")
+
+    def _swap_alias(self, collection_name: str, version_name: str) -> None:
+        """Point the tenant alias at version_name in one atomic alias update"""
+        aliases = {alias.alias_name for alias in self.client.get_aliases().aliases}
+        operations = []
+        if collection_name in aliases:
+            operations.append(DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection_name)))
+        elif self.client.collection_exists(collection_name=collection_name):
+            # A pre-alias collection owns the name the alias needs; it can only be
+            # dropped first, so this one-time switch leaves a gap of one round-trip
+            self.client.delete_collection(collection_name=collection_name)
+        operations.append(CreateAliasOperation(
+            create_alias=CreateAlias(collection_name=version_name, alias_name=collection_name)
+        ))
+        self.client.update_collection_aliases(change_aliases_operations=operations)
+        self._sparse_support.pop(collection_name, None)
+        self._forget_collection_names()
+
+    def _tenant_versions(self, collection_name: str) -> List[Tuple[int, str]]:
+        """(version, physical name) of every versioned collection of a tenant, oldest first"""
+        versions = []
+        for col in self.client.get_collections().collections:
+            parsed = self._parse_version(col.name)
+            if parsed and parsed[0] == collection_name:
+                versions.append((parsed[1], col.name))
+        return sorted(versions)
+
+    def gc_collection_versions(self, collection_name: Optional[str] = None) -> List[str]:
+        """
+        Delete versions a tenant (or every tenant) no longer needs.
+
+        Keeps the version behind the alias and the QDRANT_KEEP_COLLECTION_VERSIONS
+        most recent older ones. Versions newer than the live one are builds in
+        progress; they are only removed once older than QDRANT_STALE_BUILD_SECONDS
+        (a crashed build). Returns the deleted collection names.
+        """
+        if self.shared_mode:
+            return []
+        aliases = {alias.alias_name: alias.collection_name for alias in self.client.get_aliases().aliases}
+        by_tenant: Dict[str, List[Tuple[int, str]]] = {}
+        for col in self.client.get_collections().collections:
+            parsed = self._parse_version(col.name)
+            if parsed is None or (collection_name is not None and parsed[0] != collection_name):
+                continue
+            by_tenant.setdefault(parsed[0], []).append((parsed[1], col.name))
+
+        stale_before = int((time.time() - self.stale_build_seconds) * 1000)
+        deleted = []
+        for tenant, versions in by_tenant.items():
+            live = self._parse_version(aliases[tenant]) if tenant in aliases else None
+            live_version = live[1] if live else None
+            older = sorted(
+                (version for version in versions if live_version is not None and version[0] < live_version),
+                reverse=True
+            )
+            doomed = older[self.keep_collection_versions:]
+            doomed += [
+                version for version in versions
+                if (live_version is None or version[0] > live_version) and version[0] < stale_before
+            ]
+            for _, physical_name in doomed:
+                self.client.delete_collection(collection_name=physical_name)
+                self._sparse_support.pop(physical_name, None)
+                deleted.append(physical_name)
+
+        if deleted:
+            self._forget_collection_names()
+        return deleted
+
     def search_chunks(
         self,
         collection_name: str,
         query_embedding: List[float],
-        limit: int = 5
+        limit: int = 5,
+        query_sparse: Optional[Dict[int, float]] = None,
+        with_vectors: bool = False
     ) -> List[VectorSearchResult]:
-        """Search for similar chunks in a collection"""
+        """Search for similar chunks in a collection, fusing dense and BM25 hits with RRF when possible"""
+        physical_name, tenant_filter = self._resolve(collection_name)
         try:
-            search_results = self.client.query_points(
-                collection_name=collection_name,
-                query=query_embedding,
-                limit=limit
-            )
-            
-            results = []
-            for hit in search_results.points:
-                results.append(VectorSearchResult(
-                    text=hit.payload.get("original_text") or hit.payload.get("text") or "",
-                    score=hit.score,
-                    chunk_index=hit.payload.get("chunk_index"),
-                    metadata=hit.payload
-                ))
-            
-            return results
+            if query_sparse and self.supports_sparse(physical_name):
+                prefetch_limit = limit * self.HYBRID_PREFETCH_FACTOR
+                search_results = self.client.query_points(
+                    collection_name=physical_name,
+                    prefetch=[
+                        Prefetch(query=query_embedding, filter=tenant_filter, limit=prefetch_limit),
+                        Prefetch(
+                            query=self._to_sparse_vector(query_sparse),
+                            using=self.SPARSE_VECTOR_NAME,
+                            filter=tenant_filter,
+                            limit=prefetch_limit
+                        ),
+                    ],
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    query_filter=tenant_filter,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    with_vectors=with_vectors,
+                    limit=limit
+                )
+            else:
+                search_results = self.client.query_points(
+                    collection_name=physical_name,
+                    query=query_embedding,
+                    query_filter=tenant_filter,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    with_vectors=with_vectors,
+                    limit=limit
+                )
+
+            return [self._to_result(hit) for hit in search_results.points]
         except Exception as e:
             raise Exception(f"Error searching chunks in {collection_name}: {str(e)}")
 
@@ -94,48 +706,264 @@ class VectorStoreClient(AbstractVectorStoreClient):
     ) -> List[VectorSearchResult]:
         """Search across all collections"""
         try:
-            results = []
-            collections_response = self.client.get_collections()
-            collection_names = [col.name for col in collections_response.collections]
-
-            for collection_name in collection_names:
+            if self.shared_mode:
                 search_results = self.client.query_points(
-                    collection_name=collection_name,
+                    collection_name=self.shared_collection_name,
                     query=query_embedding,
+                    with_payload=SEARCH_PAYLOAD_FIELDS + [self.TENANT_FIELD],
                     limit=limit
                 )
-                for hit in search_results.points:
-                    # Add collection name to metadata
-                    metadata = dict(hit.payload)
-                    metadata["collection"] = collection_name
-                    
-                    results.append(VectorSearchResult(
-                        text=hit.payload.get("original_text") or hit.payload.get("text") or "",
-                        score=hit.score,
-                        chunk_index=hit.payload.get("chunk_index"),
-                        metadata=metadata
-                    ))
+                return [
+                    self._to_result(hit, hit.payload.get(self.TENANT_FIELD))
+                    for hit in search_results.points
+                ]
+
+            def search_one(collection_name: str):
+                return self.client.query_points(
+                    collection_name=collection_name,
+                    query=query_embedding,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    limit=limit,
+                    timeout=max(1, int(self.fanout_timeout))
+                )
+
+            # Fan out with at most QDRANT_FANOUT_CONCURRENCY searches in flight and
+            # merge hits into a size-`limit` heap as each collection answers.
+            # A slow or failing collection is skipped rather than failing the search.
+            heap: List = []
+            counter = itertools.count()
+            with ThreadPoolExecutor(max_workers=self.fanout_concurrency) as executor:
+                futures = {
+                    executor.submit(search_one, physical_name): collection_name
+                    for collection_name, physical_name in self._live_collections().items()
+                }
+                for future in as_completed(futures):
+                    collection_name = futures[future]
+                    try:
+                        search_results = future.result()
+                    except Exception as e:
+                        print(f"Warning: search in collection {collection_name} failed: {str(e)}")
+                        continue
+                    for hit in search_results.points:
+                        self._push_top_k(heap, counter, self._to_result(hit, collection_name), limit)
 
-            results.sort(key=lambda x: x.score, reverse=True)
-            return results[:limit]
+            return self._drain_top_k(heap)
         except Exception as e:
             raise Exception(f"Error searching chunks: {str(e)}")
 
     def delete_collection(self, collection_name: str) -> Dict:
-        """Delete a collection"""
+        """Delete a collection (in shared mode, delete the tenant's points)"""
         try:
-            if self.client.collection_exists(collection_name):
-                self.client.delete_collection(collection_name=collection_name)
-                return {"success": True, "message": f"Collection {collection_name} deleted."}
-            else:
+            if self.shared_mode:
+                self.client.delete(
+                    collection_name=self.shared_collection_name,
+                    points_selector=FilterSelector(filter=self._tenant_filter(collection_name))
+                )
+                return {"success": True, "message": f"Points of tenant {collection_name} deleted."}
+            if not self._drop_tenant_collections(collection_name):
                 raise Exception(f"Collection {collection_name} does not exist.")
+            return {"success": True, "message": f"Collection {collection_name} deleted."}
         except Exception as e:
             raise Exception(f"Error deleting collection {collection_name}: {str(e)}")
 
+    def _drop_tenant_collections(self, collection_name: str) -> bool:
+        """Remove a tenant's alias, every version and any pre-alias collection"""
+        aliases = {alias.alias_name for alias in self.client.get_aliases().aliases}
+        versions = self._tenant_versions(collection_name)
+        legacy = collection_name not in aliases and self.client.collection_exists(collection_name)
+        if collection_name not in aliases and not versions and not legacy:
+            return False
+        if collection_name in aliases:
+            self.client.update_collection_aliases(change_aliases_operations=[
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=collection_name))
+            ])
+        for _, physical_name in versions:
+            self.client.delete_collection(collection_name=physical_name)
+            self._sparse_support.pop(physical_name, None)
+        if legacy:
+            self.client.delete_collection(collection_name=collection_name)
+        self._sparse_support.pop(collection_name, None)
+        self._forget_collection_names()
+        return True
+
     def list_collections(self) -> List[str]:
-        """List all available collections"""
+        """List all available collections (in shared mode, the tenants of the shared collection)"""
         try:
-            collections_response = self.client.get_collections()
-            return [col.name for col in collections_response.collections]
+            if self.shared_mode:
+                if not self.client.collection_exists(self.shared_collection_name):
+                    return []
+                facets = self.client.facet(
+                    collection_name=self.shared_collection_name,
+                    key=self.TENANT_FIELD,
+                    limit=100000
+                )
+                return [hit.value for hit in facets.hits]
+            self._refresh_collection_names(force=True)
+            return sorted(self._live_collections_map)
         except Exception as e:
             raise Exception(f"Error listing collections: {str(e)}")
+
+    def fetch_points(
+        self,
+        collection_name: str,
+        max_points: int
+    ) -> Optional[List[Tuple[List[float], Optional[Dict[int, float]], Dict]]]:
+        """
+        Return every point of a collection as (dense, sparse, payload), or None
+        when it holds more than max_points (or does not exist).
+        """
+        physical_name, tenant_filter = self._resolve(collection_name)
+        try:
+            if self.shared_mode:
+                if not self.client.collection_exists(collection_name=physical_name):
+                    return None
+            elif self._serving_collection(collection_name) is None:
+                return None
+            total = self.client.count(
+                collection_name=physical_name,
+                count_filter=tenant_filter,
+                exact=True
+            ).count
+            if total == 0 or total > max_points:
+                return None
+
+            points = []
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=physical_name,
+                    scroll_filter=tenant_filter,
+                    limit=self.upsert_batch_size,
+                    offset=offset,
+                    with_payload=SEARCH_PAYLOAD_FIELDS,
+                    with_vectors=True
+                )
+                for record in records:
+                    vector = record.vector
+                    sparse = None
+                    if isinstance(vector, dict):
+                        sparse_vector = vector.get(self.SPARSE_VECTOR_NAME)
+                        if sparse_vector is not None:
+                            sparse = dict(zip(sparse_vector.indices, sparse_vector.values))
+                        vector = vector.get("")
+                    points.append((vector, sparse, record.payload or {}))
+                if offset is None:
+                    break
+            return points
+        except Exception as e:
+            raise Exception(f"Error fetching points from {collection_name}: {str(e)}")
+
+    def migrate_to_shared(
+        self,
+        collection_names: Optional[List[str]] = None,
+        delete_source: bool = False,
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Copy per-tenant collections into the shared collection.
+
+        Each source collection becomes a tenant of the same name. Vectors are
+        copied as stored (no re-embedding). Returns {collection: points copied}.
+        """
+        shared_name = self.shared_collection_name
+        self._refresh_collection_names(force=True)
+        live = self._live_collections_map
+        if collection_names is None:
+            collection_names = [name for name in live if name != shared_name]
+
+        copied: Dict[str, int] = {}
+        for source in collection_names:
+            physical_source = live.get(source, source)
+            info = self.client.get_collection(collection_name=physical_source)
+            dense_params = info.config.params.vectors
+            self.ensure_shared_collection(
+                vector_size=dense_params.size,
+                distance="Cosine" if dense_params.distance == Distance.COSINE else "Euclid"
+            )
+
+            count = 0
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=source,
+                    limit=self.upsert_batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=True
+                )
+                if records:
+                    points = [
+                        PointStruct(
+                            # Content-derived (string) ids are tenant-unique already
+                            id=record.id if isinstance(record.id, str) else self._shared_point_id(source, record.id),
+                            vector=record.vector,
+                            payload={**(record.payload or {}), self.TENANT_FIELD: source}
+                        )
+                        for record in records
+                    ]
+                    self._upsert_with_retry(shared_name, points, wait=True)
+                    count += len(points)
+                    if progress_callback:
+                        progress_callback(source, count)
+                if offset is None:
+                    break
+
+            copied[source] = count
+            if delete_source:
+                self._drop_tenant_collections(source)
+
+        return copied
+
+    def migrate_payload_schema(
+        self,
+        collection_names: Optional[List[str]] = None,
+        store_texts: Optional[Callable[[Dict[str, str]], None]] = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Rewrite legacy payloads in place to the current compact layout.
+
+        When store_texts is given, chunk texts are handed to it ({hash: text})
+        and dropped from the payload. Vectors are untouched. Returns
+        {collection: points rewritten}.
+        """
+        if collection_names is None:
+            collection_names = self._physical_collection_names()
+
+        rewritten: Dict[str, int] = {}
+        for collection_name in collection_names:
+            count = 0
+            offset = None
+            while True:
+                records, offset = self.client.scroll(
+                    collection_name=collection_name,
+                    limit=self.upsert_batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+                operations = []
+                texts_by_hash: Dict[str, str] = {}
+                for record in records:
+                    payload = record.payload or {}
+                    upgraded = upgrade_payload(payload, store_text=store_texts is None)
+                    if upgraded is None:
+                        continue
+                    if store_texts is not None:
+                        text, _, _ = decode_payload(payload)
+                        texts_by_hash[upgraded["h"]] = text
+                    operations.append(OverwritePayloadOperation(
+                        overwrite_payload=SetPayload(payload=upgraded, points=[record.id])
+                    ))
+                if texts_by_hash:
+                    store_texts(texts_by_hash)
+                if operations:
+                    self.client.batch_update_points(collection_name=collection_name, update_operations=operations)
+                    count += len(operations)
+                    if progress_callback:
+                        progress_callback(collection_name, count)
+                if offset is None:
+                    break
+            rewritten[collection_name] = count
+
+        return rewritten
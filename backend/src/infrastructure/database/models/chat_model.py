@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.infrastructure.database.config import Base
@@ -11,6 +11,8 @@ class ChatModel(Base):
     client_id = Column(String, ForeignKey("clients.client_id", ondelete="CASCADE"), nullable=False, index=True)
     ip_address = Column(String, nullable=False)
     title = Column(String, nullable=True)
+    summary = Column(Text, nullable=True)
+    summarized_messages = Column(Integer, nullable=False, server_default="0", default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
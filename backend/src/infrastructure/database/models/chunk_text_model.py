@@ -0,0 +1,13 @@
+"""Chunk text ORM model - SQLAlchemy implementation"""
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+from src.infrastructure.database.config import Base
+
+
+class ChunkTextModel(Base):
+    """Chunk text keyed by its sha256, referenced from compact Qdrant payloads"""
+    __tablename__ = "chunk_texts"
+
+    text_hash = Column(String(64), primary_key=True)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -15,6 +15,9 @@ class ClientModel(Base):
     api_key_hash = Column(String(255), unique=True, nullable=True, index=True)
     tools = Column(sa.JSON, nullable=True)
     system_prompt = Column(sa.Text, nullable=True)
+    rerank_enabled = Column(sa.Boolean, nullable=False, server_default=sa.false(), default=False)
+    prompt_token_budget = Column(sa.Integer, nullable=True)
+    model_tier = Column(sa.String(16), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -19,6 +19,8 @@ class ChatRepository(IChatRepository):
             client_id=model.client_id,
             ip_address=model.ip_address,
             title=model.title,
+            summary=model.summary,
+            summarized_messages=model.summarized_messages or 0,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -29,6 +31,8 @@ class ChatRepository(IChatRepository):
             client_id=entity.client_id,
             ip_address=entity.ip_address,
             title=entity.title,
+            summary=entity.summary,
+            summarized_messages=entity.summarized_messages,
             created_at=entity.created_at,
             updated_at=entity.updated_at
         )
@@ -58,6 +62,18 @@ class ChatRepository(IChatRepository):
             return self._to_entity(model)
         raise ValueError(f"Chat with ID {chat.chat_id} not found")
     
+    def update_summary(self, chat_id: str, summary: str, summarized_messages: int) -> None:
+        # Leaves updated_at alone: summarizing is not chat activity
+        self.db.query(ChatModel).filter(ChatModel.chat_id == chat_id).update(
+            {
+                ChatModel.summary: summary,
+                ChatModel.summarized_messages: summarized_messages,
+                ChatModel.updated_at: ChatModel.updated_at,
+            },
+            synchronize_session=False
+        )
+        self.db.commit()
+    
     def delete(self, chat_id: str) -> bool:
         model = self.db.query(ChatModel).filter(ChatModel.chat_id == chat_id).first()
         if model:
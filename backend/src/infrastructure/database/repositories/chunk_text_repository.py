@@ -0,0 +1,31 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List
+
+from src.domain.abstractions.repositories.chunk_text_repository import IChunkTextRepository
+from src.infrastructure.database.models.chunk_text_model import ChunkTextModel
+
+
+class ChunkTextRepository(IChunkTextRepository):
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_many(self, texts_by_hash: Dict[str, str]) -> None:
+        if not texts_by_hash:
+            return
+        existing = {
+            row.text_hash
+            for row in self.db.query(ChunkTextModel.text_hash)
+            .filter(ChunkTextModel.text_hash.in_(list(texts_by_hash.keys())))
+            .all()
+        }
+        for text_hash, text in texts_by_hash.items():
+            if text_hash not in existing:
+                self.db.add(ChunkTextModel(text_hash=text_hash, text=text))
+        self.db.commit()
+
+    def get_many(self, text_hashes: List[str]) -> Dict[str, str]:
+        if not text_hashes:
+            return {}
+        models = self.db.query(ChunkTextModel).filter(ChunkTextModel.text_hash.in_(text_hashes)).all()
+        return {model.text_hash: model.text for model in models}
@@ -21,6 +21,9 @@ class ClientRepository(IClientRepository):
             api_key_hash=model.api_key_hash,
             tools=model.tools,
             system_prompt=model.system_prompt,
+            rerank_enabled=bool(model.rerank_enabled),
+            prompt_token_budget=model.prompt_token_budget,
+            model_tier=model.model_tier,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -34,6 +37,9 @@ class ClientRepository(IClientRepository):
             api_key_hash=entity.api_key_hash,
             tools=entity.tools,
             system_prompt=entity.system_prompt,
+            rerank_enabled=entity.rerank_enabled,
+            prompt_token_budget=entity.prompt_token_budget,
+            model_tier=entity.model_tier,
             created_at=entity.created_at,
             updated_at=entity.updated_at
         )
@@ -80,6 +86,9 @@ class ClientRepository(IClientRepository):
             model.client_url = client.client_url
             model.tools = client.tools
             model.system_prompt = client.system_prompt
+            model.rerank_enabled = client.rerank_enabled
+            model.prompt_token_budget = client.prompt_token_budget
+            model.model_tier = client.model_tier
             model.updated_at = client.updated_at
             self.db.commit()
             self.db.refresh(model)
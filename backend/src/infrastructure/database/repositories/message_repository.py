@@ -42,14 +42,25 @@ class MessageRepository(IMessageRepository):
             raise ValueError(f"Message with ID {message_id} not found")
         return self._to_entity(model)
     
-    def get_by_chat_id(self, chat_id: str) -> List[Message]:
-        models = self.db.query(MessageModel).filter(MessageModel.chat_id == chat_id).order_by(MessageModel.created_at).all()
-        return [self._to_entity(model) for model in models]
-    
-    def get_chat_history(self, chat_id: str, limit: int = 20) -> List[Dict[str, str]]:
+    def get_by_chat_id(self, chat_id: str, offset: int = 0) -> List[Message]:
         models = (
             self.db.query(MessageModel)
             .filter(MessageModel.chat_id == chat_id)
+            .order_by(MessageModel.created_at)
+            .offset(offset)
+            .all()
+        )
+        return [self._to_entity(model) for model in models]
+    
+    def get_chat_history(self, chat_id: str, limit: int = 20, offset: int = 0) -> List[Dict[str, str]]:
+        """Recent turns, skipping the first `offset` messages (already summarized)"""
+        query = self.db.query(MessageModel).filter(MessageModel.chat_id == chat_id)
+        if offset:
+            limit = min(limit, max(0, query.count() - offset))
+            if limit == 0:
+                return []
+        models = (
+            query
             .order_by(MessageModel.created_at.desc())
             .limit(limit)
             .all()
@@ -0,0 +1,177 @@
+"""Per-tenant semantic cache of knowledge-base answers"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class _TenantAnswers:
+    """One tenant's cached answers with their normalized question embeddings"""
+
+    def __init__(self):
+        self.generation = 0
+        self.questions: List[np.ndarray] = []
+        # (context_hash, answer, stored_at, last_used)
+        self.entries: List[List] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def matrix(self) -> np.ndarray:
+        if self._matrix is None:
+            self._matrix = np.vstack(self.questions)
+        return self._matrix
+
+    def remove(self, index: int) -> None:
+        del self.questions[index]
+        del self.entries[index]
+        self._matrix = None
+
+    def append(self, question: np.ndarray, context_hash: str, answer: str) -> None:
+        now = time.monotonic()
+        self.questions.append(question)
+        self.entries.append([context_hash, answer, now, now])
+        self._matrix = None
+
+
+class SemanticAnswerCache:
+    """
+    Replays answers to paraphrased questions against the same context.
+
+    An entry matches when the question embedding is within
+    ``similarity_threshold`` (cosine) of a cached question and the hash of
+    the retrieved context and system prompt is identical, so an answer is
+    only reused when the model would have seen the same prompt apart from
+    the question's wording. Rebuilding a tenant starts a new generation,
+    which drops its entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 86400.0,
+        max_tenants: int = 512
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_tenants = max_tenants
+        self._tenants: "OrderedDict[str, _TenantAnswers]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def context_hash(context: str, system_prompt: str = "") -> str:
+        digest = hashlib.sha1()
+        digest.update(system_prompt.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(context.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _tenant(self, tenant: str) -> _TenantAnswers:
+        answers = self._tenants.get(tenant)
+        if answers is None:
+            answers = self._tenants[tenant] = _TenantAnswers()
+            while len(self._tenants) > self.max_tenants:
+                self._tenants.popitem(last=False)
+        self._tenants.move_to_end(tenant)
+        return answers
+
+    def _match(self, answers: _TenantAnswers, question: np.ndarray, context_hash: str) -> Optional[int]:
+        if not answers.entries:
+            return None
+        similarities = answers.matrix() @ question
+        now = time.monotonic()
+        for index in np.argsort(-similarities):
+            if similarities[index] < self.similarity_threshold:
+                break
+            entry = answers.entries[int(index)]
+            if entry[0] == context_hash and now - entry[2] < self.ttl_seconds:
+                return int(index)
+        return None
+
+    def key(
+        self,
+        tenant: str,
+        question_embedding: List[float],
+        context: str,
+        system_prompt: str = ""
+    ) -> Tuple[str, int, np.ndarray, str]:
+        """
+        Build the lookup key, pinning the tenant's generation so an answer
+        generated while the tenant was being rebuilt is not stored afterwards.
+        """
+        question = np.asarray(question_embedding, dtype=np.float32)
+        norm = np.linalg.norm(question)
+        if norm:
+            question = question / norm
+        with self._lock:
+            generation = self._tenant(tenant).generation
+        return tenant, generation, question, self.context_hash(context, system_prompt)
+
+    def get(self, key: Tuple[str, int, np.ndarray, str]) -> Optional[str]:
+        tenant, generation, question, context_hash = key
+        with self._lock:
+            answers = self._tenant(tenant)
+            index = self._match(answers, question, context_hash) if answers.generation == generation else None
+            if index is None:
+                self.misses += 1
+                return None
+            entry = answers.entries[index]
+            entry[3] = time.monotonic()
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Tuple[str, int, np.ndarray, str], answer: str) -> None:
+        if not answer:
+            return
+        tenant, generation, question, context_hash = key
+        with self._lock:
+            answers = self._tenant(tenant)
+            if answers.generation != generation:
+                return
+            # A concurrent request may have stored the same question first
+            existing = self._match(answers, question, context_hash)
+            if existing is not None:
+                answers.remove(existing)
+            answers.append(question, context_hash, answer)
+            while len(answers.entries) > self.max_entries:
+                least_used = min(range(len(answers.entries)), key=lambda i: answers.entries[i][3])
+                answers.remove(least_used)
+            self.stores += 1
+
+    def invalidate(self, tenant: str) -> None:
+        """Drop a tenant's answers after its knowledge base changed"""
+        with self._lock:
+            answers = self._tenants.get(tenant)
+            if answers is not None:
+                answers.generation += 1
+                answers.questions, answers.entries = [], []
+                answers._matrix = None
+            self.invalidations += 1
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = sum(len(answers.entries) for answers in self._tenants.values())
+            tenants = len(self._tenants)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "invalidations": self.invalidations,
+            "tenants": tenants,
+            "entries": entries,
+            "max_entries_per_tenant": self.max_entries,
+            "similarity_threshold": self.similarity_threshold,
+        }
@@ -0,0 +1,43 @@
+"""In-process runner for work that should not delay a response"""
+import asyncio
+import uuid
+from typing import Awaitable, Callable, Dict
+
+from src.domain.abstractions.services.background_task_runner import IBackgroundTaskRunner
+from src.infrastructure.database.config import SessionLocal, session_id_var
+
+
+class BackgroundTaskRunner(IBackgroundTaskRunner):
+    """
+    Runs coroutines as asyncio tasks on the current event loop.
+
+    Each task gets its own database session scope (the request's session is
+    removed when the request ends), at most one task per key runs at a time,
+    and failures are logged rather than lost. Tasks are in-process only: work
+    still pending when a worker stops is dropped and redone on a later turn.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def spawn(self, work: Callable[[], Awaitable[None]], key: str) -> bool:
+        running = self._tasks.get(key)
+        if running is not None and not running.done():
+            return False
+        task = asyncio.get_running_loop().create_task(self._run(work, key))
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._tasks.pop(key, None) if self._tasks.get(key) is done else None)
+        return True
+
+    async def _run(self, work: Callable[[], Awaitable[None]], key: str) -> None:
+        # The task runs in a copy of the request context; give it a session of its own
+        session_id_var.set(f"background-{uuid.uuid4()}")
+        try:
+            await work()
+        except Exception as e:
+            print(f"Warning: background task {key} failed: {str(e)}")
+        finally:
+            SessionLocal.remove()
+
+    def pending(self) -> int:
+        return sum(1 for task in self._tasks.values() if not task.done())
@@ -1,4 +1,5 @@
 """Chat title service implementation"""
+from typing import Optional
 from src.domain.abstractions.services.chat_title_service import IChatTitleService
 from src.infrastructure.clients.llm_client import LLMClient
 
@@ -6,8 +7,11 @@ from src.infrastructure.clients.llm_client import LLMClient
 class ChatTitleService(IChatTitleService):
     """Concrete implementation of chat title generation service"""
     
-    def __init__(self):
-        self.llm_client = LLMClient()
+    # Titles are cosmetic; do not let a slow completion hold the request
+    TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, llm_client: Optional[LLMClient] = None):
+        self.llm_client = llm_client or LLMClient()
     
     async def generate_title(self, first_message: str) -> str:
         """Generate a short title (max 20 chars) from the first message"""
@@ -22,9 +26,20 @@ class ChatTitleService(IChatTitleService):
                     "role": "user",
                     "content": first_message
                 }
-            ]
+            ],
+            timeout=self.TIMEOUT_SECONDS
         )
         
         title = response.choices[0].message.content.strip()
         return title
+    
+    def fallback_title(self, first_message: str, max_length: int = 20) -> str:
+        """First words of the message, cut on a word boundary"""
+        words = " ".join(first_message.split()).strip(" ?!.,;:")
+        if not words:
+            return "New chat"
+        if len(words) > max_length:
+            cut = words[:max_length + 1].rsplit(" ", 1)[0][:max_length]
+            words = (cut if len(cut) >= max_length // 2 else words[:max_length]).rstrip(" ?!.,;:")
+        return words[0].upper() + words[1:]
 
@@ -0,0 +1,101 @@
+"""Post-retrieval selection: score floor, adaptive k and MMR diversification"""
+from typing import List
+
+import numpy as np
+
+from src.domain.entities.vector_search_result import VectorSearchResult
+
+
+class ContextSelector:
+    """
+    Picks the chunks worth putting in a prompt from an over-fetched candidate list.
+
+    Candidates keep the order they were retrieved in, so exact-term matches
+    that hybrid RRF fusion ranked high stay high. Fused scores are rank-based
+    and not comparable across queries, though, so each rank is given the
+    relevance of the same rank in the candidates' dense cosine similarities:
+    the floor and gap thresholds then mean the same thing whether the
+    candidates came from dense search, hybrid fusion or the hot tier, and for
+    dense-only results relevance is simply each candidate's own cosine.
+    """
+
+    def __init__(
+        self,
+        candidate_factor: int = 4,
+        score_floor: float = 0.25,
+        score_gap: float = 0.1,
+        mmr_lambda: float = 0.5
+    ):
+        self.candidate_factor = max(1, candidate_factor)
+        self.score_floor = score_floor
+        self.score_gap = score_gap
+        self.mmr_lambda = mmr_lambda
+
+    def candidates(self, k: int) -> int:
+        """Number of hits to fetch for a final budget of k"""
+        return k * self.candidate_factor
+
+    def select(
+        self,
+        query_embedding: List[float],
+        results: List[VectorSearchResult],
+        k: int
+    ) -> List[VectorSearchResult]:
+        """
+        Return at most k results: those above the floor, cut at the first large
+        score gap, then reordered by MMR. Vectors are stripped from the output.
+        """
+        results = [result for result in results if result.vector]
+        if not results or k <= 0:
+            return []
+
+        vectors = np.asarray([result.vector for result in results], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm:
+            query /= query_norm
+        similarity = vectors @ query
+
+        # Retrieval order (fused rank), with the k-th best cosine as the k-th hit's relevance
+        order = np.argsort(-np.asarray([result.score for result in results]), kind="stable")
+        relevance = np.empty_like(similarity)
+        relevance[order] = -np.sort(-similarity)
+
+        # Score floor, then adaptive k: stop at the first drop larger than score_gap
+        order = order[relevance[order] >= self.score_floor]
+        if order.size == 0:
+            return []
+        if self.score_gap > 0 and order.size > 1:
+            gaps = np.flatnonzero(-np.diff(relevance[order]) > self.score_gap)
+            if gaps.size:
+                order = order[:gaps[0] + 1]
+
+        selected = self._mmr(vectors[order], relevance[order], min(k, order.size))
+
+        picked = []
+        for index in selected:
+            result = results[int(order[index])]
+            picked.append(result.model_copy(update={"vector": None}))
+        return picked
+
+    def _mmr(self, vectors: np.ndarray, relevance: np.ndarray, k: int) -> List[int]:
+        """Greedy maximal marginal relevance over pre-normalized vectors"""
+        similarity = vectors @ vectors.T
+        selected = [int(np.argmax(relevance))]
+        # Highest similarity of each candidate to anything already selected
+        redundancy = similarity[selected[0]].copy()
+        available = np.ones(len(relevance), dtype=bool)
+        available[selected[0]] = False
+
+        while len(selected) < k:
+            scores = self.mmr_lambda * relevance - (1 - self.mmr_lambda) * redundancy
+            scores[~available] = -np.inf
+            best = int(np.argmax(scores))
+            selected.append(best)
+            available[best] = False
+            np.maximum(redundancy, similarity[best], out=redundancy)
+
+        return selected
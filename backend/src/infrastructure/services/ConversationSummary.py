@@ -0,0 +1,46 @@
+"""Rolling conversation summary service implementation"""
+from typing import Dict, List, Optional
+from src.domain.abstractions.services.conversation_summary_service import IConversationSummaryService
+from src.infrastructure.clients.llm_client import LLMClient
+
+
+class ConversationSummaryService(IConversationSummaryService):
+    """Folds older chat turns into a short running summary with the LLM"""
+    
+    TIMEOUT_SECONDS = 30.0
+    
+    def __init__(self, llm_client: Optional[LLMClient] = None, max_words: int = 200):
+        self.llm_client = llm_client or LLMClient()
+        self.max_words = max_words
+    
+    async def summarize(self, previous_summary: Optional[str], turns: List[Dict[str, str]]) -> str:
+        """Extend the summary with the given turns, keeping it under max_words"""
+        transcript = []
+        for turn in turns:
+            if turn.get("user"):
+                transcript.append(f"User: {turn['user']}")
+            if turn.get("assistant"):
+                transcript.append(f"Assistant: {turn['assistant']}")
+        
+        content = f"Current summary:\n{previous_summary or '(none)'}\n\nNew messages:\n" + "\n".join(transcript)
+        response = await self.llm_client.create_completion(
+            model="gpt-5-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You maintain a running summary of a customer support conversation. "
+                        "Update the current summary with the new messages. Keep names, dates, "
+                        "booking details, preferences and open questions; drop small talk. "
+                        f"Use at most {self.max_words} words. Return only the summary."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ],
+            timeout=self.TIMEOUT_SECONDS
+        )
+        
+        return response.choices[0].message.content.strip()
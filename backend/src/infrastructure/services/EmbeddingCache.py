@@ -0,0 +1,209 @@
+"""Persistent chunk-embedding cache backed by float16 memory-mapped files"""
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+
+class EmbeddingCacheService:
+    """
+    Maps (chunk text hash, model name) to embedding vectors on local disk.
+
+    Each model gets its own directory holding:
+      - vectors.f16: contiguous float16 rows, opened as a numpy memmap
+      - index.json: {"dim": int, "rows": {sha256(text): row_number}}
+
+    Rows are append-only, so a rebuild of a mostly-unchanged site only
+    appends the vectors of chunks that were actually new. Appends hold an
+    exclusive lock on the model directory's ``.lock`` file and re-read the
+    index first, so several workers can share one cache directory. Row
+    numbers come from the vector file's size, and on load the file and the
+    index are reconciled, so a crash between appending vectors and writing
+    the index cannot shift later rows.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._stores: Dict[str, Dict] = {}
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _model_dir(self, model_name: str) -> str:
+        safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+        return os.path.join(self.cache_dir, safe_name)
+
+    def _load(self, model_name: str) -> Dict:
+        """Load (or lazily create) the index and memmap for a model"""
+        store = self._stores.get(model_name)
+        if store is not None:
+            return store
+
+        model_dir = self._model_dir(model_name)
+        os.makedirs(model_dir, exist_ok=True)
+        store = {
+            "dim": None,
+            "rows": {},
+            "index_path": os.path.join(model_dir, "index.json"),
+            "vectors_path": os.path.join(model_dir, "vectors.f16"),
+            "lock_path": os.path.join(model_dir, ".lock"),
+            "matrix": None,
+        }
+        with self._file_lock(store):
+            self._refresh(store)
+        self._open_matrix(store)
+        self._stores[model_name] = store
+        return store
+
+    @contextmanager
+    def _file_lock(self, store: Dict):
+        """Exclusive lock shared by every process using this cache directory"""
+        with open(store["lock_path"], "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _file_rows(store: Dict) -> int:
+        if not store["dim"] or not os.path.exists(store["vectors_path"]):
+            return 0
+        return os.path.getsize(store["vectors_path"]) // (store["dim"] * 2)
+
+    def _refresh(self, store: Dict) -> None:
+        """
+        Re-read the index from disk and reconcile it with the vector file
+        (call with the file lock held). Index entries pointing past the end
+        of the file are dropped; vectors appended without an index entry
+        (a crash before the index was written) are truncated away.
+        """
+        dim, rows = None, {}
+        if os.path.exists(store["index_path"]):
+            with open(store["index_path"], "r", encoding="utf-8") as f:
+                data = json.load(f)
+            dim, rows = data.get("dim"), data.get("rows", {})
+        store["dim"], store["rows"] = dim, rows
+        if not dim:
+            if os.path.exists(store["vectors_path"]) and os.path.getsize(store["vectors_path"]):
+                print(f"Warning: discarding unindexed vectors in {store['vectors_path']}")
+                os.remove(store["vectors_path"])
+            return
+
+        file_rows = self._file_rows(store)
+        valid = {key: row for key, row in rows.items() if row < file_rows}
+        indexed = max(valid.values()) + 1 if valid else 0
+        if len(valid) != len(rows):
+            print(f"Warning: embedding cache index had {len(rows) - len(valid)} rows past the end of "
+                  f"{store['vectors_path']}; dropping them")
+            store["rows"] = valid
+            self._write_index(store)
+        if os.path.exists(store["vectors_path"]) and os.path.getsize(store["vectors_path"]) != indexed * dim * 2:
+            print(f"Warning: truncating unindexed vectors in {store['vectors_path']} to {indexed} rows")
+            store["matrix"] = None
+            with open(store["vectors_path"], "r+b") as f:
+                f.truncate(indexed * dim * 2)
+
+    @staticmethod
+    def _write_index(store: Dict) -> None:
+        tmp_path = store["index_path"] + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": store["dim"], "rows": store["rows"]}, f)
+        os.replace(tmp_path, store["index_path"])
+
+    def _open_matrix(self, store: Dict) -> None:
+        file_rows = self._file_rows(store)
+        if not store["rows"] or not file_rows:
+            store["matrix"] = None
+            return
+        store["matrix"] = np.memmap(
+            store["vectors_path"], dtype=np.float16, mode="r", shape=(file_rows, store["dim"])
+        )
+
+    def get_many(self, texts: List[str], model_name: str) -> List[Optional[List[float]]]:
+        """Return cached vectors aligned with texts; None marks a cache miss"""
+        with self._lock:
+            store = self._load(model_name)
+            matrix = store["matrix"]
+            results: List[Optional[List[float]]] = []
+            for text in texts:
+                row = store["rows"].get(self.hash_text(text))
+                if row is None or matrix is None or row >= matrix.shape[0]:
+                    results.append(None)
+                else:
+                    results.append(matrix[row].astype(np.float32).tolist())
+            return results
+
+    def put_many(self, texts: List[str], vectors: List[List[float]], model_name: str) -> None:
+        """Append vectors for texts that are not cached yet and persist the index"""
+        if not texts:
+            return
+        with self._lock:
+            store = self._load(model_name)
+            # Release the read-only map before the file may be truncated or grown
+            store["matrix"] = None
+            try:
+                with self._file_lock(store):
+                    # Another worker may have appended since this one last looked
+                    self._refresh(store)
+                    self._append(store, texts, vectors, model_name)
+            finally:
+                self._open_matrix(store)
+
+    def _append(self, store: Dict, texts: List[str], vectors: List[List[float]], model_name: str) -> None:
+        """Append new vectors and their index entries (call with both locks held)"""
+        new_rows, new_vectors, seen = [], [], set()
+        for text, vector in zip(texts, vectors):
+            key = self.hash_text(text)
+            if key in store["rows"] or key in seen:
+                continue
+            seen.add(key)
+            new_rows.append(key)
+            new_vectors.append(vector)
+        if not new_vectors:
+            return
+
+        block = np.asarray(new_vectors, dtype=np.float16)
+        if store["dim"] is None:
+            store["dim"] = int(block.shape[1])
+        elif block.shape[1] != store["dim"]:
+            raise ValueError(
+                f"Embedding dimension {block.shape[1]} does not match cached dimension {store['dim']} for {model_name}"
+            )
+
+        # Rows are numbered by what is actually in the file
+        offset = self._file_rows(store)
+        with open(store["vectors_path"], "ab") as f:
+            f.write(block.tobytes())
+
+        for i, key in enumerate(new_rows):
+            store["rows"][key] = offset + i
+        self._write_index(store)
+
+    def embed_documents(self, embeddings, texts: List[str], model_name: str) -> List[List[float]]:
+        """Embed texts through the cache, running the model only on misses"""
+        cached = self.get_many(texts, model_name)
+        miss_indexes = [i for i, vector in enumerate(cached) if vector is None]
+
+        if miss_indexes:
+            miss_texts = [texts[i] for i in miss_indexes]
+            computed = embeddings.embed_documents(miss_texts)
+            self.put_many(miss_texts, computed, model_name)
+            for i, vector in zip(miss_indexes, computed):
+                cached[i] = list(vector)
+
+        return cached
@@ -0,0 +1,203 @@
+"""In-process vector tier for small or frequently queried tenants"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.entities.vector_search_result import VectorSearchResult
+from src.infrastructure.utils.payload_schema import decode_payload
+
+
+class HotCollection:
+    """
+    A tenant's whole collection held in memory.
+
+    Dense vectors live in one contiguous normalized matrix; BM25 sparse
+    vectors (when the collection has them) live in an inverted index with
+    IDF computed over the tenant's own points, mirroring Qdrant's IDF
+    modifier. Qdrant remains the source of truth.
+    """
+
+    RRF_K = 60
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        payloads: List[Dict],
+        sparse_vectors: Optional[List[Dict[int, float]]] = None
+    ):
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix = np.ascontiguousarray(vectors / norms)
+        # Decoded once at load: (text, chunk_index, metadata)
+        self.payloads = [decode_payload(payload) for payload in payloads]
+        self.postings: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self.idf: Dict[int, float] = {}
+        if sparse_vectors:
+            self._build_sparse_index(sparse_vectors)
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def _build_sparse_index(self, sparse_vectors: List[Dict[int, float]]) -> None:
+        postings: Dict[int, Tuple[List[int], List[float]]] = {}
+        for row, weights in enumerate(sparse_vectors):
+            for term, weight in weights.items():
+                rows, values = postings.setdefault(term, ([], []))
+                rows.append(row)
+                values.append(weight)
+
+        total = len(sparse_vectors)
+        for term, (rows, values) in postings.items():
+            df = len(rows)
+            self.idf[term] = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            self.postings[term] = (np.asarray(rows, dtype=np.int32), np.asarray(values, dtype=np.float32))
+
+    def _top_k(self, scores: np.ndarray, k: int) -> np.ndarray:
+        k = min(k, scores.shape[0])
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        return candidates[np.argsort(-scores[candidates])]
+
+    def _sparse_scores(self, query_sparse: Dict[int, float]) -> np.ndarray:
+        scores = np.zeros(len(self.payloads), dtype=np.float32)
+        for term, query_weight in query_sparse.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            rows, values = posting
+            scores[rows] += values * (self.idf[term] * query_weight)
+        return scores
+
+    def search(
+        self,
+        query_embedding: List[float],
+        k: int,
+        query_sparse: Optional[Dict[int, float]] = None,
+        with_vectors: bool = False
+    ) -> List[VectorSearchResult]:
+        query = np.asarray(query_embedding, dtype=self.matrix.dtype)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        dense_scores = (self.matrix @ query).astype(np.float32)
+
+        if query_sparse and self.postings:
+            # Reciprocal rank fusion over dense and sparse candidate lists
+            prefetch = k * 4
+            fused: Dict[int, float] = {}
+            sparse_scores = self._sparse_scores(query_sparse)
+            for ranking in (self._top_k(dense_scores, prefetch), self._top_k(sparse_scores, prefetch)):
+                for rank, row in enumerate(ranking):
+                    fused[int(row)] = fused.get(int(row), 0.0) + 1.0 / (self.RRF_K + rank + 1)
+            rows = sorted(fused, key=fused.get, reverse=True)[:k]
+            scored = [(row, fused[row]) for row in rows]
+        else:
+            rows = self._top_k(dense_scores, k)
+            scored = [(int(row), float(dense_scores[row])) for row in rows]
+
+        results = []
+        for row, score in scored:
+            text, chunk_index, metadata = self.payloads[row]
+            results.append(VectorSearchResult(
+                text=text,
+                score=score,
+                chunk_index=chunk_index,
+                metadata=dict(metadata),
+                vector=self.matrix[row].tolist() if with_vectors else None
+            ))
+        return results
+
+
+class HotVectorTier:
+    """
+    LRU of HotCollection entries keyed by logical collection name.
+
+    Collections are loaded lazily on first query. A collection larger than
+    ``max_points`` is remembered as ineligible so it is not re-counted on
+    every query. Entries expire after ``ttl_seconds`` (other workers may have
+    rebuilt the tenant) and are dropped immediately by ``invalidate``.
+    """
+
+    def __init__(
+        self,
+        max_points: int = 2000,
+        max_collections: int = 256,
+        ttl_seconds: float = 300.0,
+        dtype: str = "float32"
+    ):
+        self.max_points = max_points
+        self.max_collections = max_collections
+        self.ttl_seconds = ttl_seconds
+        self.dtype = np.float16 if dtype == "float16" else np.float32
+        # collection name -> (entry or None when ineligible, loaded_at)
+        self._entries: "OrderedDict[str, Tuple[Optional[HotCollection], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Per-collection locks for loads in flight only; a finished load removes its
+        # own, and threads still waiting on it find the entry it stored
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_points > 0
+
+    def lookup(self, collection_name: str) -> Tuple[bool, Optional[HotCollection]]:
+        """Return (known, entry) without I/O; known=False means a load is needed"""
+        with self._lock:
+            if collection_name not in self._entries:
+                return False, None
+            entry, loaded_at = self._entries[collection_name]
+            if time.monotonic() - loaded_at >= self.ttl_seconds:
+                del self._entries[collection_name]
+                return False, None
+            self._entries.move_to_end(collection_name)
+            return True, entry
+
+    def load(
+        self,
+        collection_name: str,
+        fetch_points: Callable[[str, int], Optional[List[Tuple[List[float], Optional[Dict[int, float]], Dict]]]]
+    ) -> Optional[HotCollection]:
+        """
+        Load a collection through fetch_points(collection_name, max_points), which
+        returns [(dense, sparse, payload)] or None when the collection is too large.
+        """
+        with self._lock:
+            load_lock = self._load_locks.setdefault(collection_name, threading.Lock())
+
+        try:
+            with load_lock:
+                known, entry = self.lookup(collection_name)
+                if known:
+                    return entry
+
+                points = fetch_points(collection_name, self.max_points)
+                entry = None
+                if points:
+                    vectors = np.asarray([dense for dense, _, _ in points], dtype=self.dtype)
+                    sparse_vectors = [sparse for _, sparse, _ in points]
+                    has_sparse = any(sparse for sparse in sparse_vectors)
+                    entry = HotCollection(
+                        vectors,
+                        [payload for _, _, payload in points],
+                        [sparse or {} for sparse in sparse_vectors] if has_sparse else None
+                    )
+
+                with self._lock:
+                    self._entries[collection_name] = (entry, time.monotonic())
+                    self._entries.move_to_end(collection_name)
+                    while len(self._entries) > self.max_collections:
+                        self._entries.popitem(last=False)
+                return entry
+        finally:
+            with self._lock:
+                if self._load_locks.get(collection_name) is load_lock:
+                    del self._load_locks[collection_name]
+
+    def invalidate(self, collection_name: str) -> None:
+        with self._lock:
+            self._entries.pop(collection_name, None)
@@ -0,0 +1,174 @@
+"""Per-request model tier selection from cheap local signals"""
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+TIERS = ("fast", "standard", "heavy")
+
+# USD per million tokens: (input, cached input, output)
+MODEL_PRICES = {
+    "gpt-5-nano": (0.05, 0.005, 0.40),
+    "gpt-5-mini": (0.25, 0.025, 2.00),
+    "gpt-5": (1.25, 0.125, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+}
+
+_SMALL_TALK = re.compile(
+    r"^\s*(hi|hello|hey|hiya|yo|thanks|thank you|thx|ok|okay|cool|great|bye|goodbye|"
+    r"good (morning|afternoon|evening)|how are you)\b",
+    re.IGNORECASE
+)
+# Requests that usually end in a tool call that changes something
+_ACTION = re.compile(
+    r"\b(book|booking|schedule|reschedule|cancel|reserve|appointment|availab\w*|slot|"
+    r"order|refund|sign ?up|register|subscribe|pay|update my|change my)\b",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class RouteDecision:
+    tier: str
+    model: str
+    reason: str
+
+
+class _TierStats:
+    """Rolling latency and accumulated token cost for one tier"""
+
+    def __init__(self, window: int = 512):
+        self.requests = 0
+        self.ttft_ms = deque(maxlen=window)
+        self.total_ms = deque(maxlen=window)
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.reasons: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict:
+        ttft = np.asarray(self.ttft_ms) if self.ttft_ms else np.zeros(1)
+        total = np.asarray(self.total_ms) if self.total_ms else np.zeros(1)
+        return {
+            "requests": self.requests,
+            "ttft_ms_p50": float(np.percentile(ttft, 50)),
+            "ttft_ms_p95": float(np.percentile(ttft, 95)),
+            "total_ms_p50": float(np.percentile(total, 50)),
+            "total_ms_p95": float(np.percentile(total, 95)),
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+            "cost_usd_per_request": round(self.cost_usd / self.requests, 6) if self.requests else 0.0,
+            "reasons": dict(self.reasons),
+        }
+
+
+class ModelRouter:
+    """
+    Picks a model tier for each turn.
+
+    A tenant policy of ``fast``, ``standard`` or ``heavy`` pins the tier;
+    ``auto`` (or no policy) routes on the turn itself: small talk and
+    follow-up nudges go to the fast tier, short standalone knowledge-base
+    questions too, and only turns that are likely to drive an action tool
+    (or long agentic conversations) go to the heavy tier.
+    """
+
+    def __init__(
+        self,
+        models: Optional[Dict[str, str]] = None,
+        enabled: bool = True,
+        default_tier: str = "standard",
+        long_history_turns: int = 6,
+        short_question_words: int = 20
+    ):
+        self.models = models or {"fast": "gpt-5-nano", "standard": "gpt-5-mini", "heavy": "gpt-5"}
+        self.enabled = enabled
+        self.default_tier = default_tier
+        self.long_history_turns = long_history_turns
+        self.short_question_words = short_question_words
+        self._stats: Dict[str, _TierStats] = {}
+        self._lock = threading.Lock()
+
+    def _decision(self, tier: str, reason: str) -> RouteDecision:
+        return RouteDecision(tier=tier, model=self.models[tier], reason=reason)
+
+    def route(
+        self,
+        question: str,
+        chat_history: Optional[List[Dict[str, str]]] = None,
+        tools: Optional[List[Dict]] = None,
+        is_follow_up: bool = False,
+        policy: Optional[str] = None
+    ) -> RouteDecision:
+        if policy in TIERS:
+            return self._decision(policy, "tenant_policy")
+        if not self.enabled:
+            return self._decision(self.default_tier, "routing_disabled")
+
+        words = len(question.split())
+        turns = len(chat_history or [])
+        if is_follow_up:
+            return self._decision("fast", "follow_up")
+        if words <= 6 and _SMALL_TALK.match(question) and not _ACTION.search(question):
+            return self._decision("fast", "small_talk")
+
+        if tools:
+            if _ACTION.search(question):
+                return self._decision("heavy", "action_intent")
+            if turns >= self.long_history_turns:
+                return self._decision("heavy", "long_agentic_conversation")
+            return self._decision("standard", "tools_available")
+
+        if words <= self.short_question_words and question.count("?") <= 1 and turns == 0:
+            return self._decision("fast", "short_lookup")
+        return self._decision("standard", "lookup")
+
+    @staticmethod
+    def estimate_cost(model: str, usage: Any) -> float:
+        prices = MODEL_PRICES.get(model)
+        if prices is None or usage is None:
+            return 0.0
+        if not isinstance(usage, dict):
+            usage = usage.model_dump()
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        prompt = (usage.get("prompt_tokens") or 0) - cached
+        completion = usage.get("completion_tokens") or 0
+        return (prompt * prices[0] + cached * prices[1] + completion * prices[2]) / 1_000_000
+
+    def record_usage(self, decision: RouteDecision, usage: Any) -> None:
+        if usage is None:
+            return
+        if not isinstance(usage, dict):
+            usage = usage.model_dump()
+        with self._lock:
+            stats = self._stats.setdefault(decision.tier, _TierStats())
+            stats.prompt_tokens += usage.get("prompt_tokens") or 0
+            stats.cached_tokens += (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+            stats.completion_tokens += usage.get("completion_tokens") or 0
+            stats.cost_usd += self.estimate_cost(decision.model, usage)
+
+    def record_latency(self, decision: RouteDecision, ttft_ms: Optional[float], total_ms: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(decision.tier, _TierStats())
+            stats.requests += 1
+            stats.reasons[decision.reason] = stats.reasons.get(decision.reason, 0) + 1
+            if ttft_ms is not None:
+                stats.ttft_ms.append(ttft_ms)
+            stats.total_ms.append(total_ms)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tiers = {tier: stats.to_dict() for tier, stats in self._stats.items()}
+        return {
+            "enabled": self.enabled,
+            "models": dict(self.models),
+            "tiers": tiers,
+        }
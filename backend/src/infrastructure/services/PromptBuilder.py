@@ -0,0 +1,140 @@
+"""Prompt assembly that keeps a byte-stable, cacheable prefix per tenant"""
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class _TenantUsage:
+    """Prompt and cached-token totals for one tenant"""
+
+    def __init__(self):
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.prefix_hash: Optional[str] = None
+        self.prefix_changes = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cached_ratio": self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0,
+            "prefix_hash": self.prefix_hash,
+            "prefix_changes": self.prefix_changes,
+        }
+
+
+class PromptBuilder:
+    """
+    Builds chat messages ordered from most to least stable.
+
+    Providers cache the longest previously seen prompt prefix (tools first,
+    then messages in order), so the layout is:
+
+    1. system: company context + tenant system prompt (identical for every
+       request of a tenant; tool definitions are sorted for the same reason)
+    2. system: rolling summary of older turns (changes every few turns)
+    3. recent turns as user/assistant messages (append-only within a chat)
+    4. system: per-request instructions, API token and retrieved context
+    5. user: the question
+
+    Usage reported by the provider is accumulated per tenant so the share of
+    prompt tokens served from cache can be watched.
+    """
+
+    def __init__(self):
+        self._usage: Dict[str, _TenantUsage] = {}
+        self._lock = threading.Lock()
+
+    def system_prefix(self, company_name: str = "", system_prompt: str = "") -> str:
+        parts = []
+        if company_name:
+            parts.append(f"You are a representative of {company_name}.")
+        if system_prompt:
+            parts.append(system_prompt)
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def summary_text(conversation_summary: Optional[str]) -> str:
+        return f"Summary of the earlier conversation:\n{conversation_summary}" if conversation_summary else ""
+
+    @staticmethod
+    def volatile_parts(instructions: Optional[List[str]] = None, auth_token: Optional[str] = None) -> List[str]:
+        """Per-request parts placed after the history, ahead of the context"""
+        parts = list(instructions or [])
+        if auth_token:
+            parts.append(f"API token: {auth_token}")
+        return parts
+
+    def build_messages(
+        self,
+        question: str,
+        company_name: str = "",
+        system_prompt: str = "",
+        context: Optional[str] = None,
+        chat_history: Optional[List[Dict[str, str]]] = None,
+        instructions: Optional[List[str]] = None,
+        auth_token: Optional[str] = None,
+        conversation_summary: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        messages = []
+        prefix = self.system_prefix(company_name, system_prompt)
+        if prefix:
+            messages.append({"role": "system", "content": prefix})
+            self._track_prefix(company_name, prefix)
+        if conversation_summary:
+            messages.append({"role": "system", "content": self.summary_text(conversation_summary)})
+
+        for turn in chat_history or []:
+            if turn.get("user"):
+                messages.append({"role": "user", "content": turn["user"]})
+            if turn.get("assistant"):
+                messages.append({"role": "assistant", "content": turn["assistant"]})
+
+        volatile = self.volatile_parts(instructions, auth_token)
+        if context is not None:
+            volatile.append(f"Context:\n{context}")
+        if volatile:
+            messages.append({"role": "system", "content": "\n\n".join(volatile)})
+
+        messages.append({"role": "user", "content": question})
+        return messages
+
+    @staticmethod
+    def stable_tools(tool_definitions: List[Dict]) -> List[Dict]:
+        """Tool definitions in a fixed order so they stay part of the cached prefix"""
+        return sorted(tool_definitions, key=lambda tool: tool.get("function", {}).get("name", ""))
+
+    def _track_prefix(self, tenant: str, prefix: str) -> None:
+        prefix_hash = hashlib.sha1(prefix.encode("utf-8")).hexdigest()[:12]
+        with self._lock:
+            usage = self._usage.setdefault(tenant, _TenantUsage())
+            if usage.prefix_hash is not None and usage.prefix_hash != prefix_hash:
+                usage.prefix_changes += 1
+            usage.prefix_hash = prefix_hash
+
+    def record_usage(self, tenant: str, usage: Any) -> None:
+        """Add a completion's usage (OpenAI usage object or dict) to the tenant totals"""
+        if usage is None:
+            return
+        if not isinstance(usage, dict):
+            usage = usage.model_dump()
+        details = usage.get("prompt_tokens_details") or {}
+        with self._lock:
+            totals = self._usage.setdefault(tenant, _TenantUsage())
+            totals.requests += 1
+            totals.prompt_tokens += usage.get("prompt_tokens") or 0
+            totals.cached_tokens += details.get("cached_tokens") or 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tenants = {tenant: usage.to_dict() for tenant, usage in self._usage.items()}
+        prompt_tokens = sum(usage["prompt_tokens"] for usage in tenants.values())
+        cached_tokens = sum(usage["cached_tokens"] for usage in tenants.values())
+        return {
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "cached_ratio": cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+            "tenants": tenants,
+        }
@@ -1,5 +1,4 @@
-from typing import List, Dict, AsyncIterator, Optional
-import asyncio
+from typing import Callable, List, Dict, AsyncIterator, Optional
 from langchain.schema import BaseRetriever, Document
 from langchain.callbacks.manager import CallbackManagerForRetrieverRun
 from src.domain.abstractions.services.rag_service import IRAGService
@@ -7,17 +6,37 @@ from src.infrastructure.services.WebsiteLoader import WebsiteLoaderService
 from src.infrastructure.services.DocumentChunker import DocumentChunkingService
 from src.infrastructure.services.EmbeddingService import EmbeddingService
 from src.infrastructure.services.VectorStore import VectorStoreService
+from src.infrastructure.services.EmbeddingCache import EmbeddingCacheService
+from src.infrastructure.services.SparseEncoder import BM25SparseEncoder
+from src.infrastructure.services.HotVectorTier import HotVectorTier
+from src.infrastructure.services.RetrievalCache import RetrievalCache
+from src.infrastructure.services.ContextSelector import ContextSelector
+from src.infrastructure.services.Reranker import CrossEncoderReranker
+from src.infrastructure.services.AnswerCache import SemanticAnswerCache
+from src.infrastructure.services.PromptBuilder import PromptBuilder
+from src.infrastructure.services.TokenBudget import TokenBudgetManager
+from src.infrastructure.services.ModelRouter import ModelRouter
+from src.infrastructure.services.RequestCoalescer import StreamCoalescer
+from src.domain.abstractions.repositories.chunk_text_repository import IChunkTextRepository
 from src.infrastructure.clients.llm_client import LLMClient
 from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.clients.async_vector_store_client import AsyncVectorStoreClient
 from src.infrastructure.chains.agent_chain import AgentRunnable
-from src.domain.utils.chat_formatter import format_chat_history
+import asyncio
 import json
+import time
+
+
+# Content events are serialized with their type first
+_CONTENT_CHUNK = '{"type": "content"'
 
 
 class QdrantRetriever(BaseRetriever):
     vector_store: VectorStoreService
     collection_name: str
     k: int = 3
+    # Set only for tenants with re-ranking switched on
+    reranker: Optional[CrossEncoderReranker] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -25,38 +44,99 @@ class QdrantRetriever(BaseRetriever):
     def _get_relevant_documents(
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun = None
     ) -> List[Document]:
-        results = self.vector_store.search(query, self.collection_name, k=self.k)
+        if self.reranker:
+            candidates = self.vector_store.search(query, self.collection_name, k=self.reranker.candidates)
+            results = self.reranker.rerank(query, candidates, self.k, tenant=self.collection_name)
+        else:
+            results = self.vector_store.search(query, self.collection_name, k=self.k)
         return [Document(page_content=result.text, metadata=result.metadata) for result in results]
 
     async def _aget_relevant_documents(
         self, query: str, *, run_manager: CallbackManagerForRetrieverRun = None
     ) -> List[Document]:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._get_relevant_documents, query)
+        if self.reranker:
+            candidates = await self.vector_store.asearch(query, self.collection_name, k=self.reranker.candidates)
+            # Cross-encoder inference is CPU-bound
+            results = await asyncio.to_thread(
+                self.reranker.rerank, query, candidates, self.k, self.collection_name
+            )
+        else:
+            results = await self.vector_store.asearch(query, self.collection_name, k=self.k)
+        return [Document(page_content=result.text, metadata=result.metadata) for result in results]
 
 
 class RAGService(IRAGService):
+    FOLLOW_UP_INSTRUCTION = (
+        "The user has been inactive for 3 minutes. Send a very brief, friendly follow-up "
+        "message to see if they need more help. Just one short sentence."
+    )
+
     def __init__(
         self,
         embedding_service: EmbeddingService,
         vector_store_client: VectorStoreClient,
+        embedding_cache: Optional[EmbeddingCacheService] = None,
+        sparse_encoder: Optional[BM25SparseEncoder] = None,
+        async_vector_store_client: Optional[AsyncVectorStoreClient] = None,
+        hot_tier: Optional[HotVectorTier] = None,
+        chunk_text_repository: Optional[IChunkTextRepository] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        context_selector: Optional[ContextSelector] = None,
+        reranker: Optional[CrossEncoderReranker] = None,
+        llm_client: Optional[LLMClient] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None,
+        prompt_builder: Optional[PromptBuilder] = None,
+        token_budget: Optional[TokenBudgetManager] = None,
+        model_router: Optional[ModelRouter] = None,
+        coalescer: Optional[StreamCoalescer] = None,
     ):
         self.loader = None
         self.chunker = DocumentChunkingService()
         self.embeddings = embedding_service
-        self.llm_client = LLMClient()
+        self.llm_client = llm_client or LLMClient()
         self.vector_store_service = VectorStoreService(
             self.embeddings.get_embeddings(),
             vector_store_client,
+            embedding_cache=embedding_cache,
+            sparse_encoder=sparse_encoder,
+            async_vector_client=async_vector_store_client,
+            hot_tier=hot_tier,
+            chunk_text_repository=chunk_text_repository,
+            retrieval_cache=retrieval_cache,
+            context_selector=context_selector,
+        )
+        self.reranker = reranker
+        self.answer_cache = answer_cache
+        self.prompt_builder = prompt_builder or PromptBuilder()
+        self.token_budget = token_budget or TokenBudgetManager()
+        self.model_router = model_router or ModelRouter(
+            models={tier: self.llm_client.default_model for tier in ("fast", "standard", "heavy")},
+            enabled=False
         )
+        self.coalescer = coalescer
         self.company_name = None
 
-    async def build(self, url: str, company_name: str) -> None:
-        self.loader = WebsiteLoaderService(url)
+    async def build(
+        self,
+        url: str,
+        company_name: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> None:
+        self.loader = WebsiteLoaderService(url, llm_client=self.llm_client)
         self.company_name = company_name
         documents = await self.loader.scrape_website(url)
         chunks = self.chunker.create_chunks(documents)
-        self.vector_store_service.create_store(documents=chunks, collection_name=company_name)
+
+        def report_progress(uploaded: int, total: int) -> None:
+            print(f"Indexing {company_name}: uploaded {uploaded}/{total} chunks")
+
+        self.vector_store_service.create_store(
+            documents=chunks,
+            collection_name=company_name,
+            progress_callback=progress_callback or report_progress
+        )
+        if self.answer_cache:
+            self.answer_cache.invalidate(company_name)
 
     async def query(
         self,
@@ -109,7 +189,11 @@ class RAGService(IRAGService):
         tools: Optional[List[Dict]] = None,
         auth_token: Optional[str] = None,
         system_prompt: Optional[str] = "",
-        is_follow_up: bool = False
+        is_follow_up: bool = False,
+        rerank: bool = False,
+        token_budget: Optional[int] = None,
+        conversation_summary: Optional[str] = None,
+        model_tier: Optional[str] = None
     ) -> AsyncIterator[str]:
         """
         Stream response with status hints before each major operation.
@@ -119,24 +203,32 @@ class RAGService(IRAGService):
         and let the agent decide when to use tools. Only query vector DB
         when no tools are provided (simple Q&A without tool use).
         """
+        # Pick the model tier from local signals before any network call
+        route = self.model_router.route(
+            question,
+            chat_history=chat_history,
+            tools=tools,
+            is_follow_up=is_follow_up,
+            policy=model_tier
+        )
+        started = time.perf_counter()
+        first_token_at = None
 
         retriever = QdrantRetriever(
             vector_store=self.vector_store_service,
             collection_name=company_name,
-            k=3
+            k=3,
+            reranker=self.reranker if rerank else None
         )
 
         # If tools are provided (agentic mode), skip RouterChain and go straight to
         # AgentRunnable. RouterChain adds a redundant extra LLM call just to decide
         # whether to use tools — AgentRunnable already does this via tool_choice='auto'
         # in the same call as the response, saving a full LLM round-trip.
-        if tools:
-            # Combine system prompt with follow-up instruction if needed
-            effective_system_prompt = system_prompt or ""
-            if is_follow_up:
-                follow_up_instr = "The user has been inactive for 3 minutes. Send a very brief, friendly follow-up message to see if they need more help. Just one short sentence."
-                effective_system_prompt = f"{effective_system_prompt}\n\n{follow_up_instr}" if effective_system_prompt else follow_up_instr
+        # The follow-up nudge goes after the cacheable prefix, not into the system prompt
+        instructions = [self.FOLLOW_UP_INSTRUCTION] if is_follow_up else []
 
+        if tools:
             # Build the retriever for context (AgentRunnable uses it internally)
             agent = AgentRunnable(
                 client=self.llm_client.client,
@@ -144,15 +236,24 @@ class RAGService(IRAGService):
                 tools_config=tools,
                 chat_history=chat_history,
                 company_name=company_name,
-                system_prompt=effective_system_prompt,
-                model=self.llm_client.default_model
+                system_prompt=system_prompt or "",
+                model=route.model,
+                prompt_builder=self.prompt_builder,
+                instructions=instructions,
+                token_budget=self.token_budget,
+                budget=token_budget,
+                conversation_summary=conversation_summary,
+                usage_callback=lambda usage: self.model_router.record_usage(route, usage)
             )
 
             async for chunk in agent.astream(
                 {"input": question, "chat_history": chat_history or []},
                 config={"configurable": {"auth_token": auth_token}}
             ):
+                if first_token_at is None and chunk.startswith(_CONTENT_CHUNK):
+                    first_token_at = time.perf_counter()
                 yield chunk
+            self._record_route(route, started, first_token_at)
             return
 
         # HINT #1: About to search knowledge base (only for non-tool queries)
@@ -161,34 +262,75 @@ class RAGService(IRAGService):
             "message": f"🔍 Searching {company_name}'s knowledge base..."
         })
 
-        # Only query RAG when NO tools are provided
-        docs = await retriever.ainvoke(question)
-        context = "\n\n".join(d.page_content for d in docs)
-
-        # Prepare the prompt
-        history = format_chat_history(chat_history) if chat_history else ""
-        company_context = f"You are a representative of {company_name}. " if company_name else ""
-
-        prompt_parts = [company_context]
-        if system_prompt:
-            prompt_parts.append(system_prompt)
+        # Only standalone questions are answered from cache or shared between
+        # requests: history, tokens and follow-up nudges all shape the answer
+        # beyond question and context
+        standalone = not (chat_history or conversation_summary or auth_token or is_follow_up)
+        use_answer_cache = self.answer_cache is not None and self.answer_cache.enabled and standalone
 
-        if auth_token:
-            prompt_parts.append(f"API token: {auth_token}")
+        # Only query RAG when NO tools are provided
+        if use_answer_cache:
+            docs, question_embedding = await asyncio.gather(
+                retriever.ainvoke(question),
+                asyncio.to_thread(self.vector_store_service.embeddings.embed_query, question)
+            )
+        else:
+            docs = await retriever.ainvoke(question)
 
-        if is_follow_up:
-            prompt_parts.append("The user has been inactive for 3 minutes. Send a very brief, friendly follow-up message to see if they need more help. Just one short sentence.")
+        # Trim context and history to the tenant's token budget
+        fitted = self.token_budget.fit(
+            company_name,
+            question,
+            system_prefix=self.prompt_builder.system_prefix(company_name, system_prompt or ""),
+            documents=[d.page_content for d in docs],
+            chat_history=chat_history,
+            volatile=self.prompt_builder.volatile_parts(instructions, auth_token),
+            budget=token_budget,
+            summary=self.prompt_builder.summary_text(conversation_summary)
+        )
+        context = "\n\n".join(fitted.context)
 
-        prompt_parts.append(f"Context:\n{context}")
-        if history:
-            prompt_parts.append(f"Chat History:\n{history}")
+        answer_key = None
+        if use_answer_cache:
+            answer_key = self.answer_cache.key(company_name, question_embedding, context, system_prompt or "")
+            cached_answer = self.answer_cache.get(answer_key)
+            if cached_answer is not None:
+                yield json.dumps({
+                    "type": "content",
+                    "data": cached_answer
+                })
+                return
 
-        full_prompt = "\n\n".join(prompt_parts)
+        def record_usage(usage) -> None:
+            self.prompt_builder.record_usage(company_name, usage)
+            self.model_router.record_usage(route, usage)
 
-        messages = [
-            {"role": "system", "content": full_prompt},
-            {"role": "user", "content": question}
-        ]
+        async def generate() -> AsyncIterator[str]:
+            # Stable tenant prefix first, then history, then per-request context
+            messages = self.prompt_builder.build_messages(
+                question,
+                company_name=company_name,
+                system_prompt=system_prompt or "",
+                context=context,
+                chat_history=fitted.chat_history,
+                instructions=instructions,
+                auth_token=auth_token,
+                conversation_summary=conversation_summary
+            )
+            answer_parts = []
+            async for chunk in self.llm_client.create_streaming_completion(
+                messages,
+                model=route.model,
+                usage_callback=record_usage,
+                prompt_cache_key=company_name
+            ):
+                answer_parts.append(chunk)
+                yield json.dumps({
+                    "type": "content",
+                    "data": chunk
+                })
+            if answer_key is not None:
+                self.answer_cache.put(answer_key, "".join(answer_parts))
 
         # HINT #2: About to generate response
         yield json.dumps({
@@ -196,9 +338,22 @@ class RAGService(IRAGService):
             "message": "💭 Generating response..."
         })
 
-        # NOW stream the actual completion
-        async for chunk in self.llm_client.create_streaming_completion(messages):
-            yield json.dumps({
-                "type": "content",
-                "data": chunk
-            })
+        # NOW stream the actual completion; identical standalone questions in
+        # flight at the same time share one completion
+        if standalone and self.coalescer is not None and self.coalescer.enabled:
+            flight_key = self.coalescer.key(company_name, question, context, system_prompt or "", route.model)
+            events = self.coalescer.subscribe(flight_key, generate)
+        else:
+            events = generate()
+
+        async for event in events:
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            yield event
+
+        self._record_route(route, started, first_token_at)
+
+    def _record_route(self, route, started: float, first_token_at: Optional[float]) -> None:
+        finished = time.perf_counter()
+        ttft_ms = (first_token_at - started) * 1000 if first_token_at is not None else None
+        self.model_router.record_latency(route, ttft_ms, (finished - started) * 1000)
@@ -0,0 +1,114 @@
+"""Single-flight sharing of identical in-flight answer streams"""
+import asyncio
+import hashlib
+import re
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+
+class _Flight:
+    """One in-flight generation and the events it has produced so far"""
+
+    def __init__(self):
+        self.events: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self.changed = asyncio.Condition()
+
+
+class StreamCoalescer:
+    """
+    Runs one generation per key and fans its events out to every request
+    that asks for the same key while it is in flight.
+
+    The generation runs in its own task, so a subscriber disconnecting does
+    not cut the stream short for the others; it is cancelled only when the
+    last subscriber leaves. Late subscribers replay the events produced so
+    far before following live. A finished flight is forgotten immediately:
+    repeats after that are the answer cache's job.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._flights: Dict[Tuple, _Flight] = {}
+        self.flights = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.max_subscribers = 0
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        return re.sub(r"\s+", " ", question).strip().rstrip("?!. ").lower()
+
+    @classmethod
+    def key(cls, tenant: str, question: str, context: str, system_prompt: str = "", model: str = "") -> Tuple:
+        digest = hashlib.sha1()
+        for part in (system_prompt, context, model):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return tenant, cls.normalize(question), digest.hexdigest()
+
+    async def _produce(self, key: Tuple, flight: _Flight, source: AsyncIterator[str]) -> None:
+        try:
+            async for event in source:
+                flight.events.append(event)
+                async with flight.changed:
+                    flight.changed.notify_all()
+        except asyncio.CancelledError:
+            flight.error = asyncio.CancelledError()
+        except Exception as e:
+            flight.error = e
+        finally:
+            flight.done = True
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            async with flight.changed:
+                flight.changed.notify_all()
+
+    async def subscribe(self, key: Tuple, generate: Callable[[], AsyncIterator[str]]) -> AsyncIterator[str]:
+        """Yield the events of the flight for key, starting it with generate() if none is running"""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight()
+            flight.task = asyncio.create_task(self._produce(key, flight, generate()))
+            self.flights += 1
+        else:
+            self.coalesced += 1
+        flight.subscribers += 1
+        self.max_subscribers = max(self.max_subscribers, flight.subscribers)
+
+        sent = 0
+        try:
+            while True:
+                while sent < len(flight.events):
+                    yield flight.events[sent]
+                    sent += 1
+                if flight.done:
+                    if flight.error is not None:
+                        raise Exception(f"Error generating shared answer: {str(flight.error) or 'cancelled'}")
+                    return
+                async with flight.changed:
+                    await flight.changed.wait_for(lambda: flight.done or len(flight.events) > sent)
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                # Forget the flight before cancelling: the task only sees the
+                # cancellation at its next await, and a request arriving in
+                # between must start a fresh flight, not join a dying one.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+                self.cancelled += 1
+
+    def stats(self) -> Dict:
+        requests = self.flights + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+            "coalesced_rate": self.coalesced / requests if requests else 0.0,
+            "in_flight": len(self._flights),
+            "max_subscribers": self.max_subscribers,
+            "cancelled": self.cancelled,
+        }
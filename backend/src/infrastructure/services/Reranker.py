@@ -0,0 +1,177 @@
+"""Local cross-encoder re-ranking of retrieved chunks"""
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.entities.vector_search_result import VectorSearchResult
+
+
+class _TenantStats:
+    """Rolling latency and ordering-change counters for one tenant"""
+
+    def __init__(self, window: int = 512):
+        self.latencies_ms = deque(maxlen=window)
+        self.requests = 0
+        self.fallbacks = 0
+        self.top1_changed = 0
+        self.overlap_sum = 0.0
+
+    def to_dict(self) -> Dict:
+        latencies = np.asarray(self.latencies_ms) if self.latencies_ms else np.zeros(1)
+        reranked = self.requests - self.fallbacks
+        return {
+            "requests": self.requests,
+            "fallbacks": self.fallbacks,
+            "latency_ms_p50": float(np.percentile(latencies, 50)),
+            "latency_ms_p95": float(np.percentile(latencies, 95)),
+            # How often re-ranking changed what the prompt sees
+            "top1_changed_rate": self.top1_changed / reranked if reranked else 0.0,
+            "overlap_at_k": self.overlap_sum / reranked if reranked else 0.0,
+        }
+
+
+class CrossEncoderReranker:
+    """
+    Re-orders retrieved candidates with a small cross-encoder on CPU.
+
+    Query/candidate pairs are scored in batches. If scoring would exceed the
+    latency budget (estimated from previous calls, or observed between
+    batches), or if loading or scoring fails, the dense ordering is returned
+    unchanged. The model is loaded on first use.
+    """
+
+    # Seconds before a failed model load is attempted again
+    LOAD_RETRY_S = 60.0
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        candidates: int = 10,
+        batch_size: int = 16,
+        latency_budget_ms: float = 150.0
+    ):
+        self.model_name = model_name
+        self.candidates = candidates
+        self.batch_size = batch_size
+        self.latency_budget_ms = latency_budget_ms
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._load_failed_at: Optional[float] = None
+        self._stats: Dict[str, _TenantStats] = {}
+        self._stats_lock = threading.Lock()
+        # Exponential moving average of scoring cost per pair, for the up-front budget check
+        self._pair_ms: Optional[float] = None
+
+    def _get_model(self):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    if self._load_failed_at is not None and time.monotonic() - self._load_failed_at < self.LOAD_RETRY_S:
+                        raise RuntimeError(f"model {self.model_name} failed to load recently")
+                    try:
+                        from sentence_transformers import CrossEncoder
+                        self._model = CrossEncoder(self.model_name, device="cpu")
+                    except Exception:
+                        self._load_failed_at = time.monotonic()
+                        raise
+        return self._model
+
+    def score(self, query: str, texts: List[str], deadline: Optional[float] = None) -> Optional[np.ndarray]:
+        """Cross-encoder scores for each text, or None if the deadline passed mid-way"""
+        model = self._get_model()
+        scores = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = [(query, text) for text in texts[start:start + self.batch_size]]
+            scores.extend(model.predict(batch, batch_size=self.batch_size, show_progress_bar=False))
+            if deadline is not None and start + self.batch_size < len(texts) and time.perf_counter() > deadline:
+                return None
+        return np.asarray(scores, dtype=np.float32)
+
+    def rerank(
+        self,
+        query: str,
+        results: List[VectorSearchResult],
+        k: int,
+        tenant: str = ""
+    ) -> List[VectorSearchResult]:
+        """Return the top k results by cross-encoder score, or the dense top k on budget overrun"""
+        if len(results) <= 1:
+            return results[:k]
+
+        # Loading the model takes seconds; keep it out of the per-pair cost estimate
+        try:
+            self._get_model()
+        except Exception as e:
+            print(f"Warning: re-ranking skipped, cross-encoder unavailable: {str(e)}")
+            self._record(tenant, 0.0, None, k)
+            return results[:k]
+        started = time.perf_counter()
+        budget_s = self.latency_budget_ms / 1000.0
+        scores = None
+        if self._pair_ms is None or self._pair_ms * len(results) <= self.latency_budget_ms:
+            try:
+                scores = self.score(query, [result.text for result in results], deadline=started + budget_s)
+            except Exception as e:
+                print(f"Warning: re-ranking failed, keeping retrieval order: {str(e)}")
+                self._record(tenant, (time.perf_counter() - started) * 1000.0, None, k)
+                return results[:k]
+        else:
+            # Let the estimate decay so a transient slowdown does not disable re-ranking for good
+            self._pair_ms *= 0.9
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        if scores is not None:
+            pair_ms = elapsed_ms / len(results)
+            self._pair_ms = pair_ms if self._pair_ms is None else 0.8 * self._pair_ms + 0.2 * pair_ms
+        if scores is None or elapsed_ms > self.latency_budget_ms:
+            self._record(tenant, elapsed_ms, None, k)
+            return results[:k]
+
+        order = np.argsort(-scores, kind="stable")[:k]
+        self._record(tenant, elapsed_ms, order, k)
+        return [results[int(i)].model_copy(update={"score": float(scores[i])}) for i in order]
+
+    def _record(self, tenant: str, elapsed_ms: float, order: Optional[np.ndarray], k: int) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(tenant, _TenantStats())
+            stats.requests += 1
+            stats.latencies_ms.append(elapsed_ms)
+            if order is None:
+                stats.fallbacks += 1
+                return
+            stats.top1_changed += int(order[0] != 0)
+            stats.overlap_sum += float(np.sum(order < k)) / max(1, min(k, len(order)))
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            tenants = {tenant: stats.to_dict() for tenant, stats in self._stats.items()}
+        return {
+            "model": self.model_name,
+            "latency_budget_ms": self.latency_budget_ms,
+            "pair_latency_ms": self._pair_ms,
+            "tenants": tenants,
+        }
+
+    def compare(
+        self,
+        query: str,
+        results: List[VectorSearchResult],
+        k: int
+    ) -> Tuple[List[VectorSearchResult], List[VectorSearchResult], float]:
+        """
+        Offline evaluation helper: (dense top k, reranked top k, scoring ms).
+
+        Every candidate is scored regardless of the budget, and both lists carry
+        cross-encoder scores so their context quality can be compared.
+        """
+        if not results:
+            return [], [], 0.0
+        started = time.perf_counter()
+        scores = self.score(query, [result.text for result in results])
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        rescored = [result.model_copy(update={"score": float(score)}) for result, score in zip(results, scores)]
+        order = np.argsort(-scores, kind="stable")[:k]
+        return rescored[:k], [rescored[int(i)] for i in order], elapsed_ms
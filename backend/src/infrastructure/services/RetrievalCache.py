@@ -0,0 +1,197 @@
+"""Retrieval result cache keyed by tenant, collection generation, query and k"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.entities.vector_search_result import VectorSearchResult
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query"""
+    return " ".join(query.lower().split())
+
+
+class _MemoryBackend:
+    """Per-process LRU with TTL; generations are local to the worker"""
+
+    shared = False
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # (tenant, generation, query, k) -> (results, stored_at)
+        self._entries: "OrderedDict[Tuple[str, int, str, int], Tuple[List[Dict], float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def generation(self, tenant: str) -> int:
+        with self._lock:
+            return self._generations.get(tenant, 0)
+
+    def bump_generation(self, tenant: str) -> int:
+        with self._lock:
+            generation = self._generations.get(tenant, 0) + 1
+            self._generations[tenant] = generation
+            # Old-generation keys are unreachable anyway; free their memory now
+            for key in [key for key in self._entries if key[0] == tenant]:
+                del self._entries[key]
+            return generation
+
+    def get(self, key: Tuple[str, int, str, int]) -> Optional[List[Dict]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            results, stored_at = entry
+            if time.monotonic() - stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return results
+
+    def put(self, key: Tuple[str, int, str, int], results: List[Dict]) -> None:
+        with self._lock:
+            self._entries[key] = (results, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class _RedisBackend:
+    """
+    Shared backend for multi-worker deployments.
+
+    Generations are Redis counters, so a rebuild on any worker invalidates
+    every worker's entries; stale generations simply expire. Eviction is
+    left to Redis (configure maxmemory-policy allkeys-lru).
+    """
+
+    shared = True
+    PREFIX = "retrieval"
+
+    def __init__(self, url: str, ttl_seconds: float):
+        try:
+            import redis
+        except ImportError as e:
+            raise Exception(f"Error initializing retrieval cache: redis package is required for {url}: {str(e)}")
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self.evictions = 0
+
+    def _generation_key(self, tenant: str) -> str:
+        return f"{self.PREFIX}:gen:{tenant}"
+
+    def _entry_key(self, key: Tuple[str, int, str, int]) -> str:
+        tenant, generation, query, k = key
+        digest = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        return f"{self.PREFIX}:{tenant}:{generation}:{k}:{digest}"
+
+    def generation(self, tenant: str) -> int:
+        value = self.client.get(self._generation_key(tenant))
+        return int(value) if value else 0
+
+    def bump_generation(self, tenant: str) -> int:
+        return int(self.client.incr(self._generation_key(tenant)))
+
+    def get(self, key: Tuple[str, int, str, int]) -> Optional[List[Dict]]:
+        value = self.client.get(self._entry_key(key))
+        return json.loads(value) if value else None
+
+    def put(self, key: Tuple[str, int, str, int], results: List[Dict]) -> None:
+        self.client.set(self._entry_key(key), json.dumps(results), ex=self.ttl_seconds)
+
+    def size(self) -> int:
+        return -1
+
+
+class RetrievalCache:
+    """
+    Caches search results per (tenant, collection generation, normalized query, k).
+
+    Rebuilding or deleting a tenant bumps its generation, which makes every
+    older entry for that tenant unreachable. Counters are kept per process
+    and exposed through ``stats()``.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 600.0, backend_url: str = ""):
+        self.max_entries = max_entries
+        if backend_url:
+            self.backend = _RedisBackend(backend_url, ttl_seconds)
+        else:
+            self.backend = _MemoryBackend(max_entries, ttl_seconds)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def shared(self) -> bool:
+        return self.backend.shared
+
+    def key(self, tenant: str, query: str, k: int) -> Optional[Tuple[str, int, str, int]]:
+        """
+        Build the cache key, pinning the tenant's current generation.
+
+        Take the key before searching and store under it afterwards, so results
+        computed against a collection that was rebuilt mid-search are never
+        filed under the new generation. Returns None if the backend is down.
+        """
+        try:
+            return (tenant, self.backend.generation(tenant), normalize_query(query), k)
+        except Exception as e:
+            print(f"Warning: retrieval cache lookup failed: {str(e)}")
+            return None
+
+    def get(self, key: Optional[Tuple[str, int, str, int]]) -> Optional[List[VectorSearchResult]]:
+        cached = None
+        if key is not None:
+            try:
+                cached = self.backend.get(key)
+            except Exception as e:
+                print(f"Warning: retrieval cache lookup failed: {str(e)}")
+
+        if cached is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [VectorSearchResult(**result) for result in cached]
+
+    def put(self, key: Optional[Tuple[str, int, str, int]], results: List[VectorSearchResult]) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.put(key, [result.model_dump() for result in results])
+        except Exception as e:
+            print(f"Warning: retrieval cache store failed: {str(e)}")
+
+    def invalidate(self, tenant: str) -> None:
+        """Start a new generation for a tenant whose collection changed"""
+        try:
+            self.backend.bump_generation(tenant)
+            self.invalidations += 1
+        except Exception as e:
+            print(f"Warning: retrieval cache invalidation failed: {str(e)}")
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis" if self.shared else "memory",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.backend.evictions,
+            "invalidations": self.invalidations,
+            "size": self.backend.size(),
+            "max_entries": self.max_entries,
+        }
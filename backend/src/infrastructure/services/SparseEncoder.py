@@ -0,0 +1,59 @@
+"""BM25-style sparse text encoder for hybrid retrieval"""
+import re
+import zlib
+from collections import Counter
+from typing import Dict, List
+
+
+class BM25SparseEncoder:
+    """
+    Encodes text into sparse {term_id: weight} vectors.
+
+    Documents carry the BM25 term-frequency saturation component; the IDF
+    component is applied by Qdrant (sparse vector ``modifier=IDF``), so query
+    vectors are plain binary term indicators. Term ids are stable crc32
+    hashes, which keeps ingestion and query encoding vocabulary-free.
+    """
+
+    # Keep inner '-', '.', '_' so SKUs, plan names and error codes stay whole
+    TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[-._][a-z0-9]+)*")
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def tokenize(self, text: str) -> List[str]:
+        tokens = self.TOKEN_PATTERN.findall(text.lower())
+        # Also index the parts of compound tokens so "plan-pro" matches "pro"
+        expanded = []
+        for token in tokens:
+            expanded.append(token)
+            parts = re.split(r"[-._]", token)
+            if len(parts) > 1:
+                expanded.extend(part for part in parts if part)
+        return expanded
+
+    @staticmethod
+    def term_id(term: str) -> int:
+        return zlib.crc32(term.encode("utf-8")) & 0x7FFFFFFF
+
+    def encode_documents(self, texts: List[str]) -> List[Dict[int, float]]:
+        """Encode documents with BM25 TF saturation normalized by the batch average length"""
+        tokenized = [self.tokenize(text) for text in texts]
+        avg_len = (sum(len(tokens) for tokens in tokenized) / len(tokenized)) if tokenized else 0.0
+        avg_len = avg_len or 1.0
+
+        vectors = []
+        for tokens in tokenized:
+            doc_len = len(tokens)
+            norm = self.k1 * (1 - self.b + self.b * doc_len / avg_len)
+            vector: Dict[int, float] = {}
+            for term, tf in Counter(tokens).items():
+                index = self.term_id(term)
+                vector[index] = vector.get(index, 0.0) + tf * (self.k1 + 1) / (tf + norm)
+            vectors.append(vector)
+        return vectors
+
+    def encode_query(self, text: str) -> Dict[int, float]:
+        """Encode a query as binary term indicators"""
+        return {self.term_id(term): 1.0 for term in set(self.tokenize(text))}
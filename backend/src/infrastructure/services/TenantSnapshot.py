@@ -0,0 +1,239 @@
+"""Export and import a tenant's vectors and payloads as a local snapshot file"""
+import io
+import json
+import os
+import time
+import uuid
+import zipfile
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.abstractions.repositories.chunk_text_repository import IChunkTextRepository
+from src.domain.abstractions.services.tenant_snapshot_service import ITenantSnapshotService
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.services.HotVectorTier import HotVectorTier
+from src.infrastructure.services.RetrievalCache import RetrievalCache
+from src.infrastructure.services.AnswerCache import SemanticAnswerCache
+from src.infrastructure.utils.point_ids import POINT_ID_NAMESPACE, chunk_point_id
+
+
+class TenantSnapshotService(ITenantSnapshotService):
+    """
+    Snapshot files are zip archives holding:
+
+    - ``manifest.json``: format version, tenant, vector size, distance, point count
+    - ``vectors.npy``: dense vectors as one float16 (N, dim) array
+    - ``points.jsonl``: one line per point, row-aligned with vectors.npy:
+      {"id": ..., "payload": {...}, "sparse": {"i": [...], "v": [...]}}
+
+    Payloads always carry their chunk text, so a snapshot restores into any
+    deployment whether or not it keeps texts outside Qdrant.
+    """
+
+    FORMAT_VERSION = 1
+    IMPORT_BATCH_SIZE = 1024
+
+    def __init__(
+        self,
+        vector_client: VectorStoreClient,
+        snapshot_dir: str = "data/snapshots",
+        chunk_text_repository: Optional[IChunkTextRepository] = None,
+        hot_tier: Optional[HotVectorTier] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None
+    ):
+        self.vector_client = vector_client
+        self.snapshot_dir = snapshot_dir
+        self.chunk_text_repository = chunk_text_repository
+        self.hot_tier = hot_tier
+        self.retrieval_cache = retrieval_cache
+        self.answer_cache = answer_cache
+
+    def snapshot_path(self, filename: str) -> str:
+        """Resolve a snapshot file name inside the snapshot directory"""
+        name = os.path.basename(filename)
+        if not name or name != filename:
+            raise ValueError(f"Invalid snapshot name: {filename}")
+        return os.path.join(self.snapshot_dir, name)
+
+    def export_tenant(self, collection_name: str, path: Optional[str] = None) -> Dict:
+        """Write a tenant's points to a snapshot file and return its manifest"""
+        params = self.vector_client.collection_params(collection_name)
+        if params is None:
+            raise ValueError(f"Collection {collection_name} does not exist")
+        vector_size, distance, has_sparse = params
+
+        if path is None:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            path = os.path.join(self.snapshot_dir, f"{collection_name}-{stamp}.zip")
+
+        started = time.perf_counter()
+        vector_blocks: List[np.ndarray] = []
+        tmp_path = f"{path}.tmp"
+        try:
+            with zipfile.ZipFile(tmp_path, "w") as archive:
+                with archive.open("points.jsonl", "w") as raw:
+                    lines = io.TextIOWrapper(raw, encoding="utf-8")
+                    for batch in self.vector_client.iter_points(collection_name):
+                        payloads = self._with_texts([payload for _, _, _, payload in batch])
+                        vector_blocks.append(np.asarray([dense for _, dense, _, _ in batch], dtype=np.float16))
+                        for (point_id, _, sparse, _), payload in zip(batch, payloads):
+                            record = {"id": point_id, "payload": payload}
+                            if sparse:
+                                record["sparse"] = {"i": list(sparse.keys()), "v": list(sparse.values())}
+                            lines.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    lines.flush()
+                    lines.detach()
+
+                vectors = (
+                    np.concatenate(vector_blocks) if vector_blocks
+                    else np.zeros((0, vector_size), dtype=np.float16)
+                )
+                with archive.open("vectors.npy", "w", force_zip64=True) as out:
+                    np.save(out, vectors)
+
+                manifest = {
+                    "format_version": self.FORMAT_VERSION,
+                    "tenant": collection_name,
+                    "vector_size": vector_size,
+                    "distance": distance,
+                    "sparse": has_sparse,
+                    "dtype": "float16",
+                    "count": int(vectors.shape[0]),
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }
+                archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise Exception(f"Error exporting snapshot of {collection_name}: {str(e)}")
+
+        print(f"Exported {manifest['count']} points of {collection_name} to {path} "
+              f"in {time.perf_counter() - started:.1f}s")
+        return {**manifest, "path": path}
+
+    def import_tenant(
+        self,
+        path: str,
+        collection_name: Optional[str] = None,
+        progress_callback: Optional[Callable[[int], None]] = None
+    ) -> Dict:
+        """
+        Replace a tenant's points with a snapshot (blue/green, like a rebuild).
+        collection_name defaults to the tenant the snapshot was taken from;
+        point ids are re-derived for the tenant restored into.
+        """
+        started = time.perf_counter()
+        try:
+            with zipfile.ZipFile(path, "r") as archive:
+                manifest = json.loads(archive.read("manifest.json"))
+                if manifest.get("format_version") != self.FORMAT_VERSION:
+                    raise ValueError(f"Unsupported snapshot format {manifest.get('format_version')}")
+                tenant = collection_name or manifest["tenant"]
+                with archive.open("vectors.npy") as raw:
+                    vectors = np.load(raw)
+
+                with archive.open("points.jsonl") as raw:
+                    lines = io.TextIOWrapper(raw, encoding="utf-8")
+                    self.vector_client.restore_collection(
+                        tenant,
+                        self._batches(tenant, manifest["tenant"], lines, vectors),
+                        vector_size=manifest["vector_size"],
+                        sparse=manifest["sparse"],
+                        distance=manifest["distance"],
+                        progress_callback=progress_callback
+                    )
+        except ValueError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error importing snapshot {path}: {str(e)}")
+
+        if self.hot_tier:
+            self.hot_tier.invalidate(tenant)
+        if self.retrieval_cache:
+            self.retrieval_cache.invalidate(tenant)
+        if self.answer_cache:
+            self.answer_cache.invalidate(tenant)
+
+        print(f"Imported {manifest['count']} points into {tenant} from {path} "
+              f"in {time.perf_counter() - started:.1f}s")
+        return {**manifest, "tenant": tenant, "path": path}
+
+    def _batches(
+        self,
+        tenant: str,
+        source_tenant: str,
+        lines,
+        vectors: np.ndarray
+    ) -> Iterator[Tuple[List, List[List[float]], List[Dict], Optional[List[Dict[int, float]]]]]:
+        """Row-aligned upsert batches; float16 vectors are widened per batch only"""
+        row = 0
+        occurrences: Dict[tuple, int] = {}
+        ids, payloads, sparse_vectors = [], [], []
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            ids.append(self._point_id(tenant, source_tenant, record["id"], record["payload"], occurrences))
+            payloads.append(record["payload"])
+            sparse = record.get("sparse")
+            sparse_vectors.append(dict(zip(sparse["i"], sparse["v"])) if sparse else {})
+
+            if len(ids) == self.IMPORT_BATCH_SIZE:
+                yield self._batch(ids, payloads, sparse_vectors, vectors[row:row + len(ids)])
+                row += len(ids)
+                ids, payloads, sparse_vectors = [], [], []
+        if ids:
+            yield self._batch(ids, payloads, sparse_vectors, vectors[row:row + len(ids)])
+
+    @staticmethod
+    def _point_id(tenant: str, source_tenant: str, point_id, payload: Dict, occurrences: Dict[tuple, int]):
+        """
+        The id the point gets in tenant. Chunk ids embed the tenant, so they
+        are recomputed from the payload the way an index run would; restoring
+        another tenant's snapshot must neither overwrite that tenant's points
+        in a shared collection nor leave ids the next sync does not expect.
+        """
+        if "h" in payload:
+            key = (payload.get("src", ""), payload["h"])
+            occurrences[key] = occurrences.get(key, -1) + 1
+            return chunk_point_id(tenant, key[0], occurrences[key], key[1])
+        if isinstance(point_id, int):
+            # Positional ids are only unique within their old collection
+            return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{tenant}/{point_id}"))
+        if tenant != source_tenant:
+            return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{tenant}\n{point_id}"))
+        return point_id
+
+    def _batch(self, ids, payloads, sparse_vectors, block: np.ndarray):
+        payloads = self._externalize_texts(payloads)
+        return ids, block.astype(np.float32).tolist(), payloads, sparse_vectors
+
+    def _with_texts(self, payloads: List[Dict]) -> List[Dict]:
+        """Inline texts kept outside Qdrant so the snapshot is self-contained"""
+        if self.chunk_text_repository is None:
+            return payloads
+        missing = [payload["h"] for payload in payloads if "t" not in payload and "h" in payload]
+        if not missing:
+            return payloads
+        texts = self.chunk_text_repository.get_many(missing)
+        return [
+            {**payload, "t": texts.get(payload["h"], "")} if "t" not in payload and "h" in payload else payload
+            for payload in payloads
+        ]
+
+    def _externalize_texts(self, payloads: List[Dict]) -> List[Dict]:
+        """Move inlined texts to the text store when this deployment keeps them outside Qdrant"""
+        if self.chunk_text_repository is None:
+            return payloads
+        texts = {payload["h"]: payload["t"] for payload in payloads if "t" in payload and "h" in payload}
+        if texts:
+            self.chunk_text_repository.save_many(texts)
+        return [
+            {key: value for key, value in payload.items() if key != "t"} if "h" in payload else payload
+            for payload in payloads
+        ]
@@ -0,0 +1,238 @@
+"""Token counting and prompt budget allocation"""
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Chat formatting overhead per message and for priming the reply (OpenAI cookbook figures)
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+
+@dataclass
+class PromptBudget:
+    """What fits in the prompt, and how large it ended up"""
+    context: List[str]
+    chat_history: List[Dict[str, str]]
+    prompt_tokens: int
+    budget: int
+    fixed_tokens: int
+    context_tokens: int
+    history_tokens: int
+    dropped_documents: int = 0
+    dropped_turns: int = 0
+    truncated: bool = False
+
+
+class _TenantSizes:
+    """Rolling final prompt sizes and trimming counters for one tenant"""
+
+    def __init__(self, window: int = 512):
+        self.prompt_tokens = deque(maxlen=window)
+        self.requests = 0
+        self.over_budget = 0
+        self.dropped_turns = 0
+        self.dropped_documents = 0
+        self.truncated_tool_results = 0
+
+    def to_dict(self) -> Dict:
+        sizes = np.asarray(self.prompt_tokens) if self.prompt_tokens else np.zeros(1)
+        return {
+            "requests": self.requests,
+            "prompt_tokens_p50": float(np.percentile(sizes, 50)),
+            "prompt_tokens_p95": float(np.percentile(sizes, 95)),
+            "prompt_tokens_max": int(sizes.max()),
+            "over_budget": self.over_budget,
+            "dropped_turns": self.dropped_turns,
+            "dropped_documents": self.dropped_documents,
+            "truncated_tool_results": self.truncated_tool_results,
+        }
+
+
+class TokenBudgetManager:
+    """
+    Counts tokens locally with tiktoken and fits prompts into a budget.
+
+    Fixed parts (system prompt, conversation summary, per-request
+    instructions, question) are
+    always kept. Of what remains, retrieved context may use up to
+    ``context_share`` and history takes the rest, oldest turns dropped
+    first; budget either side leaves unused is handed to the other. Tool
+    results are capped individually. Without tiktoken (or its encoding
+    files) tokens are estimated at four characters each.
+    """
+
+    def __init__(
+        self,
+        default_budget: int = 6000,
+        context_share: float = 0.6,
+        tool_result_tokens: int = 1500,
+        encoding_name: str = "o200k_base"
+    ):
+        self.default_budget = default_budget
+        self.context_share = context_share
+        self.tool_result_tokens = tool_result_tokens
+        self.encoding_name = encoding_name
+        self._encoding = None
+        self._encoding_lock = threading.Lock()
+        self._encoding_failed = False
+        # System prompts repeat for every request of a tenant; count them once
+        self._prefix_counts: "OrderedDict[str, int]" = OrderedDict()
+        self._sizes: Dict[str, _TenantSizes] = {}
+        self._lock = threading.Lock()
+
+    def _get_encoding(self):
+        if self._encoding is None and not self._encoding_failed:
+            with self._encoding_lock:
+                if self._encoding is None and not self._encoding_failed:
+                    try:
+                        import tiktoken
+                        self._encoding = tiktoken.get_encoding(self.encoding_name)
+                    except Exception as e:
+                        print(f"Warning: tiktoken unavailable, estimating token counts: {str(e)}")
+                        self._encoding_failed = True
+        return self._encoding
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        encoding = self._get_encoding()
+        if encoding is None:
+            return (len(text) + 3) // 4
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_message(self, text: str) -> int:
+        return self.count(text) + TOKENS_PER_MESSAGE
+
+    def _count_prefix(self, text: str) -> int:
+        with self._lock:
+            if text in self._prefix_counts:
+                self._prefix_counts.move_to_end(text)
+                return self._prefix_counts[text]
+        tokens = self.count_message(text)
+        with self._lock:
+            self._prefix_counts[text] = tokens
+            while len(self._prefix_counts) > 256:
+                self._prefix_counts.popitem(last=False)
+        return tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens tokens"""
+        if max_tokens <= 0:
+            return ""
+        encoding = self._get_encoding()
+        if encoding is None:
+            return text[:max_tokens * 4]
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+
+    def _fit_context(self, documents: List[str], limit: int) -> Tuple[List[str], int, bool]:
+        """Keep documents in rank order while they fit; the first is truncated if needed"""
+        kept, used, truncated = [], 0, False
+        for document in documents:
+            tokens = self.count(document) + 2  # separator
+            if used + tokens <= limit:
+                kept.append(document)
+                used += tokens
+            elif not kept and limit > 2:
+                kept.append(self.truncate(document, limit - 2))
+                used, truncated = limit, True
+                break
+            else:
+                break
+        return kept, used, truncated
+
+    def _fit_history(self, turns: List[Dict[str, str]], limit: int) -> Tuple[List[Dict[str, str]], int]:
+        """Keep the most recent turns that fit"""
+        kept, used = [], 0
+        for turn in reversed(turns):
+            tokens = sum(self.count_message(turn[role]) for role in ("user", "assistant") if turn.get(role))
+            if used + tokens > limit:
+                break
+            kept.append(turn)
+            used += tokens
+        kept.reverse()
+        return kept, used
+
+    def fit(
+        self,
+        tenant: str,
+        question: str,
+        system_prefix: str = "",
+        documents: Optional[List[str]] = None,
+        chat_history: Optional[List[Dict[str, str]]] = None,
+        volatile: Optional[List[str]] = None,
+        budget: Optional[int] = None,
+        summary: str = ""
+    ) -> PromptBudget:
+        budget = budget or self.default_budget
+        documents = documents or []
+        chat_history = chat_history or []
+
+        volatile_text = "\n\n".join(volatile or [])
+        fixed = (
+            self._count_prefix(system_prefix) if system_prefix else 0
+        ) + self.count_message(question) + TOKENS_PER_REPLY
+        if summary:
+            fixed += self.count_message(summary)
+        if volatile_text or documents:
+            # Volatile parts and context share one trailing system message
+            fixed += self.count_message(volatile_text + "\n\nContext:\n")
+        remaining = max(0, budget - fixed)
+
+        context, context_tokens, truncated = self._fit_context(documents, int(remaining * self.context_share))
+        history, history_tokens = self._fit_history(chat_history, remaining - context_tokens)
+        if len(context) < len(documents) and not truncated:
+            # History did not need its share; give it back to the context
+            context, context_tokens, truncated = self._fit_context(documents, remaining - history_tokens)
+
+        result = PromptBudget(
+            context=context,
+            chat_history=history,
+            prompt_tokens=fixed + context_tokens + history_tokens,
+            budget=budget,
+            fixed_tokens=fixed,
+            context_tokens=context_tokens,
+            history_tokens=history_tokens,
+            dropped_documents=len(documents) - len(context),
+            dropped_turns=len(chat_history) - len(history),
+            truncated=truncated,
+        )
+        self.record(tenant, result)
+        if result.dropped_turns or result.dropped_documents or truncated:
+            print(f"Prompt for {tenant}: {result.prompt_tokens}/{budget} tokens "
+                  f"(dropped {result.dropped_turns} turns, {result.dropped_documents} documents)")
+        return result
+
+    def cap_tool_result(self, tenant: str, content: str) -> str:
+        """Truncate a serialized tool result to the per-result cap"""
+        if self.tool_result_tokens <= 0 or self.count(content) <= self.tool_result_tokens:
+            return content
+        with self._lock:
+            self._sizes.setdefault(tenant, _TenantSizes()).truncated_tool_results += 1
+        return self.truncate(content, self.tool_result_tokens) + " …[truncated]"
+
+    def record(self, tenant: str, result: PromptBudget) -> None:
+        with self._lock:
+            sizes = self._sizes.setdefault(tenant, _TenantSizes())
+            sizes.requests += 1
+            sizes.prompt_tokens.append(result.prompt_tokens)
+            sizes.over_budget += int(result.prompt_tokens > result.budget)
+            sizes.dropped_turns += result.dropped_turns
+            sizes.dropped_documents += result.dropped_documents
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tenants = {tenant: sizes.to_dict() for tenant, sizes in self._sizes.items()}
+        return {
+            "default_budget": self.default_budget,
+            "context_share": self.context_share,
+            "tool_result_tokens": self.tool_result_tokens,
+            "tokenizer": self.encoding_name if self._encoding is not None else "estimate",
+            "tenants": tenants,
+        }
@@ -1,55 +1,278 @@
 """Vector store service using Qdrant"""
-from typing import List, Dict
+import asyncio
+from typing import Callable, List, Dict, Optional
 from langchain.schema import Document
 from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.clients.async_vector_store_client import AsyncVectorStoreClient
+from src.infrastructure.services.EmbeddingCache import EmbeddingCacheService
+from src.infrastructure.services.SparseEncoder import BM25SparseEncoder
+from src.infrastructure.services.HotVectorTier import HotVectorTier
+from src.infrastructure.services.RetrievalCache import RetrievalCache
+from src.infrastructure.services.ContextSelector import ContextSelector
+from src.infrastructure.utils.payload_schema import encode_payload
+from src.infrastructure.utils.point_ids import chunk_point_id
+from src.domain.abstractions.repositories.chunk_text_repository import IChunkTextRepository
+from src.domain.entities.vector_search_result import VectorSearchResult
 
 
 class VectorStoreService:
     """Service for managing vector stores with Qdrant"""
 
-    def __init__(self, embeddings, vector_client: VectorStoreClient):
+    def __init__(
+        self,
+        embeddings,
+        vector_client: VectorStoreClient,
+        embedding_cache: Optional[EmbeddingCacheService] = None,
+        sparse_encoder: Optional[BM25SparseEncoder] = None,
+        async_vector_client: Optional[AsyncVectorStoreClient] = None,
+        hot_tier: Optional[HotVectorTier] = None,
+        chunk_text_repository: Optional[IChunkTextRepository] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        context_selector: Optional[ContextSelector] = None
+    ):
         self.embeddings = embeddings
         self.vector_client = vector_client
+        self.async_vector_client = async_vector_client
+        self.embedding_cache = embedding_cache
+        self.sparse_encoder = sparse_encoder
+        self.hot_tier = hot_tier if hot_tier and hot_tier.enabled else None
+        # When set, chunk texts live in this repository and payloads carry only their hash
+        self.chunk_text_repository = chunk_text_repository
+        self.retrieval_cache = retrieval_cache if retrieval_cache and retrieval_cache.enabled else None
+        self.context_selector = context_selector
+        self.model_name = getattr(embeddings, "model_name", "default")
 
-    def create_store(self, documents: List[Document], collection_name: str) -> str:
-        """Create and populate a new vector store collection"""
+    def create_store(
+        self,
+        documents: List[Document],
+        collection_name: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        incremental: bool = True
+    ) -> str:
+        """
+        Create or refresh a collection from chunked documents.
+
+        Point IDs are derived from content (see chunk_point_id). When the tenant
+        already has points and incremental is set, only chunks whose ID is new
+        are embedded and upserted and vanished IDs are deleted; otherwise (or
+        if the sync fails) the collection is rebuilt blue/green.
+        """
         # Extract texts and metadata from documents
         texts = [doc.page_content for doc in documents]
-        metadatas = [doc.metadata for doc in documents]
+        if not texts:
+            # An empty crawl must not wipe a tenant that is already serving
+            print(f"Warning: no chunks to index for {collection_name}; keeping existing points")
+            return collection_name
+
+        # Compact payload: text stored once (or outside Qdrant) plus short-keyed source metadata
+        store_text = self.chunk_text_repository is None
+        metadatas = [
+            encode_payload(text, doc.metadata, store_text=store_text)
+            for text, doc in zip(texts, documents)
+        ]
 
-        embeddings_list = self.embeddings.embed_documents(texts)
+        occurrences: Dict[tuple, int] = {}
+        ids = []
+        for meta, doc in zip(metadatas, documents):
+            key = (doc.metadata.get("source", ""), meta["h"])
+            occurrences[key] = occurrences.get(key, -1) + 1
+            ids.append(chunk_point_id(collection_name, key[0], occurrences[key], meta["h"]))
 
-        # Enrich metadata with text content
-        for i, meta in enumerate(metadatas):
-            meta["text"] = texts[i]
-            meta["original_text"] = texts[i]
+        if incremental:
+            existing = self.vector_client.point_ids(collection_name)
+            if existing:
+                try:
+                    self._sync_store(collection_name, ids, texts, metadatas, existing, progress_callback)
+                    self._invalidate(collection_name)
+                    return collection_name
+                except Exception as e:
+                    print(f"Warning: incremental sync of {collection_name} failed, rebuilding: {str(e)}")
 
-        # Upload to Qdrant
-        self.vector_client.upload(
+        embeddings_list, sparse_vectors = self._embed(texts)
+        if not store_text:
+            self.chunk_text_repository.save_many({meta["h"]: text for meta, text in zip(metadatas, texts)})
+
+        # Build a new version and switch queries over once it is complete
+        self.vector_client.rebuild_collection(
             collection_name=collection_name,
             embeddings=embeddings_list,
             metadatas=metadatas,
-            vector_size=len(embeddings_list[0]) if embeddings_list else 1536
+            ids=ids,
+            vector_size=len(embeddings_list[0]) if embeddings_list else 1536,
+            sparse_vectors=sparse_vectors,
+            progress_callback=progress_callback
         )
 
+        self._invalidate(collection_name)
+
         return collection_name
 
+    def _embed(self, texts: List[str]):
+        """Dense embeddings (through the cache when configured) and BM25 sparse vectors"""
+        # Only run the model on chunks whose text was not embedded before
+        if self.embedding_cache:
+            embeddings_list = self.embedding_cache.embed_documents(self.embeddings, texts, self.model_name)
+        else:
+            embeddings_list = self.embeddings.embed_documents(texts)
+
+        sparse_vectors = self.sparse_encoder.encode_documents(texts) if self.sparse_encoder else None
+        return embeddings_list, sparse_vectors
+
+    def _sync_store(
+        self,
+        collection_name: str,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict],
+        existing: set,
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> None:
+        """
+        Embed and upsert only chunks with new IDs, delete IDs that vanished.
+        existing holds Qdrant's native ids: content-derived UUID strings, or
+        integers in collections built before them, which never match and are
+        all deleted as stale.
+        """
+        changed = [i for i, point_id in enumerate(ids) if point_id not in existing]
+        stale_ids = list(existing - set(ids))
+        changed_texts = [texts[i] for i in changed]
+        embeddings_list, sparse_vectors = self._embed(changed_texts) if changed else ([], None)
+        if self.chunk_text_repository is not None and changed:
+            self.chunk_text_repository.save_many({metadatas[i]["h"]: texts[i] for i in changed})
+
+        self.vector_client.sync_collection(
+            collection_name=collection_name,
+            ids=[ids[i] for i in changed],
+            embeddings=embeddings_list,
+            metadatas=[metadatas[i] for i in changed],
+            stale_ids=stale_ids,
+            sparse_vectors=sparse_vectors,
+            progress_callback=progress_callback
+        )
+        print(f"Synced {collection_name}: {len(changed)} upserted, {len(stale_ids)} deleted, "
+              f"{len(ids) - len(changed)} unchanged")
+
+    def _invalidate(self, collection_name: str) -> None:
+        """Drop in-process and cached state for a collection whose points changed"""
+        if self.hot_tier:
+            self.hot_tier.invalidate(collection_name)
+        if self.retrieval_cache:
+            self.retrieval_cache.invalidate(collection_name)
+
+    def _resolve_texts(self, results: List[VectorSearchResult]) -> List[VectorSearchResult]:
+        """Fill in texts that are kept outside Qdrant"""
+        if self.chunk_text_repository is None:
+            return results
+        missing = [r.metadata.get("text_hash") for r in results if not r.text and r.metadata]
+        missing = [text_hash for text_hash in missing if text_hash]
+        if not missing:
+            return results
+        texts = self.chunk_text_repository.get_many(missing)
+        for result in results:
+            if not result.text and result.metadata:
+                result.text = texts.get(result.metadata.get("text_hash"), "")
+        return results
+
     def search(self, query: str, collection_name: str, k: int = 3) -> List[Dict]:
         """Search for similar documents in a collection"""
+        if self.retrieval_cache is None:
+            return self._search(query, collection_name, k)
+
+        cache_key = self.retrieval_cache.key(collection_name, query, k)
+        results = self.retrieval_cache.get(cache_key)
+        if results is None:
+            results = self._search(query, collection_name, k)
+            self.retrieval_cache.put(cache_key, results)
+        return results
+
+    def _search(self, query: str, collection_name: str, k: int) -> List[Dict]:
         # Generate query embedding
         query_embedding = self.embeddings.embed_query(query)
-        
-        # Search in Qdrant
-        results = self.vector_client.search_chunks(
-            collection_name=collection_name,
-            query_embedding=query_embedding,
-            limit=k
-        )
-        
+        query_sparse = self.sparse_encoder.encode_query(query) if self.sparse_encoder else None
+        # Over-fetch with vectors so the selector can threshold and diversify
+        limit = self.context_selector.candidates(k) if self.context_selector else k
+        with_vectors = self.context_selector is not None
+
+        results = None
+        if self.hot_tier:
+            hot_collection = self.hot_tier.load(collection_name, self.vector_client.fetch_points)
+            if hot_collection is not None:
+                results = hot_collection.search(query_embedding, limit, query_sparse, with_vectors=with_vectors)
+
+        if results is None:
+            # Search in Qdrant (hybrid dense + BM25 when the collection supports it)
+            results = self.vector_client.search_chunks(
+                collection_name=collection_name,
+                query_embedding=query_embedding,
+                limit=limit,
+                query_sparse=query_sparse,
+                with_vectors=with_vectors
+            )
+
+        if self.context_selector:
+            results = self.context_selector.select(query_embedding, results, k)
+        return self._resolve_texts(results)
+
+    async def asearch(self, query: str, collection_name: str, k: int = 3) -> List[Dict]:
+        """Search without blocking the event loop on Qdrant I/O"""
+        if self.retrieval_cache is None:
+            return await self._asearch(query, collection_name, k)
+
+        # The in-memory backend never blocks; a shared backend does network I/O
+        if self.retrieval_cache.shared:
+            cache_key = await asyncio.to_thread(self.retrieval_cache.key, collection_name, query, k)
+            results = await asyncio.to_thread(self.retrieval_cache.get, cache_key)
+        else:
+            cache_key = self.retrieval_cache.key(collection_name, query, k)
+            results = self.retrieval_cache.get(cache_key)
+        if results is not None:
+            return results
+
+        results = await self._asearch(query, collection_name, k)
+        if self.retrieval_cache.shared:
+            await asyncio.to_thread(self.retrieval_cache.put, cache_key, results)
+        else:
+            self.retrieval_cache.put(cache_key, results)
+        return results
+
+    async def _asearch(self, query: str, collection_name: str, k: int) -> List[Dict]:
+        if self.async_vector_client is None:
+            return await asyncio.to_thread(self._search, query, collection_name, k)
+
+        # The embedding model is CPU-bound, so only it runs off the loop
+        query_embedding = await asyncio.to_thread(self.embeddings.embed_query, query)
+        query_sparse = self.sparse_encoder.encode_query(query) if self.sparse_encoder else None
+        limit = self.context_selector.candidates(k) if self.context_selector else k
+        with_vectors = self.context_selector is not None
+
+        results = None
+        if self.hot_tier:
+            known, hot_collection = self.hot_tier.lookup(collection_name)
+            if not known:
+                hot_collection = await asyncio.to_thread(
+                    self.hot_tier.load, collection_name, self.vector_client.fetch_points
+                )
+            if hot_collection is not None:
+                results = hot_collection.search(query_embedding, limit, query_sparse, with_vectors=with_vectors)
+
+        if results is None:
+            results = await self.async_vector_client.search_chunks(
+                collection_name=collection_name,
+                query_embedding=query_embedding,
+                limit=limit,
+                query_sparse=query_sparse,
+                with_vectors=with_vectors
+            )
+
+        if self.context_selector:
+            results = self.context_selector.select(query_embedding, results, k)
+        if self.chunk_text_repository is not None:
+            results = await asyncio.to_thread(self._resolve_texts, results)
         return results
 
     def delete_collection(self, collection_name: str):
         """Delete a collection"""
+        self._invalidate(collection_name)
         return self.vector_client.delete_collection(collection_name)
 
     def list_collections(self) -> List[str]:
@@ -1,5 +1,5 @@
 """Website content loading service"""
-from typing import List
+from typing import List, Optional
 from langchain.schema import Document
 from src.infrastructure.clients.crawling_client import CrawlingClient
 from src.infrastructure.clients.llm_client import LLMClient
@@ -8,10 +8,10 @@ from src.infrastructure.clients.llm_client import LLMClient
 class WebsiteLoaderService:
     """Service for scraping and loading website content"""
     
-    def __init__(self, website_url: str):
+    def __init__(self, website_url: str, llm_client: Optional[LLMClient] = None):
         self.website_url = website_url
         self.crawling_client = CrawlingClient(max_depth=2, max_pages=10, include_external=False)
-        self.llm_client = LLMClient()
+        self.llm_client = llm_client or LLMClient()
     
     async def scrape_website(self, url: str) -> List[Document]:
         """Scrape website and return documents with summarized content"""
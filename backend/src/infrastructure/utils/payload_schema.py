@@ -0,0 +1,62 @@
+"""Versioned Qdrant payload layout for document chunks"""
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+
+# v1 (implicit, no "v" key): {"source", "text", "original_text", ...source metadata}
+# v2: {"v": 2, "t": text, "h": text hash, "src": source, "c": chunk index}
+#     "t" is omitted when chunk texts are kept outside Qdrant; "h" resolves it.
+PAYLOAD_VERSION = 2
+
+# Short keys for well-known metadata fields
+_SHORT_KEYS = {"source": "src", "chunk_index": "c"}
+_LONG_KEYS = {short: long for long, short in _SHORT_KEYS.items()}
+_RESERVED = {"v", "t", "h"}
+
+# Fields the search path reads; covers both layouts so mixed collections decode
+SEARCH_PAYLOAD_FIELDS = ["v", "t", "h", "src", "c", "original_text", "source", "chunk_index"]
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def encode_payload(text: str, metadata: Optional[Dict[str, Any]] = None, store_text: bool = True) -> Dict[str, Any]:
+    """Build a v2 payload from a chunk's text and source metadata"""
+    payload: Dict[str, Any] = {"v": PAYLOAD_VERSION, "h": hash_text(text)}
+    if store_text:
+        payload["t"] = text
+    for key, value in (metadata or {}).items():
+        if key in ("text", "original_text") or value is None:
+            continue
+        payload[_SHORT_KEYS.get(key, key)] = value
+    return payload
+
+
+def decode_payload(payload: Dict[str, Any]) -> Tuple[str, Optional[int], Dict[str, Any]]:
+    """
+    Return (text, chunk_index, metadata) for a v1 or v2 payload.
+
+    text is "" when a v2 payload keeps its text outside Qdrant; callers
+    resolve it from metadata["text_hash"].
+    """
+    if payload.get("v", 1) < 2:
+        text = payload.get("original_text") or payload.get("text") or ""
+        metadata = {k: v for k, v in payload.items() if k not in ("text", "original_text")}
+        return text, payload.get("chunk_index"), metadata
+
+    metadata: Dict[str, Any] = {}
+    for key, value in payload.items():
+        if key in _RESERVED:
+            continue
+        metadata[_LONG_KEYS.get(key, key)] = value
+    if "h" in payload:
+        metadata["text_hash"] = payload["h"]
+    return payload.get("t", ""), payload.get("c"), metadata
+
+
+def upgrade_payload(payload: Dict[str, Any], store_text: bool = True) -> Optional[Dict[str, Any]]:
+    """Rewrite a v1 payload as v2; returns None when it is already current"""
+    if payload.get("v", 1) >= PAYLOAD_VERSION:
+        return None
+    text, _, metadata = decode_payload(payload)
+    return encode_payload(text, metadata, store_text=store_text)
@@ -0,0 +1,17 @@
+"""Deterministic, content-derived Qdrant point IDs"""
+import uuid
+
+# Fixed namespace so IDs are identical across processes and deployments
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "chunk-points")
+
+
+def chunk_point_id(tenant: str, source: str, ordinal: int, text_hash: str) -> str:
+    """
+    UUIDv5 of (tenant, page URL, ordinal, content hash).
+
+    The ordinal counts earlier chunks with the same text on the same page, so
+    it only separates exact repeats; inserting or removing other chunks on a
+    page leaves every other ID unchanged. IDs include the tenant and are
+    therefore unique across a shared collection as well.
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{tenant}\n{source}\n{ordinal}\n{text_hash}"))
@@ -67,6 +67,9 @@ async def get_all_clients(
             company_name=client.client_name,
             website_url=client.client_url,
             system_prompt=client.system_prompt,
+            rerank_enabled=client.rerank_enabled,
+            prompt_token_budget=client.prompt_token_budget,
+            model_tier=client.model_tier,
             created_at=client.created_at
         )
         for client in clients
@@ -87,6 +90,9 @@ async def get_client(
             website_url=client.client_url,
             tools=client.tools,
             system_prompt=client.system_prompt,
+            rerank_enabled=client.rerank_enabled,
+            prompt_token_budget=client.prompt_token_budget,
+            model_tier=client.model_tier,
             created_at=client.created_at
         )
     except ValueError as e:
@@ -112,6 +118,9 @@ async def get_client_by_slug(
             website_url=client.client_url,
             tools=client.tools,
             system_prompt=client.system_prompt,
+            rerank_enabled=client.rerank_enabled,
+            prompt_token_budget=client.prompt_token_budget,
+            model_tier=client.model_tier,
             created_at=client.created_at
         )
     except Exception as e:
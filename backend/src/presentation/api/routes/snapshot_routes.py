@@ -0,0 +1,64 @@
+"""Admin API routes for tenant vector snapshots"""
+import os
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from src.container import Container
+from src.application.use_cases.snapshot.export_tenant_snapshot_use_case import ExportTenantSnapshotUseCase
+from src.application.use_cases.snapshot.import_tenant_snapshot_use_case import ImportTenantSnapshotUseCase
+from src.application.dtos.requests.import_snapshot_request import ImportSnapshotRequest
+from src.application.dtos.responses.snapshot_response import SnapshotResponse
+from src.presentation.api.dependencies import get_current_user
+
+
+router = APIRouter(prefix="/admin", tags=["snapshots"])
+
+container = Container()
+
+
+# Plain (non-async) handlers: export and import are long blocking I/O and run in the threadpool
+@router.post("/clients/{client_id}/snapshot", response_model=SnapshotResponse)
+def export_snapshot(
+    client_id: str,
+    use_case: ExportTenantSnapshotUseCase = Depends(lambda: container.export_tenant_snapshot_use_case()),
+    current_user: dict = Depends(get_current_user)
+):
+    """Export a client's vectors and payloads to a snapshot file on the server"""
+    try:
+        return use_case.execute(client_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/clients/{client_id}/snapshot/restore", response_model=SnapshotResponse)
+def import_snapshot(
+    client_id: str,
+    request: ImportSnapshotRequest,
+    use_case: ImportTenantSnapshotUseCase = Depends(lambda: container.import_tenant_snapshot_use_case()),
+    current_user: dict = Depends(get_current_user)
+):
+    """Replace a client's index with a snapshot file from the server's snapshot directory"""
+    try:
+        return use_case.execute(client_id, request)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/snapshots/{filename}")
+def download_snapshot(
+    filename: str,
+    current_user: dict = Depends(get_current_user)
+):
+    """Download a snapshot file"""
+    try:
+        path = container.tenant_snapshot_service().snapshot_path(filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"Snapshot {filename} not found")
+    return FileResponse(path, media_type="application/zip", filename=filename)
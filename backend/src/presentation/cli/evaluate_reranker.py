@@ -0,0 +1,89 @@
+"""Measure what cross-encoder re-ranking costs and changes for one tenant.
+
+Usage:
+    python -m src.presentation.cli.evaluate_reranker --collection ACME --questions questions.jsonl [--k 3]
+
+The questions file holds one JSON object per line: {"question": "...",
+"source": "https://..."}; "source" is optional and, when present, is the page
+expected to answer the question (used for hit@k). Plain-text lines are read
+as questions without an expected source.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.container import Container
+
+
+def load_questions(path: str):
+    questions = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                item = {"question": line}
+            questions.append((item["question"], item.get("source")))
+    return questions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare dense and re-ranked retrieval for a tenant")
+    parser.add_argument("--collection", required=True, help="Tenant collection (company name)")
+    parser.add_argument("--questions", required=True, help="JSONL or plain-text file of questions")
+    parser.add_argument("--k", type=int, default=3, help="Chunks placed in the prompt")
+    args = parser.parse_args()
+
+    container = Container()
+    vector_store = container.rag_service().vector_store_service
+    reranker = container.reranker()
+
+    search_ms, rerank_ms = [], []
+    dense_quality, reranked_quality, overlaps = [], [], []
+    dense_hits, reranked_hits, labelled = 0, 0, 0
+
+    for question, source in load_questions(args.questions):
+        started = time.perf_counter()
+        candidates = vector_store.search(question, args.collection, k=reranker.candidates)
+        search_ms.append((time.perf_counter() - started) * 1000.0)
+
+        dense, reranked, elapsed_ms = reranker.compare(question, candidates, args.k)
+        rerank_ms.append(elapsed_ms)
+        if not dense:
+            continue
+
+        # Mean cross-encoder relevance of the context each ordering would send
+        dense_quality.append(np.mean([result.score for result in dense]))
+        reranked_quality.append(np.mean([result.score for result in reranked]))
+        dense_keys = {(result.metadata or {}).get("text_hash") or result.text for result in dense}
+        overlaps.append(sum(
+            ((result.metadata or {}).get("text_hash") or result.text) in dense_keys for result in reranked
+        ) / len(dense))
+
+        if source:
+            labelled += 1
+            dense_hits += any((result.metadata or {}).get("source") == source for result in dense)
+            reranked_hits += any((result.metadata or {}).get("source") == source for result in reranked)
+
+    if not search_ms:
+        print("No questions to evaluate")
+        return
+
+    print(f"Questions: {len(search_ms)} (labelled: {labelled}), k={args.k}, candidates={reranker.candidates}")
+    print(f"Search latency ms      p50={np.percentile(search_ms, 50):.1f} p95={np.percentile(search_ms, 95):.1f}")
+    print(f"Re-rank latency ms     p50={np.percentile(rerank_ms, 50):.1f} p95={np.percentile(rerank_ms, 95):.1f} "
+          f"(budget {reranker.latency_budget_ms:.0f})")
+    if overlaps:
+        print(f"Top-{args.k} overlap       {np.mean(overlaps):.2f}")
+        print(f"Context relevance      dense={np.mean(dense_quality):.3f} reranked={np.mean(reranked_quality):.3f}")
+    if labelled:
+        print(f"Hit@{args.k}                  dense={dense_hits / labelled:.2f} reranked={reranked_hits / labelled:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Delete superseded and abandoned versioned collections.
+
+Usage:
+    python -m src.presentation.cli.gc_collection_versions [--collections A B]
+
+Rebuilds already collect their own tenant's old versions; run this to clean
+up after crashed builds or after lowering QDRANT_KEEP_COLLECTION_VERSIONS.
+"""
+import argparse
+
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Garbage-collect old collection versions")
+    parser.add_argument(
+        "--collections",
+        nargs="*",
+        help="Tenants to clean up (default: all)"
+    )
+    args = parser.parse_args()
+
+    client = VectorStoreClient()
+    deleted = []
+    for collection_name in args.collections or [None]:
+        deleted.extend(client.gc_collection_versions(collection_name))
+
+    for physical_name in deleted:
+        print(f"Deleted {physical_name}")
+    print(f"{len(deleted)} collection versions deleted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Rewrite Qdrant payloads in place to the current compact layout.
+
+Usage:
+    python -m src.presentation.cli.migrate_payload_schema [--collections A B] [--external-text]
+
+With --external-text, chunk texts are moved to the chunk_texts table and
+dropped from the payloads; run it with PAYLOAD_EXTERNAL_TEXT=true deployed.
+"""
+import argparse
+
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.database.config import SessionLocal
+from src.infrastructure.database.repositories.chunk_text_repository import ChunkTextRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate Qdrant payloads to the compact layout")
+    parser.add_argument(
+        "--collections",
+        nargs="*",
+        help="Physical collections to rewrite (default: all)"
+    )
+    parser.add_argument(
+        "--external-text",
+        action="store_true",
+        help="Move chunk texts to the chunk_texts table instead of keeping them in the payload"
+    )
+    args = parser.parse_args()
+
+    client = VectorStoreClient()
+    store_texts = ChunkTextRepository(SessionLocal).save_many if args.external_text else None
+
+    def report_progress(collection_name: str, rewritten: int) -> None:
+        print(f"{collection_name}: rewrote {rewritten} payloads")
+
+    try:
+        rewritten = client.migrate_payload_schema(
+            collection_names=args.collections or None,
+            store_texts=store_texts,
+            progress_callback=report_progress
+        )
+    finally:
+        SessionLocal.remove()
+
+    for collection_name, count in rewritten.items():
+        print(f"Migrated {collection_name} ({count} payloads rewritten)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Move per-tenant Qdrant collections into the shared multi-tenant collection.
+
+Usage:
+    python -m src.presentation.cli.migrate_shared_collection [--collections A B] [--delete-source]
+
+Run it before switching VECTOR_STORE_MODE to "shared".
+"""
+import argparse
+
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate per-tenant collections into the shared collection")
+    parser.add_argument(
+        "--collections",
+        nargs="*",
+        help="Collections to migrate (default: every collection except the shared one)"
+    )
+    parser.add_argument(
+        "--delete-source",
+        action="store_true",
+        help="Delete each source collection after it has been copied"
+    )
+    args = parser.parse_args()
+
+    client = VectorStoreClient()
+
+    def report_progress(collection_name: str, copied: int) -> None:
+        print(f"{collection_name}: copied {copied} points")
+
+    copied = client.migrate_to_shared(
+        collection_names=args.collections or None,
+        delete_source=args.delete_source,
+        progress_callback=report_progress
+    )
+
+    for collection_name, count in copied.items():
+        print(f"Migrated {collection_name} -> {client.shared_collection_name} ({count} points)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Export or import a tenant's vectors and payloads without re-crawling.
+
+Usage:
+    python -m src.presentation.cli.tenant_snapshot export --collection ACME [--output acme.zip]
+    python -m src.presentation.cli.tenant_snapshot import --input acme.zip [--collection ACME]
+
+Importing replaces the tenant's points blue/green, like a rebuild. Running
+API workers pick the change up once their hot-tier and retrieval-cache
+entries expire.
+"""
+import argparse
+
+from src.configs.config import load_settings
+from src.infrastructure.clients.vector_store_client import VectorStoreClient
+from src.infrastructure.database.config import SessionLocal
+from src.infrastructure.database.repositories.chunk_text_repository import ChunkTextRepository
+from src.infrastructure.services.TenantSnapshot import TenantSnapshotService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export or import tenant vector snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Write a tenant's points to a snapshot file")
+    export_parser.add_argument("--collection", required=True, help="Tenant collection (company name)")
+    export_parser.add_argument("--output", help="Snapshot path (default: SNAPSHOT_DIR/<tenant>-<time>.zip)")
+
+    import_parser = subparsers.add_parser("import", help="Replace a tenant's points with a snapshot")
+    import_parser.add_argument("--input", required=True, help="Snapshot path")
+    import_parser.add_argument("--collection", help="Target tenant (default: the tenant in the snapshot)")
+    args = parser.parse_args()
+
+    settings = load_settings()
+    service = TenantSnapshotService(
+        VectorStoreClient(),
+        snapshot_dir=settings.snapshot_dir,
+        chunk_text_repository=ChunkTextRepository(SessionLocal) if settings.payload_external_text else None
+    )
+
+    try:
+        if args.command == "export":
+            manifest = service.export_tenant(args.collection, path=args.output)
+            print(f"Wrote {manifest['path']} ({manifest['count']} points, dim {manifest['vector_size']})")
+        else:
+            def report_progress(restored: int) -> None:
+                print(f"Restored {restored} points")
+
+            manifest = service.import_tenant(args.input, collection_name=args.collection, progress_callback=report_progress)
+            print(f"Imported {manifest['count']} points into {manifest['tenant']}")
+    finally:
+        SessionLocal.remove()
+
+
+if __name__ == "__main__":
+    main()
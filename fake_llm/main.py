@@ -0,0 +1,371 @@
+"""
+OpenAI-compatible stand-in for load testing.
+
+Serves /v1/chat/completions (streaming and not, with tool calls) and
+/v1/embeddings with configurable latency, throughput and error rate, so the
+backend can be benchmarked on one machine without real OpenAI calls. Point
+the backend at it with OPENAI_BASE_URL=http://localhost:8002/v1.
+
+Answers are deterministic for a given seed and last user message. Tool calls
+follow a script (FAKE_LLM_TOOL_SCRIPT, a JSON file) such as:
+
+    [
+      {"tool_calls": [{"name": "get_availability", "arguments": {"date": "2026-10-20"}}]},
+      {"content": "You're booked for 3pm tomorrow."}
+    ]
+
+Step N is played on the Nth model call after the latest user message, so a
+script of one tool call followed by content reproduces one agentic turn.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+load_dotenv()
+
+app = FastAPI(title="Fake LLM API")
+
+
+class FakeConfig(BaseModel):
+    ttft_ms: float = float(os.getenv("FAKE_LLM_TTFT_MS", "300"))
+    ttft_jitter_ms: float = float(os.getenv("FAKE_LLM_TTFT_JITTER_MS", "0"))
+    tokens_per_second: float = float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "80"))
+    response_tokens: int = int(os.getenv("FAKE_LLM_RESPONSE_TOKENS", "60"))
+    error_rate: float = float(os.getenv("FAKE_LLM_ERROR_RATE", "0"))
+    error_status: int = int(os.getenv("FAKE_LLM_ERROR_STATUS", "429"))
+    embedding_dim: int = int(os.getenv("FAKE_LLM_EMBEDDING_DIM", "1536"))
+    embedding_latency_ms: float = float(os.getenv("FAKE_LLM_EMBEDDING_LATENCY_MS", "20"))
+    seed: int = int(os.getenv("FAKE_LLM_SEED", "0"))
+    tool_script: List[Dict[str, Any]] = []
+
+
+def _load_tool_script(path: Optional[str]) -> List[Dict[str, Any]]:
+    if not path:
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+config = FakeConfig(tool_script=_load_tool_script(os.getenv("FAKE_LLM_TOOL_SCRIPT")))
+rng = random.Random(config.seed)
+
+WORDS = (
+    "the service our team can help you with that booking plan account support hours price "
+    "available please note details request option week today contact information review "
+    "schedule policy update include customers standard premium easy quick"
+).split()
+
+
+class Stats:
+    def __init__(self):
+        self.requests = 0
+        self.streamed = 0
+        self.tool_call_responses = 0
+        self.errors = 0
+        self.embeddings = 0
+        self.completion_tokens = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def enter(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self) -> None:
+        self.in_flight -= 1
+
+
+stats = Stats()
+
+
+def _count_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def _prompt_tokens(messages: List[Dict]) -> int:
+    total = 0
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        total += _count_tokens(content) + 3
+        for call in message.get("tool_calls") or []:
+            total += _count_tokens(json.dumps(call.get("function", {})))
+    return total + 3
+
+
+def _usage(prompt_tokens: int, completion_tokens: int) -> Dict:
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": 0},
+    }
+
+
+def _error_response() -> JSONResponse:
+    stats.errors += 1
+    return JSONResponse(
+        status_code=config.error_status,
+        content={"error": {
+            "message": "Simulated error from fake LLM",
+            "type": "rate_limit_error" if config.error_status == 429 else "server_error",
+            "code": None,
+        }}
+    )
+
+
+def _script_step(body: Dict) -> Optional[Dict]:
+    """The scripted step for this call, or None to answer with generated text"""
+    if not body.get("tools") or body.get("tool_choice") == "none" or not config.tool_script:
+        return None
+    step = 0
+    for message in reversed(body.get("messages", [])):
+        if message.get("role") == "user":
+            break
+        if message.get("role") == "assistant":
+            step += 1
+    return config.tool_script[step] if step < len(config.tool_script) else None
+
+
+def _answer_tokens(body: Dict, step: Optional[Dict]) -> List[str]:
+    if step and step.get("content"):
+        return re.findall(r"\S+\s*", step["content"])
+    question = ""
+    for message in reversed(body.get("messages", [])):
+        if message.get("role") == "user":
+            question = message.get("content") or ""
+            break
+    digest = hashlib.sha256(f"{config.seed}:{question}".encode("utf-8")).digest()
+    words = random.Random(digest).choices(WORDS, k=max(1, config.response_tokens))
+    words[0] = words[0].capitalize()
+    return [f"{word} " for word in words[:-1]] + [f"{words[-1]}."]
+
+
+def _tool_calls(step: Dict) -> List[Dict]:
+    return [
+        {
+            "id": f"call_{uuid.uuid4().hex[:24]}",
+            "type": "function",
+            "function": {"name": call["name"], "arguments": json.dumps(call.get("arguments", {}))},
+        }
+        for call in step["tool_calls"]
+    ]
+
+
+async def _wait_first_token() -> None:
+    delay = config.ttft_ms + (rng.uniform(-1, 1) * config.ttft_jitter_ms if config.ttft_jitter_ms else 0)
+    await asyncio.sleep(max(0.0, delay) / 1000)
+
+
+def _token_delay() -> float:
+    return 1 / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+
+
+@app.get("/")
+async def root():
+    return {"status": "ok", "service": "fake_llm"}
+
+
+@app.get("/health")
+async def health():
+    return {"status": "healthy"}
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {"object": "list", "data": [{"id": "fake", "object": "model", "owned_by": "fake_llm"}]}
+
+
+@app.get("/admin/config")
+async def get_config():
+    return config
+
+
+@app.put("/admin/config")
+async def update_config(update: Dict[str, Any]):
+    """Change latency, error rate or the tool script between benchmark runs"""
+    global config, rng
+    try:
+        config = FakeConfig(**{**config.model_dump(), **update})
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    rng = random.Random(config.seed)
+    return config
+
+
+@app.get("/admin/stats")
+async def get_stats():
+    return vars(stats)
+
+
+@app.post("/admin/reset")
+async def reset_stats():
+    global stats
+    stats = Stats()
+    return vars(stats)
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    stats.requests += 1
+    if config.error_rate and rng.random() < config.error_rate:
+        return _error_response()
+
+    step = _script_step(body)
+    prompt_tokens = _prompt_tokens(body.get("messages", []))
+    completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+    model = body.get("model", "fake")
+    if step and step.get("tool_calls"):
+        stats.tool_call_responses += 1
+
+    if body.get("stream"):
+        stats.streamed += 1
+        include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+        return StreamingResponse(
+            _stream(completion_id, model, body, step, prompt_tokens, include_usage),
+            media_type="text/event-stream"
+        )
+
+    stats.enter()
+    try:
+        await _wait_first_token()
+        if step and step.get("tool_calls"):
+            tool_calls = _tool_calls(step)
+            completion_tokens = sum(_count_tokens(call["function"]["arguments"]) for call in tool_calls)
+            message = {"role": "assistant", "content": None, "tool_calls": tool_calls}
+            finish_reason = "tool_calls"
+        else:
+            tokens = _answer_tokens(body, step)
+            completion_tokens = len(tokens)
+            await asyncio.sleep(completion_tokens * _token_delay())
+            message = {"role": "assistant", "content": "".join(tokens)}
+            finish_reason = "stop"
+        stats.completion_tokens += completion_tokens
+    finally:
+        stats.leave()
+
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+        "usage": _usage(prompt_tokens, completion_tokens),
+    }
+
+
+async def _stream(
+    completion_id: str,
+    model: str,
+    body: Dict,
+    step: Optional[Dict],
+    prompt_tokens: int,
+    include_usage: bool
+):
+    created = int(time.time())
+
+    def event(delta: Dict, finish_reason: Optional[str] = None) -> str:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(chunk)}\n\n"
+
+    stats.enter()
+    try:
+        await _wait_first_token()
+        yield event({"role": "assistant", "content": ""})
+        completion_tokens = 0
+        if step and step.get("tool_calls"):
+            for index, call in enumerate(_tool_calls(step)):
+                yield event({"tool_calls": [{
+                    "index": index,
+                    "id": call["id"],
+                    "type": "function",
+                    "function": {"name": call["function"]["name"], "arguments": ""},
+                }]})
+                arguments = call["function"]["arguments"]
+                for start in range(0, len(arguments), 8):
+                    await asyncio.sleep(_token_delay())
+                    yield event({"tool_calls": [{"index": index, "function": {"arguments": arguments[start:start + 8]}}]})
+                    completion_tokens += 1
+            finish_reason = "tool_calls"
+        else:
+            for token in _answer_tokens(body, step):
+                yield event({"content": token})
+                completion_tokens += 1
+                await asyncio.sleep(_token_delay())
+            finish_reason = "stop"
+        yield event({}, finish_reason)
+        stats.completion_tokens += completion_tokens
+
+        if include_usage:
+            usage_chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [],
+                "usage": _usage(prompt_tokens, completion_tokens),
+            }
+            yield f"data: {json.dumps(usage_chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+    finally:
+        stats.leave()
+
+
+def _embedding(text: str, dim: int) -> List[float]:
+    values = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    vector = [values.gauss(0, 1) for _ in range(dim)]
+    norm = sum(v * v for v in vector) ** 0.5 or 1.0
+    return [v / norm for v in vector]
+
+
+@app.post("/v1/embeddings")
+async def embeddings(request: Request):
+    body = await request.json()
+    stats.embeddings += 1
+    if config.error_rate and rng.random() < config.error_rate:
+        return _error_response()
+
+    inputs = body.get("input", "")
+    if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+        inputs = [inputs]
+    dim = body.get("dimensions") or config.embedding_dim
+    await asyncio.sleep(config.embedding_latency_ms / 1000)
+
+    data = []
+    for index, item in enumerate(inputs):
+        text = item if isinstance(item, str) else " ".join(str(token) for token in item)
+        vector = _embedding(text, dim)
+        if body.get("encoding_format") == "base64":
+            vector = base64.b64encode(struct.pack(f"<{dim}f", *vector)).decode("ascii")
+        data.append({"object": "embedding", "index": index, "embedding": vector})
+
+    prompt_tokens = sum(
+        _count_tokens(item) if isinstance(item, str) else len(item) for item in inputs
+    )
+    return {
+        "object": "list",
+        "data": data,
+        "model": body.get("model", "fake"),
+        "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+    }